@@ -1215,9 +1215,9 @@ class TestBasicRead(BaseTest):
 
             expected = set(map(make_hashable, expected))
             actual = set(map(make_hashable, actual))
-            missing_expected = set(expected) - set(actual)
+            missing_expected = expected - actual
 
-            extra = set(actual) - set(expected)
+            extra = actual - expected
             msg = f"Expected to have at least as many records than expected for stream {stream_name}."
             detailed_logger.info(msg)
             detailed_logger.info("missing:")
@@ -4,9 +4,13 @@
 
 import copy
 import logging
+import multiprocessing
+import os
 import re
 from collections import defaultdict
-from typing import Any, Dict, List, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
 
 import pendulum
 from jsonschema import Draft7Validator, FormatChecker, FormatError, ValidationError, validators
@@ -26,6 +30,12 @@ timestamp_regex = re.compile((r"^\d{4}-\d?\d-\d?\d"  # date
 strict_integer_type_checker = Draft7Validator.TYPE_CHECKER.redefine("integer", lambda _, value: isinstance(value, int))
 Draft7ValidatorWithStrictInteger = validators.extend(Draft7Validator, type_checker=strict_integer_type_checker)
 
+# Records are only validated in worker processes when there are enough of them to pay for starting the workers.
+PARALLEL_VALIDATION_MIN_RECORDS = 50_000
+PARALLEL_VALIDATION_CHUNK_SIZE = 5_000
+# Each worker holds its own copy of the stream schemas and validators, so the workers are capped on large machines.
+PARALLEL_VALIDATION_MAX_WORKERS = 8
+
 
 class NoAdditionalPropertiesValidator(Draft7Validator):
     def __init__(self, schema, **kwargs):
@@ -63,6 +73,7 @@ class NoAdditionalPropertiesValidator(Draft7Validator):
 
 class CustomFormatChecker(FormatChecker):
     @staticmethod
+    @lru_cache(maxsize=65536)
     def check_datetime(value: str) -> bool:
         valid_format = timestamp_regex.match(value)
         try:
@@ -71,7 +82,7 @@ class CustomFormatChecker(FormatChecker):
             valid_time = False
         else:
             valid_time = True
-        return valid_format and valid_time
+        return bool(valid_format and valid_time)
 
     def check(self, instance, format):
         if instance is not None and format == "date-time":
@@ -81,29 +92,73 @@ class CustomFormatChecker(FormatChecker):
             return super().check(instance, format)
 
 
+def _build_stream_validators(stream_schemas: Mapping[str, Mapping[str, Any]]) -> Dict[str, Draft7Validator]:
+    # We will be disabling strict `NoAdditionalPropertiesValidator` until we have a better plan for schema validation. The consequence
+    # is that we will lack visibility on new fields that are not added on the root level (root level is validated by Datadog)
+    #   validator = NoAdditionalPropertiesValidator if fail_on_extra_columns else Draft7ValidatorWithStrictInteger
+    validator = Draft7ValidatorWithStrictInteger
+    return {stream_name: validator(schema, format_checker=CustomFormatChecker()) for stream_name, schema in stream_schemas.items()}
+
+
+_worker_stream_validators: Dict[str, Draft7Validator] = {}
+
+
+def _init_validation_worker(stream_schemas: Mapping[str, Mapping[str, Any]]):
+    global _worker_stream_validators
+    _worker_stream_validators = _build_stream_validators(stream_schemas)
+
+
+def _find_invalid_records(records: List[Tuple[str, Any]]) -> List[int]:
+    """Return the positions of the records that do not match their stream schema, in a worker process."""
+    return [position for position, (stream, data) in enumerate(records) if not _worker_stream_validators[stream].is_valid(data)]
+
+
+def _filter_invalid_records(
+    records: List[Tuple[str, Any]],
+    stream_schemas: Mapping[str, Mapping[str, Any]],
+    stream_validators: Mapping[str, Draft7Validator],
+) -> Iterable[Tuple[str, Any]]:
+    """Yield the records that do not match their stream schema, in their original order.
+
+    Large record lists are split into chunks that are validated by a pool of worker processes.
+    """
+    # the CPUs the test process may run on, which are fewer than the machine's ones in a container restricted to a CPU set
+    workers = min(len(os.sched_getaffinity(0)), PARALLEL_VALIDATION_MAX_WORKERS)
+    if workers == 1 or len(records) < PARALLEL_VALIDATION_MIN_RECORDS:
+        yield from ((stream, data) for stream, data in records if not stream_validators[stream].is_valid(data))
+        return
+
+    chunks = [records[i : i + PARALLEL_VALIDATION_CHUNK_SIZE] for i in range(0, len(records), PARALLEL_VALIDATION_CHUNK_SIZE)]
+    # the workers are spawned, forking the test process could copy locks held by its other threads into them
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_validation_worker,
+        initargs=(stream_schemas,),
+    ) as executor:
+        for chunk, invalid_positions in zip(chunks, executor.map(_find_invalid_records, chunks)):
+            yield from (chunk[position] for position in invalid_positions)
+
+
 def verify_records_schema(
     records: List[AirbyteRecordMessage], catalog: ConfiguredAirbyteCatalog
 ) -> Mapping[str, Mapping[str, ValidationError]]:
     """Check records against their schemas from the catalog, yield error messages.
     Only first record with error will be yielded for each stream.
     """
-    stream_validators = {}
-    for stream in catalog.streams:
-        schema_to_validate_against = stream.stream.json_schema
-        # We will be disabling strict `NoAdditionalPropertiesValidator` until we have a better plan for schema validation. The consequence
-        # is that we will lack visibility on new fields that are not added on the root level (root level is validated by Datadog)
-        #   validator = NoAdditionalPropertiesValidator if fail_on_extra_columns else Draft7ValidatorWithStrictInteger
-        validator = Draft7ValidatorWithStrictInteger
-        stream_validators[stream.stream.name] = validator(schema_to_validate_against, format_checker=CustomFormatChecker())
-    stream_errors = defaultdict(dict)
+    stream_schemas = {stream.stream.name: stream.stream.json_schema for stream in catalog.streams}
+    stream_validators = _build_stream_validators(stream_schemas)
+    records_to_validate = []
     for record in records:
-        validator = stream_validators.get(record.stream)
-        if not validator:
+        if record.stream not in stream_validators:
             logging.error(f"Received record from the `{record.stream}` stream, which is not in the catalog.")
             continue
+        records_to_validate.append((record.stream, record.data))
 
-        errors = list(validator.iter_errors(record.data))
-        for error in errors:
-            stream_errors[record.stream][str(error.schema_path)] = error
+    # Valid records are only checked for validity, the errors are collected for the invalid ones
+    stream_errors = defaultdict(dict)
+    for stream, data in _filter_invalid_records(records_to_validate, stream_schemas, stream_validators):
+        for error in stream_validators[stream].iter_errors(data):
+            stream_errors[stream][str(error.schema_path)] = error
 
     return stream_errors
@@ -63,7 +63,12 @@ class HashMixin:
         return hash(obj)
 
     def __hash__(self):
-        return HashMixin.get_hash(self)
+        # Hashable objects are not modified once they are made, so the recursive hash is only computed once
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = HashMixin.get_hash(self)
+            return self._hash
 
     def __lt__(self, other):
         return hash(self) < hash(other)
@@ -120,3 +120,26 @@ def test_validate_records_format(record, configured_catalog, valid):
         assert not streams_with_errors
     else:
         assert streams_with_errors, f"Record {record} should produce errors against {configured_catalog.streams[0].stream.json_schema}"
+
+
+def test_verify_records_schema_in_worker_processes(mocker, configured_catalog: ConfiguredAirbyteCatalog):
+    records = [
+        {"text_or_null": None, "number_or_null": None, "text": "text", "number": 77},
+        {"text_or_null": 123, "number_or_null": 10.3, "text": "text", "number": "text"},
+        {"text_or_null": "test", "number_or_null": None, "text": None, "number": None},
+        {"text_or_null": None, "number_or_null": None, "text": "text", "number": 10.3, "integer_or_null": 1.0},
+    ] * 10
+    records = [AirbyteRecordMessage(stream="my_stream", data=record, emitted_at=0) for record in records]
+    expected_errors = {
+        stream: {schema_path: str(error) for schema_path, error in errors.items()}
+        for stream, errors in verify_records_schema(records, configured_catalog).items()
+    }
+
+    mocker.patch("connector_acceptance_test.utils.asserts.PARALLEL_VALIDATION_MIN_RECORDS", 1)
+    mocker.patch("connector_acceptance_test.utils.asserts.PARALLEL_VALIDATION_CHUNK_SIZE", 3)
+    mocker.patch("connector_acceptance_test.utils.asserts.os.sched_getaffinity", return_value={0, 1})
+    streams_with_errors = verify_records_schema(records, configured_catalog)
+
+    assert {
+        stream: {schema_path: str(error) for schema_path, error in errors.items()} for stream, errors in streams_with_errors.items()
+    } == expected_errors
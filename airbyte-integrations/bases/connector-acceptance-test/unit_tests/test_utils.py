@@ -16,7 +16,7 @@ import pytest
 import yaml
 from connector_acceptance_test.config import EmptyStreamConfiguration
 from connector_acceptance_test.utils import common
-from connector_acceptance_test.utils.compare import make_hashable
+from connector_acceptance_test.utils.compare import HashMixin, make_hashable
 
 from airbyte_protocol.models import AirbyteStream, ConfiguredAirbyteCatalog, ConfiguredAirbyteStream, DestinationSyncMode, SyncMode
 
@@ -165,6 +165,15 @@ def test_compare_two_records_nested_with_different_orders(obj1, obj2, is_same):
         assert output_diff, f"{obj1} shouldnt be equal to {obj2}"
 
 
+def test_make_hashable_computes_hash_once(mocker):
+    get_hash = mocker.spy(HashMixin, "get_hash")
+    record = make_hashable({"a": 1, "b": [{"c": 2}, {"d": 3}]})
+
+    assert {record} == {make_hashable({"b": [{"d": 3}, {"c": 2}], "a": 1})}
+    assert sorted([record, record]) == [record, record]
+    assert sum(call.args[0] is record for call in get_hash.call_args_list) == 1
+
+
 class MockContainer:
     def __init__(self, status: dict, iter_logs: Iterable):
         self.wait = Mock(return_value=status)
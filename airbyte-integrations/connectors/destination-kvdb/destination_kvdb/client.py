@@ -14,6 +14,8 @@ class KvDbClient:
     def __init__(self, bucket_id: str, secret_key: str = None):
         self.secret_key = secret_key
         self.bucket_id = bucket_id
+        # keep the connections open between batches instead of making a new TLS handshake for every request
+        self.session = requests.Session()
 
     def write(self, key: str, value: Mapping[str, Any]):
         return self.batch_write([(key, value)])
@@ -72,7 +74,7 @@ class KvDbClient:
         url = self._get_base_url() + (endpoint or "")
         headers = {"Accept": "application/json", **self._get_auth_headers()}
 
-        response = requests.request(method=http_method, params=params, url=url, headers=headers, json=json)
+        response = self.session.request(method=http_method, params=params, url=url, headers=headers, json=json)
 
         response.raise_for_status()
         return response
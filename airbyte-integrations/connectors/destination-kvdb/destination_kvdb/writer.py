@@ -2,7 +2,9 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
-from collections import Mapping
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Deque, Mapping
 
 from destination_kvdb.client import KvDbClient
 
@@ -16,13 +18,19 @@ class KvDbWriter:
     This is because unless a data source explicitly designates a primary key, we don't know what to key the record on.
     Since KvDB allows reading records with certain prefixes, we treat it more like a message queue, expecting the reader to
     read messages with a particular prefix e.g: name__ab__123, where 123 is the timestamp they last read data from.
+
+    Full batches are written in the background while the next one is buffered, with at most max_in_flight_batches
+    requests pending at a time. flush waits until every batch sent so far has been written.
     """
 
-    write_buffer = []
     flush_interval = 1000
+    max_in_flight_batches = 4
 
     def __init__(self, client: KvDbClient):
         self.client = client
+        self.write_buffer = []
+        self._in_flight_batches: Deque[Future] = deque()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_in_flight_batches)
 
     def delete_stream_entries(self, stream_name: str):
         """Deletes all the records belonging to the input stream"""
@@ -39,8 +47,18 @@ class KvDbWriter:
         kv_pair = (f"{stream_name}__ab__{written_at}", record)
         self.write_buffer.append(kv_pair)
         if len(self.write_buffer) == self.flush_interval:
-            self.flush()
+            self._send_write_buffer()
 
     def flush(self):
-        self.client.batch_write(self.write_buffer)
-        self.write_buffer.clear()
+        self._send_write_buffer()
+        while self._in_flight_batches:
+            self._in_flight_batches.popleft().result()
+
+    def _send_write_buffer(self):
+        if not self.write_buffer:
+            return
+        if len(self._in_flight_batches) == self.max_in_flight_batches:
+            # batches are acknowledged in the order they were sent, a failed one raises its error here or in flush
+            self._in_flight_batches.popleft().result()
+        self._in_flight_batches.append(self._executor.submit(self.client.batch_write, self.write_buffer))
+        self.write_buffer = []
@@ -2,6 +2,76 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+from destination_kvdb.client import KvDbClient
+from destination_kvdb.writer import KvDbWriter
+
+
+class KvDbStubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with self.server.lock:
+            self.server.written_keys.extend(operation["set"] for operation in body["txn"])
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class KvDbStubServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), KvDbStubHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.written_keys = []
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+@pytest.fixture
+def kvdb_server(mocker):
+    server = KvDbStubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    mocker.patch.object(KvDbClient, "base_url", f"http://127.0.0.1:{server.server_port}")
+    yield server
+    server.shutdown()
+    server.server_close()
+
 
 def test_example_method():
     assert True
+
+
+def test_writer_reuses_connections(kvdb_server):
+    writer = KvDbWriter(KvDbClient(bucket_id="bucket", secret_key="secret"))
+
+    for written_at in range(10_500):
+        writer.queue_write_operation("users", {"id": written_at}, written_at)
+    writer.flush()
+
+    assert sorted(kvdb_server.written_keys) == sorted(f"users__ab__{written_at}" for written_at in range(10_500))
+    assert kvdb_server.connections <= KvDbWriter.max_in_flight_batches
+
+
+def test_writer_flush_raises_failed_batch_error(mocker):
+    client = KvDbClient(bucket_id="bucket", secret_key="secret")
+    mocker.patch.object(client, "batch_write", side_effect=[None, requests.HTTPError("500 Server Error")])
+    writer = KvDbWriter(client)
+
+    for written_at in range(2 * KvDbWriter.flush_interval):
+        writer.queue_write_operation("users", {"id": written_at}, written_at)
+
+    with pytest.raises(requests.HTTPError):
+        writer.flush()
@@ -10,12 +10,17 @@ import sqlite3
 import uuid
 from asyncio.log import logger
 from collections import defaultdict
-from typing import Any, Iterable, Mapping
+from typing import Any, Iterable, List, Mapping, Tuple
 
 from airbyte_cdk.destinations import Destination
 from airbyte_cdk.models import AirbyteConnectionStatus, AirbyteMessage, ConfiguredAirbyteCatalog, DestinationSyncMode, Status, Type
 
 
+# Records are written when a state message arrives, or earlier once the buffer reaches one of these limits
+DEFAULT_MAX_BUFFERED_RECORDS = 50_000
+DEFAULT_MAX_BUFFERED_BYTES = 64 * 1024 * 1024
+
+
 class DestinationSqlite(Destination):
     @staticmethod
     def _get_destination_path(destination_path: str) -> str:
@@ -34,6 +39,20 @@ class DestinationSqlite(Destination):
 
         return destination_path
 
+    @staticmethod
+    def _flush_buffer(con: sqlite3.Connection, buffer: Mapping[str, List[Tuple[str, str, str]]]) -> None:
+        """
+        Insert the buffered records of all streams in a single transaction.
+        """
+        with con:
+            for stream_name in buffer.keys():
+                query = """
+                INSERT INTO {table_name}
+                VALUES (?,?,?)
+                """.format(table_name=f"_airbyte_raw_{stream_name}")
+
+                con.executemany(query, buffer[stream_name])
+
     def write(
         self, config: Mapping[str, Any], configured_catalog: ConfiguredAirbyteCatalog, input_messages: Iterable[AirbyteMessage]
     ) -> Iterable[AirbyteMessage]:
@@ -56,43 +75,43 @@ class DestinationSqlite(Destination):
         if path is None:
             path = ""
         path = self._get_destination_path(path)
+        max_buffered_records = config.get("max_buffered_records") or DEFAULT_MAX_BUFFERED_RECORDS
+        max_buffered_bytes = config.get("max_buffered_bytes") or DEFAULT_MAX_BUFFERED_BYTES
         con = sqlite3.connect(path)
-        with con:
-            # create the tables if needed
-            for configured_stream in configured_catalog.streams:
-                name = configured_stream.stream.name
-                table_name = f"_airbyte_raw_{name}"
-                if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
-                    # delete the tables
+        try:
+            # the write-ahead log lets each flush append its transaction instead of rewriting the journal
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            with con:
+                # create the tables if needed
+                for configured_stream in configured_catalog.streams:
+                    name = configured_stream.stream.name
+                    table_name = f"_airbyte_raw_{name}"
+                    if configured_stream.destination_sync_mode == DestinationSyncMode.overwrite:
+                        # delete the tables
+                        query = """
+                        DROP TABLE IF EXISTS {}
+                        """.format(table_name)
+                        con.execute(query)
+                    # create the table if needed
                     query = """
-                    DROP TABLE IF EXISTS {}
-                    """.format(table_name)
+                    CREATE TABLE IF NOT EXISTS {table_name} (
+                        _airbyte_ab_id TEXT PRIMARY KEY,
+                        _airbyte_emitted_at TEXT,
+                        _airbyte_data TEXT
+                    )
+                    """.format(table_name=table_name)
                     con.execute(query)
-                # create the table if needed
-                query = """
-                CREATE TABLE IF NOT EXISTS {table_name} (
-                    _airbyte_ab_id TEXT PRIMARY KEY,
-                    _airbyte_emitted_at TEXT,
-                    _airbyte_data TEXT
-                )
-                """.format(table_name=table_name)
-                con.execute(query)
 
             buffer = defaultdict(list)
+            buffered_records, buffered_bytes = 0, 0
 
             for message in input_messages:
                 if message.type == Type.STATE:
                     # flush the buffer
-                    for stream_name in buffer.keys():
-                        query = """
-                        INSERT INTO {table_name}
-                        VALUES (?,?,?)
-                        """.format(table_name=f"_airbyte_raw_{stream_name}")
-
-                        con.executemany(query, buffer[stream_name])
-
-                    con.commit()
+                    self._flush_buffer(con, buffer)
                     buffer = defaultdict(list)
+                    buffered_records, buffered_bytes = 0, 0
 
                     yield message
                 elif message.type == Type.RECORD:
@@ -103,18 +122,20 @@ class DestinationSqlite(Destination):
                         continue
 
                     # add to buffer
-                    buffer[stream].append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), json.dumps(data)))
+                    serialized_data = json.dumps(data)
+                    buffer[stream].append((str(uuid.uuid4()), datetime.datetime.now().isoformat(), serialized_data))
+                    buffered_records += 1
+                    buffered_bytes += len(serialized_data)
 
-            # flush any remaining messages
-            for stream_name in buffer.keys():
-                query = """
-                INSERT INTO {table_name}
-                VALUES (?,?,?)
-                """.format(table_name=f"_airbyte_raw_{stream_name}")
+                    if buffered_records >= max_buffered_records or buffered_bytes >= max_buffered_bytes:
+                        self._flush_buffer(con, buffer)
+                        buffer = defaultdict(list)
+                        buffered_records, buffered_bytes = 0, 0
 
-                con.executemany(query, buffer[stream_name])
-
-            con.commit()
+            # flush any remaining messages
+            self._flush_buffer(con, buffer)
+        finally:
+            con.close()
 
     def check(self, logger: logging.Logger, config: Mapping[str, Any]) -> AirbyteConnectionStatus:
         """
@@ -2,9 +2,24 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import json
+import sqlite3
+
 import pytest
 from destination_sqlite import DestinationSqlite
 
+from airbyte_cdk.models import (
+    AirbyteMessage,
+    AirbyteRecordMessage,
+    AirbyteStateMessage,
+    AirbyteStream,
+    ConfiguredAirbyteCatalog,
+    ConfiguredAirbyteStream,
+    DestinationSyncMode,
+    SyncMode,
+    Type,
+)
+
 
 def test_get_destination_path():
     user_input = "sqlite.db"
@@ -22,3 +37,66 @@ def test_get_destination_path():
     invalid_input = "/sqlite.db"
     with pytest.raises(ValueError):
         _ = DestinationSqlite._get_destination_path(invalid_input)
+
+
+def users_catalog():
+    return ConfiguredAirbyteCatalog(
+        streams=[
+            ConfiguredAirbyteStream(
+                stream=AirbyteStream(name="users", json_schema={}, supported_sync_modes=[SyncMode.full_refresh]),
+                sync_mode=SyncMode.full_refresh,
+                destination_sync_mode=DestinationSyncMode.overwrite,
+            )
+        ]
+    )
+
+
+def test_write_flushes_buffer_at_record_limit(tmp_path, monkeypatch):
+    monkeypatch.setattr(DestinationSqlite, "_get_destination_path", staticmethod(lambda path: path))
+    path = str(tmp_path / "sqlite.db")
+    catalog = users_catalog()
+    state = AirbyteMessage(type=Type.STATE, state=AirbyteStateMessage(data={"cursor": 5}))
+
+    def count_rows():
+        with sqlite3.connect(path) as con:
+            return con.execute("SELECT COUNT(*) FROM _airbyte_raw_users").fetchone()[0]
+
+    rows_written_before_state = []
+
+    def input_messages():
+        for i in range(5):
+            yield AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": i, "big": 2**70}, emitted_at=0))
+        rows_written_before_state.append(count_rows())
+        yield state
+
+    output = list(DestinationSqlite().write({"destination_path": path, "max_buffered_records": 2}, catalog, input_messages()))
+
+    assert output == [state]
+    assert rows_written_before_state == [4]
+    with sqlite3.connect(path) as con:
+        assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        rows = con.execute("SELECT _airbyte_data FROM _airbyte_raw_users").fetchall()
+    assert sorted(json.loads(data)["id"] for (data,) in rows) == [0, 1, 2, 3, 4]
+    assert all(json.loads(data)["big"] == 2**70 for (data,) in rows)
+
+
+def test_write_closes_connection_on_error(tmp_path, monkeypatch):
+    monkeypatch.setattr(DestinationSqlite, "_get_destination_path", staticmethod(lambda path: path))
+    closed = []
+
+    class Connection(sqlite3.Connection):
+        def close(self):
+            closed.append(True)
+            super().close()
+
+    connect = sqlite3.connect
+    monkeypatch.setattr(sqlite3, "connect", lambda path: connect(path, factory=Connection))
+
+    def input_messages():
+        yield AirbyteMessage(type=Type.RECORD, record=AirbyteRecordMessage(stream="users", data={"id": 1}, emitted_at=0))
+        raise RuntimeError("source failed")
+
+    with pytest.raises(RuntimeError):
+        list(DestinationSqlite().write({"destination_path": str(tmp_path / "sqlite.db")}, users_catalog(), input_messages()))
+
+    assert closed == [True]
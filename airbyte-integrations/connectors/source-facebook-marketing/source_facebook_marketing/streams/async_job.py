@@ -37,13 +37,14 @@ backoff_policy = retry_pattern(backoff.expo, FacebookBadObjectError, max_tries=1
 
 def update_in_batch(api: FacebookAdsApi, jobs: List["AsyncJob"]):
     """Update status of each job in the list in a batch, making it most efficient way to update status.
+    Only jobs that are due for the status check are included, see AsyncJob.status_check_due.
 
     :param api:
     :param jobs:
     """
     batch = api.new_batch()
     max_batch_size = 50
-    for job in jobs:
+    for job in [job for job in jobs if job.status_check_due]:
         # we check it here because job can be already finished
         if len(batch) == max_batch_size:
             while batch:
@@ -111,6 +112,19 @@ class AsyncJob(ABC):
     def failed(self) -> bool:
         """Tell if the job previously failed"""
 
+    @property
+    @abstractmethod
+    def next_status_check(self) -> Optional[pendulum.DateTime]:
+        """Time of the next planned status check, None if the status should be checked as soon as possible"""
+
+    @property
+    def status_check_due(self) -> bool:
+        """Tell if the job is still running and it is time to check its status"""
+        if self.completed:
+            return False
+        next_status_check = self.next_status_check
+        return next_status_check is None or next_status_check <= pendulum.now()
+
     @abstractmethod
     def update_job(self, batch: Optional[FacebookAdsApiBatch] = None):
         """Method to retrieve job's status
@@ -122,6 +136,10 @@ class AsyncJob(ABC):
     def get_result(self) -> Iterator[Any]:
         """Retrieve result of the finished job."""
 
+    @abstractmethod
+    def prefetch_result(self):
+        """Download result of the finished job in advance, so get_result can serve it from memory."""
+
     @abstractmethod
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones"""
@@ -159,6 +177,14 @@ class ParentAsyncJob(AsyncJob):
         """Tell if any job previously failed"""
         return any(job.failed for job in self._jobs)
 
+    @property
+    def next_status_check(self) -> Optional[pendulum.DateTime]:
+        """The earliest planned status check of running jobs"""
+        next_status_checks = [job.next_status_check for job in self._jobs if not job.completed]
+        if not next_status_checks or None in next_status_checks:
+            return None
+        return min(next_status_checks)
+
     def update_job(self, batch: Optional[FacebookAdsApiBatch] = None):
         """Checks jobs status in advance."""
         update_in_batch(api=self._api, jobs=self._jobs)
@@ -168,6 +194,11 @@ class ParentAsyncJob(AsyncJob):
         for job in self._jobs:
             yield from job.get_result()
 
+    def prefetch_result(self):
+        """Download result of each job in the group."""
+        for job in self._jobs:
+            job.prefetch_result()
+
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones."""
         new_jobs = []
@@ -194,6 +225,11 @@ class InsightAsyncJob(AsyncJob):
 
     page_size = 100
 
+    # Bounds of the interval between job status checks. The interval grows exponentially with each check,
+    # but it is shortened when the job is expected to finish earlier based on its progress.
+    MIN_STATUS_CHECK_INTERVAL = pendulum.duration(seconds=5)
+    MAX_STATUS_CHECK_INTERVAL = pendulum.duration(minutes=5)
+
     def __init__(
         self,
         edge_object: Union[AdAccount, Campaign, AdSet, Ad],
@@ -220,6 +256,9 @@ class InsightAsyncJob(AsyncJob):
         self._start_time = None
         self._finish_time = None
         self._failed = False
+        self._result: Optional[List[Any]] = None
+        self._status_checks_number = 0
+        self._next_status_check: Optional[pendulum.DateTime] = None
 
     def split_job(self) -> List["AsyncJob"]:
         """Split existing job in few smaller ones grouped by ParentAsyncJob class."""
@@ -291,6 +330,9 @@ class InsightAsyncJob(AsyncJob):
         self._failed = False
         self._start_time = None
         self._finish_time = None
+        self._result = None
+        self._status_checks_number = 0
+        self._next_status_check = None
         self.start()
         logger.info(f"{self}: restarted.")
 
@@ -317,6 +359,22 @@ class InsightAsyncJob(AsyncJob):
         """Tell if the job previously failed"""
         return self._failed
 
+    @property
+    def next_status_check(self) -> Optional[pendulum.DateTime]:
+        """Time of the next planned status check, None if the job status was not checked yet"""
+        return self._next_status_check
+
+    def _schedule_next_status_check(self, percent_completion: float):
+        """Plan the next status check with exponential backoff. When the job made some progress
+        the remaining time is predicted from the elapsed time, so the job is checked right after it is expected to finish.
+        """
+        self._status_checks_number += 1
+        interval = min(self.MIN_STATUS_CHECK_INTERVAL * 2 ** (self._status_checks_number - 1), self.MAX_STATUS_CHECK_INTERVAL)
+        if 0 < percent_completion < 100:
+            predicted_remaining_time = self.elapsed_time * ((100 - percent_completion) / percent_completion)
+            interval = max(min(interval, predicted_remaining_time), self.MIN_STATUS_CHECK_INTERVAL)
+        self._next_status_check = pendulum.now() + interval
+
     def _batch_success_handler(self, response: FacebookResponse):
         """Update job status from response"""
         self._job = ObjectParser(reuse_object=self._job).parse_single(response.json())
@@ -371,6 +429,7 @@ class InsightAsyncJob(AsyncJob):
             logger.info(f"{self}: has status {job_status} after {self.elapsed_time.in_seconds()} seconds.")
             return True
 
+        self._schedule_next_status_check(float(percent or 0))
         return False
 
     @backoff_policy
@@ -378,8 +437,16 @@ class InsightAsyncJob(AsyncJob):
         """Retrieve result of the finished job."""
         if not self._job or self.failed:
             raise RuntimeError(f"{self}: Incorrect usage of get_result - the job is not started or failed")
+        if self._result is not None:
+            # prefetched result is handed over only once to release memory as soon as it is consumed
+            result, self._result = self._result, None
+            return iter(result)
         return self._job.get_result(params={"limit": self.page_size})
 
+    def prefetch_result(self):
+        """Read all pages of the finished job's result into memory"""
+        self._result = list(self.get_result())
+
     def __str__(self) -> str:
         """String representation of the job wrapper."""
         job_id = self._job["report_run_id"] if self._job else "<None>"
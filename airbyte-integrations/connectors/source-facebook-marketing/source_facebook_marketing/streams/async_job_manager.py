@@ -4,7 +4,12 @@
 
 import logging
 import time
-from typing import TYPE_CHECKING, Iterator, List
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Deque, Iterator, List, Optional, Tuple
+
+import pendulum
 
 from source_facebook_marketing.streams.common import JobException
 
@@ -22,16 +27,24 @@ class InsightAsyncJobManager:
     Class for managing Ads Insights async jobs. Before running next job it
     checks current insight throttle value and if it greater than THROTTLE_LIMIT variable, no new jobs added.
     To consume completed jobs use completed_job generator, jobs will be returned in the order they finished.
+    Results of completed jobs are downloaded concurrently by a bounded pool of workers while the consumer
+    reads previously completed jobs and the manager keeps starting and polling new ones.
     """
 
     # When current insights throttle hit this value no new jobs added.
     THROTTLE_LIMIT = 70
     MAX_NUMBER_OF_ATTEMPTS = 20
-    # Time to wait before checking job status update again.
+    # Maximum time to wait before checking job status update again, it is shorter when some of the jobs
+    # is due for status check earlier, see AsyncJob.next_status_check.
     JOB_STATUS_UPDATE_SLEEP_SECONDS = 30
+    MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS = 1
     # Maximum of concurrent jobs that could be scheduled. Since throttling
     # limit is not reliable indicator of async workload capability we still have to use this parameter.
     MAX_JOBS_IN_QUEUE = 100
+    # Number of workers downloading results of completed jobs concurrently.
+    MAX_RESULT_FETCH_WORKERS = 4
+    # Maximum of completed jobs waiting to be consumed, limits memory used by prefetched results.
+    MAX_COMPLETED_JOBS_IN_QUEUE = 8
 
     def __init__(self, api: "API", jobs: Iterator[AsyncJob], account_id: str):
         """Init
@@ -43,6 +56,10 @@ class InsightAsyncJobManager:
         self._account_id = account_id
         self._jobs = iter(jobs)
         self._running_jobs = []
+        # completed jobs in the order they finished, paired with the future of their result prefetch
+        self._completed_jobs: Deque[Tuple[AsyncJob, Optional[Future]]] = deque()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._last_status_update: Optional[pendulum.DateTime] = None
 
     def _start_jobs(self):
         """Enqueue new jobs."""
@@ -71,17 +88,74 @@ class InsightAsyncJobManager:
 
         :yield: completed jobs
         """
-        if not self._running_jobs:
+        if not self._running_jobs and not self._completed_jobs:
             self._start_jobs()
 
-        while self._running_jobs:
-            completed_jobs = self._check_jobs_status_and_restart()
-            while not completed_jobs:
-                logger.info(f"No jobs ready to be consumed, wait for {self.JOB_STATUS_UPDATE_SLEEP_SECONDS} seconds")
-                time.sleep(self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
-                completed_jobs = self._check_jobs_status_and_restart()
-            yield from completed_jobs
-            self._start_jobs()
+        try:
+            while self._running_jobs or self._completed_jobs:
+                if self._running_jobs and self._should_update_jobs_status():
+                    completed_jobs = self._check_jobs_status_and_restart()
+                    while not completed_jobs and not self._completed_jobs:
+                        sleep_seconds = self._get_status_update_sleep_seconds()
+                        logger.info(f"No jobs ready to be consumed, wait for {sleep_seconds} seconds")
+                        time.sleep(sleep_seconds)
+                        completed_jobs = self._check_jobs_status_and_restart()
+                    self._completed_jobs.extend((job, None) for job in completed_jobs)
+                    self._prefetch_results()
+                    self._start_jobs()
+                yield self._next_completed_job()
+        finally:
+            # also when the consumer stops early or a job fails, the downloads it will not consume are cancelled
+            self._shutdown_executor()
+
+    def _get_status_update_sleep_seconds(self) -> float:
+        """Time to wait until the earliest running job is due for status check, at most JOB_STATUS_UPDATE_SLEEP_SECONDS."""
+        next_status_checks = [job.next_status_check for job in self._running_jobs if job.next_status_check]
+        if not next_status_checks:
+            return self.JOB_STATUS_UPDATE_SLEEP_SECONDS
+        seconds = (min(next_status_checks) - pendulum.now()).total_seconds()
+        return min(max(seconds, self.MIN_JOB_STATUS_UPDATE_SLEEP_SECONDS), self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
+
+    def _should_update_jobs_status(self) -> bool:
+        """Jobs status is updated immediately when there is nothing to consume,
+        otherwise not more often than once per JOB_STATUS_UPDATE_SLEEP_SECONDS and only if the queue of completed jobs has room.
+        """
+        if not self._completed_jobs:
+            return True
+        if len(self._completed_jobs) >= self.MAX_COMPLETED_JOBS_IN_QUEUE:
+            return False
+        return pendulum.now() - self._last_status_update >= pendulum.duration(seconds=self.JOB_STATUS_UPDATE_SLEEP_SECONDS)
+
+    def _prefetch_results(self):
+        """Submit result downloading for the first MAX_COMPLETED_JOBS_IN_QUEUE completed jobs in the queue,
+        at most MAX_RESULT_FETCH_WORKERS of them are downloaded at the same time.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.MAX_RESULT_FETCH_WORKERS, thread_name_prefix="insights_result")
+
+        pending = [i for i, (_, future) in enumerate(islice(self._completed_jobs, self.MAX_COMPLETED_JOBS_IN_QUEUE)) if future is None]
+        for i in pending:
+            job, _ = self._completed_jobs[i]
+            self._completed_jobs[i] = (job, self._executor.submit(job.prefetch_result))
+
+    def _next_completed_job(self) -> AsyncJob:
+        """Take the earliest completed job from the queue and wait until its result is downloaded.
+        If downloading failed, the result will be read again by the consumer, so the error is handled the usual way.
+        """
+        job, future = self._completed_jobs.popleft()
+        if self._completed_jobs:
+            self._prefetch_results()
+        if future is not None:
+            try:
+                future.result()
+            except Exception as exc:
+                logger.warning(f"{job}: failed to prefetch result ({exc!r}), it will be read on consumption.")
+        return job
+
+    def _shutdown_executor(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
     def _check_jobs_status_and_restart(self) -> List[AsyncJob]:
         """Checks jobs status in advance and restart if some failed.
@@ -93,6 +167,7 @@ class InsightAsyncJobManager:
         failed_num = 0
 
         update_in_batch(api=self._api.api, jobs=self._running_jobs)
+        self._last_status_update = pendulum.now()
         self._wait_throttle_limit_down()
         for job in self._running_jobs:
             if job.failed:
@@ -160,6 +160,16 @@ class TestUpdateInBatch:
         assert len(second_batch) == 5
         second_batch.execute.assert_called_once()
 
+    def test_jobs_not_due_skipped(self, api, started_job, batch):
+        """Should update only jobs that are due for status check"""
+        started_job._next_status_check = pendulum.now().add(minutes=1)
+        update_in_batch(api=api, jobs=[started_job])
+        started_job.update_job.assert_not_called()
+
+        started_job._next_status_check = pendulum.now().subtract(seconds=1)
+        update_in_batch(api=api, jobs=[started_job])
+        started_job.update_job.assert_called_once()
+
     def test_failed_execution(self, api, started_job, batch):
         """Should execute batch until there are no failed tasks"""
         jobs = [started_job for _ in range(49)]
@@ -265,6 +275,47 @@ class TestInsightAsyncJob:
 
         kwargs["failure"](response)
 
+    def test_next_status_check_backoff(self, started_job, adreport):
+        assert started_job.next_status_check is None
+        assert started_job.status_check_due
+
+        with freezegun.freeze_time("2024-01-01") as frozen_time:
+            started_job._start_time = pendulum.now()
+            intervals = []
+            for _ in range(10):
+                started_job.update_job()
+                intervals.append((started_job.next_status_check - pendulum.now()).in_seconds())
+                assert not started_job.status_check_due
+                frozen_time.tick(intervals[-1])
+                assert started_job.status_check_due
+
+        assert intervals == [5, 10, 20, 40, 80, 160, 300, 300, 300, 300]
+
+    @pytest.mark.parametrize(
+        ("elapsed_seconds", "percent_completion", "expected_interval"),
+        [
+            (60, 50, 60),  # expected to finish in a minute, earlier than backoff interval
+            (60, 99, 5),  # expected to finish very soon, but not checked more often than the minimal interval
+            (60, 10, 300),  # expected to finish in 9 minutes, backoff interval is shorter
+        ],
+    )
+    def test_next_status_check_predicted(self, started_job, adreport, elapsed_seconds, percent_completion, expected_interval):
+        started_job._status_checks_number = 10
+        adreport["async_percent_completion"] = percent_completion
+
+        with freezegun.freeze_time("2024-01-01 00:00:00"):
+            started_job._start_time = pendulum.now().subtract(seconds=elapsed_seconds)
+            started_job.update_job()
+
+            assert (started_job.next_status_check - pendulum.now()).in_seconds() == expected_interval
+
+    def test_restart_resets_status_checks(self, failed_job, adreport):
+        failed_job._next_status_check = pendulum.now().add(minutes=1)
+
+        failed_job.restart()
+
+        assert failed_job.next_status_check is None
+
     def test_elapsed_time(self, job, api, adreport):
         assert job.elapsed_time is None, "should be None for the job that is not started"
 
@@ -344,6 +395,21 @@ class TestInsightAsyncJob:
         # in case this is not retried, an error will be raised
         job.get_result()
 
+    def test_prefetch_result(self, job, adreport, api):
+        job.start()
+        api.call().json.return_value = {"data": [{"some_data": 123}, {"some_data": 77}]}
+
+        job.prefetch_result()
+        adreport.get_result.assert_called_once()
+
+        result = list(job.get_result())
+        adreport.get_result.assert_called_once()
+        assert [obj.export_all_data() for obj in result] == [{"some_data": 123}, {"some_data": 77}]
+
+        # prefetched result is served only once, next call goes to the API again
+        job.get_result()
+        assert adreport.get_result.call_count == 2
+
     def test_get_result_when_job_is_not_started(self, job):
         with pytest.raises(
             RuntimeError,
@@ -480,6 +546,25 @@ class TestParentAsyncJob:
         assert isinstance(generator, Iterator)
         assert list(generator) == list(range(3, 8)) + list(range(4, 11))
 
+    def test_next_status_check(self, parent_job, grouped_jobs):
+        now = pendulum.now()
+        for i, job in enumerate(grouped_jobs):
+            job.next_status_check = now.add(seconds=10 + i)
+        grouped_jobs[0].completed = True
+
+        assert parent_job.next_status_check == now.add(seconds=11)
+        assert not parent_job.status_check_due
+
+        grouped_jobs[5].next_status_check = None
+        assert parent_job.next_status_check is None
+        assert parent_job.status_check_due
+
+    def test_prefetch_result(self, parent_job, grouped_jobs):
+        parent_job.prefetch_result()
+
+        for job in grouped_jobs:
+            job.prefetch_result.assert_called_once()
+
     def test_split_job(self, parent_job, grouped_jobs, mocker):
         grouped_jobs[0].failed = True
         grouped_jobs[0].split_job.return_value = [
@@ -2,6 +2,10 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
+
+import freezegun
+import pendulum
 import pytest
 from facebook_business.api import FacebookAdsApiBatch
 from source_facebook_marketing.api import MyFacebookAdsApi
@@ -58,8 +62,8 @@ class TestInsightAsyncManager:
 
         update_job_mock.side_effect = update_job_behaviour()
         jobs = [
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False),
-            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, next_status_check=None),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=False, next_status_check=None),
         ]
         manager = InsightAsyncJobManager(api=api, jobs=jobs, account_id=some_config["account_ids"][0])
 
@@ -183,3 +187,110 @@ class TestInsightAsyncManager:
 
         with pytest.raises(JobException):
             next(manager.completed_jobs(), None)
+
+    def test_results_prefetched_concurrently_in_completion_order(self, api, mocker, time_mock, update_job_mock, some_config):
+        """Manager should download results of completed jobs concurrently and emit jobs in the order they finished"""
+        # every download waits for the others, so it succeeds only if MAX_RESULT_FETCH_WORKERS of them run at the same time
+        barrier = threading.Barrier(InsightAsyncJobManager.MAX_RESULT_FETCH_WORKERS)
+        downloaded = []
+
+        def concurrent_prefetch():
+            barrier.wait(timeout=5)
+            downloaded.append(True)
+
+        jobs = [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True) for _ in range(8)]
+        for job in jobs:
+            job.prefetch_result.side_effect = concurrent_prefetch
+        manager = InsightAsyncJobManager(api=api, jobs=jobs, account_id=some_config["account_ids"][0])
+
+        assert list(manager.completed_jobs()) == jobs
+        assert len(downloaded) == len(jobs)
+        time_mock.sleep.assert_not_called()
+
+    def test_completed_queue_is_bounded(self, api, mocker, time_mock, update_job_mock, some_config):
+        """Manager should not prefetch more results than MAX_COMPLETED_JOBS_IN_QUEUE ahead of the consumer"""
+        jobs = [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True) for _ in range(20)]
+        manager = InsightAsyncJobManager(api=api, jobs=jobs, account_id=some_config["account_ids"][0])
+
+        generator = manager.completed_jobs()
+        assert next(generator) == jobs[0]
+
+        prefetching = [job for job, future in manager._completed_jobs if future is not None]
+        assert prefetching == jobs[1 : InsightAsyncJobManager.MAX_COMPLETED_JOBS_IN_QUEUE + 1]
+        assert list(generator) == jobs[1:]
+
+    def test_prefetch_cancelled_when_consumer_stops(self, api, mocker, time_mock, update_job_mock, some_config):
+        """Manager should shut down the prefetch executor and cancel the queued downloads when the consumer stops early"""
+        downloads_released = threading.Event()
+        jobs = [mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True) for _ in range(20)]
+        for job in jobs[1:]:
+            job.prefetch_result.side_effect = downloads_released.wait
+        manager = InsightAsyncJobManager(api=api, jobs=jobs, account_id=some_config["account_ids"][0])
+
+        generator = manager.completed_jobs()
+        assert next(generator) == jobs[0]
+        futures = [future for _, future in manager._completed_jobs if future is not None]
+        generator.close()
+        downloads_released.set()
+
+        assert manager._executor is None
+        # at most the downloads already running are left to finish
+        assert sum(future.cancelled() for future in futures) >= len(futures) - InsightAsyncJobManager.MAX_RESULT_FETCH_WORKERS
+
+    def test_prefetch_failed(self, api, mocker, time_mock, update_job_mock, some_config):
+        """Manager should still emit the job if its result prefetch failed, so the error is raised while reading it"""
+        jobs = [
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True),
+            mocker.Mock(spec=InsightAsyncJob, attempt_number=1, failed=False, completed=True),
+        ]
+        jobs[0].prefetch_result.side_effect = RuntimeError("connection reset")
+        manager = InsightAsyncJobManager(api=api, jobs=jobs, account_id=some_config["account_ids"][0])
+
+        assert list(manager.completed_jobs()) == jobs
+
+    def test_adaptive_status_polling(self, api, mocker, time_mock, some_config):
+        """Manager should check status of each job according to its progress instead of checking all jobs every time"""
+        durations = {"fast_1": 10, "fast_2": 20, "slow_1": 600, "slow_2": 1200}
+        status_checks = {job_id: 0 for job_id in durations}
+        finished_at = {}
+
+        def update_in_batch(api, jobs):
+            for job in jobs:
+                if not job.status_check_due:
+                    continue
+                job_id = job._job["report_run_id"]
+                status_checks[job_id] += 1
+                elapsed = job.elapsed_time.in_seconds()
+                completed = elapsed >= durations[job_id]
+                job._job["async_status"] = "Job Completed" if completed else "Job Running"
+                job._job["async_percent_completion"] = min(100, int(100 * elapsed / durations[job_id]))
+                if job._check_status():
+                    finished_at[job_id] = elapsed
+
+        mocker.patch("source_facebook_marketing.streams.async_job_manager.update_in_batch", side_effect=update_in_batch)
+        mocker.patch.object(InsightAsyncJob, "prefetch_result")
+        jobs = []
+        for job_id in durations:
+            edge_object = mocker.Mock()
+            edge_object.get_insights.return_value = {"report_run_id": job_id}
+            jobs.append(
+                InsightAsyncJob(
+                    api=api.api,
+                    edge_object=edge_object,
+                    params={"breakdowns": []},
+                    interval=pendulum.Period(pendulum.Date(2024, 1, 1), pendulum.Date(2024, 1, 1)),
+                    job_timeout=pendulum.duration(hours=1),
+                )
+            )
+
+        with freezegun.freeze_time("2024-01-01") as frozen_time:
+            time_mock.sleep.side_effect = lambda seconds: frozen_time.tick(seconds)
+            manager = InsightAsyncJobManager(api=api, jobs=jobs, account_id=some_config["account_ids"][0])
+            completed_jobs = list(manager.completed_jobs())
+
+        assert [job._job["report_run_id"] for job in completed_jobs] == ["fast_1", "fast_2", "slow_1", "slow_2"]
+        # polling every JOB_STATUS_UPDATE_SLEEP_SECONDS would check status of all running jobs 41 times, 64 status checks in total
+        assert sum(status_checks.values()) < 64 / 2
+        for job_id, duration in durations.items():
+            # each job is picked up shortly after it finished
+            assert finished_at[job_id] - duration <= InsightAsyncJob.MIN_STATUS_CHECK_INTERVAL.in_seconds()
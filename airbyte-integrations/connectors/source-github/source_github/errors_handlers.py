@@ -66,7 +66,11 @@ class GithubStreamABCErrorHandler(HttpStatusErrorHandler):
                 )
                 # Rate limit HTTP headers
                 # https://docs.github.com/en/rest/overview/resources-in-the-rest-api#rate-limit-http-headers
-                or (response_or_exception.status_code != 200 and response_or_exception.headers.get("X-RateLimit-Remaining") == "0")
+                # `304 Not Modified` responses for conditional requests don't count against the rate limit
+                or (
+                    response_or_exception.status_code not in (requests.codes.OK, requests.codes.NOT_MODIFIED)
+                    and response_or_exception.headers.get("X-RateLimit-Remaining") == "0"
+                )
                 # Secondary rate limits
                 # https://docs.github.com/en/rest/overview/resources-in-the-rest-api#secondary-rate-limits
                 or "Retry-After" in response_or_exception.headers
@@ -4,16 +4,23 @@
 
 import heapq
 import itertools
+from functools import lru_cache
 from typing import Optional
 
 import sgqlc.operation
 from sgqlc.operation import Selector
+from sgqlc.types import Schema
 
-from . import github_schema
 
+@lru_cache(maxsize=None)
+def _get_schema_root() -> Schema:
+    """
+    The generated GitHub schema module is very large and takes seconds to import,
+    so it is imported on the first query construction only instead of on every spec, check and discover run.
+    """
+    from . import github_schema
 
-_schema = github_schema
-_schema_root = _schema.github_schema
+    return github_schema.github_schema
 
 
 def select_user_fields(user):
@@ -32,7 +39,7 @@ def get_query_pull_requests(owner, name, first, after, direction):
     if after:
         kwargs["after"] = after
 
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+    op = sgqlc.operation.Operation(_get_schema_root().query_type)
     repository = op.repository(owner=owner, name=name)
     repository.name()
     repository.owner.login()
@@ -56,7 +63,7 @@ def get_query_pull_requests(owner, name, first, after, direction):
     reviews = pull_requests.nodes.reviews(first=100, __alias__="review_comments")
     reviews.total_count()
     reviews.nodes.comments.__fields__(total_count=True)
-    user = pull_requests.nodes.merged_by(__alias__="merged_by").__as__(_schema_root.User)
+    user = pull_requests.nodes.merged_by(__alias__="merged_by").__as__(_get_schema_root().User)
     select_user_fields(user)
     pull_requests.page_info.__fields__(has_next_page=True, end_cursor=True)
     return str(op)
@@ -67,7 +74,7 @@ def get_query_projectsV2(owner, name, first, after, direction):
     if after:
         kwargs["after"] = after
 
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+    op = sgqlc.operation.Operation(_get_schema_root().query_type)
     repository = op.repository(owner=owner, name=name)
     repository.name()
     repository.owner.login()
@@ -97,7 +104,7 @@ def get_query_projectsV2(owner, name, first, after, direction):
 
 
 def get_query_reviews(owner, name, first, after, number=None):
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+    op = sgqlc.operation.Operation(_get_schema_root().query_type)
     repository = op.repository(owner=owner, name=name)
     repository.name()
     repository.owner.login()
@@ -129,13 +136,13 @@ def get_query_reviews(owner, name, first, after, number=None):
         updated_at="updated_at",
     )
     reviews.nodes.commit.oid()
-    user = reviews.nodes.author(__alias__="user").__as__(_schema_root.User)
+    user = reviews.nodes.author(__alias__="user").__as__(_get_schema_root().User)
     select_user_fields(user)
     return str(op)
 
 
 def get_query_issue_reactions(owner, name, first, after, number=None):
-    op = sgqlc.operation.Operation(_schema_root.query_type)
+    op = sgqlc.operation.Operation(_get_schema_root().query_type)
     repository = op.repository(owner=owner, name=name)
     repository.name()
     repository.owner.login()
@@ -223,7 +230,7 @@ class QueryReactions:
         }
         """
         op = self._get_operation()
-        pull_request = op.node(id=node_id).__as__(_schema_root.PullRequest)
+        pull_request = op.node(id=node_id).__as__(_get_schema_root().PullRequest)
         pull_request.id(__alias__="node_id")
         pull_request.repository.name()
         pull_request.repository.owner.login()
@@ -246,7 +253,7 @@ class QueryReactions:
         }
         """
         op = self._get_operation()
-        review = op.node(id=node_id).__as__(_schema_root.PullRequestReview)
+        review = op.node(id=node_id).__as__(_get_schema_root().PullRequestReview)
         review.id(__alias__="node_id")
         review.repository.name()
         review.repository.owner.login()
@@ -266,7 +273,7 @@ class QueryReactions:
         }
         """
         op = self._get_operation()
-        comment = op.node(id=node_id).__as__(_schema_root.PullRequestReviewComment)
+        comment = op.node(id=node_id).__as__(_get_schema_root().PullRequestReviewComment)
         comment.id(__alias__="node_id")
         comment.database_id(__alias__="id")
         comment.repository.name()
@@ -308,7 +315,7 @@ class QueryReactions:
         return reviews
 
     def _get_operation(self):
-        return sgqlc.operation.Operation(_schema_root.query_type)
+        return sgqlc.operation.Operation(_get_schema_root().query_type)
 
 
 class CursorStorage:
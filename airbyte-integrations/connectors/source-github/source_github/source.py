@@ -3,10 +3,10 @@
 #
 import logging
 from os import getenv
-from typing import Any, List, Mapping, MutableMapping, Optional, Tuple
+from typing import Any, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 from urllib.parse import urlparse
 
-from airbyte_cdk.models import FailureType
+from airbyte_cdk.models import AirbyteMessage, AirbyteStateMessage, ConfiguredAirbyteCatalog, FailureType
 from airbyte_cdk.sources import AbstractSource
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.http.requests_native_auth import MultipleTokenAuthenticator
@@ -56,12 +56,16 @@ from .streams import (
     WorkflowRuns,
     Workflows,
 )
-from .utils import read_full_refresh
+from .utils import ETagCache, read_full_refresh
 
 
 class SourceGithub(AbstractSource):
     continue_sync_on_stream_failure = True
 
+    def __init__(self):
+        super().__init__()
+        self._etag_cache = ETagCache.from_env()
+
     @staticmethod
     def _get_org_repositories(
         config: Mapping[str, Any], authenticator: MultipleTokenAuthenticator, is_check_connection: bool = False
@@ -245,6 +249,7 @@ class SourceGithub(AbstractSource):
             "api_url": config.get("api_url"),
             "access_token_type": access_token_type,
             "max_waiting_time": max_waiting_time,
+            "etag_cache": self._etag_cache,
         }
         start_date = config.get("start_date")
         organization_args_with_start_date = {**organization_args, "start_date": start_date}
@@ -256,6 +261,7 @@ class SourceGithub(AbstractSource):
             "page_size_for_large_streams": page_size,
             "access_token_type": access_token_type,
             "max_waiting_time": max_waiting_time,
+            "etag_cache": self._etag_cache,
         }
         repository_args_with_start_date = {**repository_args, "start_date": start_date}
 
@@ -307,3 +313,13 @@ class SourceGithub(AbstractSource):
             WorkflowJobs(parent=workflow_runs_stream, **repository_args_with_start_date),
             TeamMemberships(parent=team_members_stream, **repository_args),
         ]
+
+    def read(
+        self,
+        logger: logging.Logger,
+        config: Mapping[str, Any],
+        catalog: ConfiguredAirbyteCatalog,
+        state: Optional[List[AirbyteStateMessage]] = None,
+    ) -> Iterator[AirbyteMessage]:
+        yield from super().read(logger, config, catalog, state)
+        self._etag_cache.save()
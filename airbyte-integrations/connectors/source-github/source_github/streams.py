@@ -4,7 +4,10 @@
 
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 from urllib import parse
 
 import pendulum
@@ -39,7 +42,7 @@ from .graphql import (
     get_query_pull_requests,
     get_query_reviews,
 )
-from .utils import GitHubAPILimitException, getter
+from .utils import ETagCache, GitHubAPILimitException, MultipleTokenAuthenticatorWithRateLimiter, getter
 
 
 class GithubStreamABC(HttpStream, ABC):
@@ -50,13 +53,16 @@ class GithubStreamABC(HttpStream, ABC):
     max_retries: int = 5
     stream_base_params = {}
 
-    def __init__(self, api_url: str = "https://api.github.com", access_token_type: str = "", **kwargs):
+    def __init__(
+        self, api_url: str = "https://api.github.com", access_token_type: str = "", etag_cache: Optional[ETagCache] = None, **kwargs
+    ):
         if kwargs.get("authenticator"):
             kwargs["authenticator"].max_time = kwargs.pop("max_waiting_time", self.max_time)
         super().__init__(**kwargs)
 
         self.access_token_type = access_token_type
         self.api_url = api_url
+        self.etag_cache = etag_cache
         self.state = {}
 
         if not self.supports_incremental:
@@ -70,6 +76,13 @@ class GithubStreamABC(HttpStream, ABC):
     def availability_strategy(self) -> Optional["AvailabilityStrategy"]:
         return None
 
+    @property
+    def rate_limiter(self) -> Optional[MultipleTokenAuthenticatorWithRateLimiter]:
+        authenticator = self._http_client._session.auth
+        if isinstance(authenticator, MultipleTokenAuthenticatorWithRateLimiter):
+            return authenticator
+        return None
+
     def next_page_token(self, response: requests.Response) -> Optional[Mapping[str, Any]]:
         links = response.links
         if "next" in links:
@@ -346,10 +359,111 @@ class IncrementalMixin(SemiIncrementalMixin):
         return params
 
 
+class ConditionalRequestsMixin:
+    """
+    Streams which read all pages on every sync send conditional requests with the ETag of the previous response for the same page.
+    For unchanged pages GitHub answers with `304 Not Modified`, which don't count against the primary rate limit,
+    and the previous payload is replayed from the ETag cache, so the rest of the stream logic gets the same response as before.
+    """
+
+    def _etag_cache_key(
+        self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> str:
+        path = self.path(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        params = self.request_params(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        return f"{self.url_base}/{path}?{parse.urlencode(sorted(params.items()))}"
+
+    def request_headers(
+        self, stream_state: Mapping[str, Any] = None, stream_slice: Mapping[str, Any] = None, next_page_token: Mapping[str, Any] = None
+    ) -> Mapping[str, Any]:
+        headers = super().request_headers(stream_state=stream_state, stream_slice=stream_slice, next_page_token=next_page_token)
+        if self.etag_cache:
+            etag = self.etag_cache.get_etag(self._etag_cache_key(stream_state, stream_slice, next_page_token))
+            if etag:
+                headers = {**headers, "If-None-Match": etag}
+        return headers
+
+    def _fetch_next_page(
+        self,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+        next_page_token: Optional[Mapping[str, Any]] = None,
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        request, response = super()._fetch_next_page(stream_slice, stream_state, next_page_token)
+        if not self.etag_cache:
+            return request, response
+
+        key = self._etag_cache_key(stream_state, stream_slice, next_page_token)
+        if response.status_code == requests.codes.NOT_MODIFIED and self.etag_cache.get_etag(key):
+            if self.rate_limiter:
+                self.rate_limiter.release_request(request)
+            return request, self.etag_cache.replay(key, response)
+        if response.status_code == requests.codes.OK:
+            self.etag_cache.update(key, response)
+        return request, response
+
+
+class ConcurrentSlicesMixin:
+    """
+    Repository slices don't depend on each other, so while the records of the current repository are read, the first pages
+    of the next repositories are already requested in the background. The number of concurrent requests is bounded by
+    the request budget of the tokens, see `MultipleTokenAuthenticatorWithRateLimiter.max_concurrent_requests`.
+    Records are still parsed slice by slice in the main thread, which keeps the order of records within each repository
+    and the state of each repository the same as with sequential reads.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._prefetched_pages: MutableMapping[Tuple, Future] = {}
+
+    def _prefetch_key(self, stream_slice: Mapping[str, Any]) -> Tuple:
+        # the checkpoint reader can wrap the slice with the partition and the cursor slice
+        _, _, stream_slice = self._extract_slice_fields(stream_slice)
+        return tuple(sorted(stream_slice.items()))
+
+    def stream_slices(self, stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
+        stream_slices = iter(super().stream_slices(stream_state=stream_state, **kwargs))
+        max_workers = self.rate_limiter.max_concurrent_requests if self.rate_limiter else 1
+        if max_workers <= 1:
+            yield from stream_slices
+            return
+
+        pending_slices = deque()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"{self.name}_slices") as executor:
+            try:
+                while True:
+                    # the budget shrinks as requests are spent, so the window is adjusted before each slice
+                    window = min(max_workers, self.rate_limiter.max_concurrent_requests)
+                    for stream_slice in islice(stream_slices, max(window - len(pending_slices), 0)):
+                        self._prefetched_pages[self._prefetch_key(stream_slice)] = executor.submit(
+                            super()._fetch_next_page, stream_slice, stream_state, None
+                        )
+                        pending_slices.append(stream_slice)
+                    if not pending_slices:
+                        break
+                    yield pending_slices.popleft()
+            finally:
+                for prefetched_page in self._prefetched_pages.values():
+                    prefetched_page.cancel()
+                self._prefetched_pages.clear()
+
+    def _fetch_next_page(
+        self,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+        next_page_token: Optional[Mapping[str, Any]] = None,
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        if stream_slice and not next_page_token:
+            prefetched_page = self._prefetched_pages.pop(self._prefetch_key(stream_slice), None)
+            if prefetched_page:
+                return prefetched_page.result()
+        return super()._fetch_next_page(stream_slice, stream_state, next_page_token)
+
+
 # Below are full refresh streams
 
 
-class RepositoryStats(GithubStream):
+class RepositoryStats(ConcurrentSlicesMixin, GithubStream):
     """
     This stream is technical and not intended for the user, we use it for checking connection with the repository.
     API docs: https://docs.github.com/en/rest/reference/repos#get-a-repository
@@ -362,13 +476,13 @@ class RepositoryStats(GithubStream):
         yield response.json()
 
 
-class Assignees(GithubStream):
+class Assignees(ConditionalRequestsMixin, ConcurrentSlicesMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/issues/assignees?apiVersion=2022-11-28#list-assignees
     """
 
 
-class Branches(GithubStream):
+class Branches(ConditionalRequestsMixin, ConcurrentSlicesMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/branches/branches?apiVersion=2022-11-28#list-branches
     """
@@ -379,13 +493,13 @@ class Branches(GithubStream):
         return f"repos/{stream_slice['repository']}/branches"
 
 
-class Collaborators(GithubStream):
+class Collaborators(ConditionalRequestsMixin, ConcurrentSlicesMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/collaborators/collaborators?apiVersion=2022-11-28#list-repository-collaborators
     """
 
 
-class IssueLabels(GithubStream):
+class IssueLabels(ConditionalRequestsMixin, ConcurrentSlicesMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/issues/labels?apiVersion=2022-11-28#list-labels-for-a-repository
     """
@@ -394,7 +508,7 @@ class IssueLabels(GithubStream):
         return f"repos/{stream_slice['repository']}/labels"
 
 
-class Organizations(GithubStreamABC):
+class Organizations(ConditionalRequestsMixin, GithubStreamABC):
     """
     API docs: https://docs.github.com/en/rest/orgs/orgs?apiVersion=2022-11-28#list-organizations
     """
@@ -447,7 +561,7 @@ class Repositories(SemiIncrementalMixin, Organizations):
                 yield record
 
 
-class Tags(GithubStream):
+class Tags(ConditionalRequestsMixin, ConcurrentSlicesMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/repos/repos?apiVersion=2022-11-28#list-repository-tags
     """
@@ -489,7 +603,7 @@ class Users(Organizations):
 # Below are semi incremental streams
 
 
-class Releases(SemiIncrementalMixin, GithubStream):
+class Releases(ConcurrentSlicesMixin, SemiIncrementalMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/releases/releases?apiVersion=2022-11-28#list-releases
     """
@@ -507,7 +621,7 @@ class Releases(SemiIncrementalMixin, GithubStream):
         return record
 
 
-class Events(SemiIncrementalMixin, GithubStream):
+class Events(ConcurrentSlicesMixin, SemiIncrementalMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/activity/events?apiVersion=2022-11-28#list-repository-events
     """
@@ -564,7 +678,7 @@ class PullRequests(SemiIncrementalMixin, GithubStream):
         return "desc"
 
 
-class CommitComments(SemiIncrementalMixin, GithubStream):
+class CommitComments(ConcurrentSlicesMixin, SemiIncrementalMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/commits/comments?apiVersion=2022-11-28#list-commit-comments-for-a-repository
     """
@@ -575,7 +689,7 @@ class CommitComments(SemiIncrementalMixin, GithubStream):
         return f"repos/{stream_slice['repository']}/comments"
 
 
-class IssueMilestones(SemiIncrementalMixin, GithubStream):
+class IssueMilestones(ConcurrentSlicesMixin, SemiIncrementalMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/issues/milestones?apiVersion=2022-11-28#list-milestones
     """
@@ -591,7 +705,7 @@ class IssueMilestones(SemiIncrementalMixin, GithubStream):
         return f"repos/{stream_slice['repository']}/milestones"
 
 
-class Stargazers(SemiIncrementalMixin, GithubStream):
+class Stargazers(ConcurrentSlicesMixin, SemiIncrementalMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/activity/starring?apiVersion=2022-11-28#list-stargazers
     """
@@ -617,7 +731,7 @@ class Stargazers(SemiIncrementalMixin, GithubStream):
         return record
 
 
-class Projects(SemiIncrementalMixin, GithubStream):
+class Projects(ConcurrentSlicesMixin, SemiIncrementalMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/projects/projects?apiVersion=2022-11-28#list-repository-projects
     """
@@ -636,7 +750,7 @@ class Projects(SemiIncrementalMixin, GithubStream):
         return {**base_headers, **headers}
 
 
-class IssueEvents(SemiIncrementalMixin, GithubStream):
+class IssueEvents(ConcurrentSlicesMixin, SemiIncrementalMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/issues/events?apiVersion=2022-11-28#list-issue-events-for-a-repository
     """
@@ -650,7 +764,7 @@ class IssueEvents(SemiIncrementalMixin, GithubStream):
 # Below are incremental streams
 
 
-class Comments(IncrementalMixin, GithubStream):
+class Comments(ConcurrentSlicesMixin, IncrementalMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/issues/comments?apiVersion=2022-11-28#list-issue-comments-for-a-repository
     """
@@ -745,7 +859,7 @@ class Commits(IncrementalMixin, GithubStream):
             self.branches_to_repos[repo] = repo_branches
 
 
-class Issues(IncrementalMixin, GithubStream):
+class Issues(ConcurrentSlicesMixin, IncrementalMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/issues/issues?apiVersion=2022-11-28#list-repository-issues
     """
@@ -761,7 +875,7 @@ class Issues(IncrementalMixin, GithubStream):
     }
 
 
-class ReviewComments(IncrementalMixin, GithubStream):
+class ReviewComments(ConcurrentSlicesMixin, IncrementalMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/pulls/comments?apiVersion=2022-11-28#list-review-comments-in-a-repository
     """
@@ -1266,7 +1380,7 @@ class PullRequestCommentReactions(SemiIncrementalMixin, GitHubGraphQLStream):
         return {"query": query}
 
 
-class Deployments(SemiIncrementalMixin, GithubStream):
+class Deployments(ConcurrentSlicesMixin, SemiIncrementalMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/deployments/deployments?apiVersion=2022-11-28#list-deployments
     """
@@ -1422,7 +1536,7 @@ class ProjectCards(GithubStream):
         return record
 
 
-class Workflows(SemiIncrementalMixin, GithubStream):
+class Workflows(ConcurrentSlicesMixin, SemiIncrementalMixin, GithubStream):
     """
     Get all workflows of a GitHub repository
     API documentation: https://docs.github.com/en/rest/actions/workflows?apiVersion=2022-11-28#list-repository-workflows
@@ -1440,7 +1554,7 @@ class Workflows(SemiIncrementalMixin, GithubStream):
         return pendulum.parse(value).in_tz(tz="UTC").format("YYYY-MM-DDTHH:mm:ss[Z]")
 
 
-class WorkflowRuns(SemiIncrementalMixin, GithubStream):
+class WorkflowRuns(ConcurrentSlicesMixin, SemiIncrementalMixin, GithubStream):
     """
     Get all workflow runs for a GitHub repository
     API documentation: https://docs.github.com/en/rest/actions/workflow-runs?apiVersion=2022-11-28#list-workflow-runs-for-a-repository
@@ -1618,7 +1732,7 @@ class TeamMemberships(GithubStream):
         return record
 
 
-class ContributorActivity(GithubStream):
+class ContributorActivity(ConcurrentSlicesMixin, GithubStream):
     """
     API docs: https://docs.github.com/en/rest/metrics/statistics?apiVersion=2022-11-28#get-all-contributor-commit-activity
     """
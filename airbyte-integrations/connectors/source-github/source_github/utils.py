@@ -2,18 +2,29 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import hashlib
+import json
+import logging
+import os
+import threading
 import time
 from dataclasses import dataclass
 from itertools import cycle
-from typing import Any, List, Mapping
+from pathlib import Path
+from typing import Any, List, Mapping, MutableMapping, Optional, Set
 
 import pendulum
 import requests
+from requests.structures import CaseInsensitiveDict
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams import Stream
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
 from airbyte_cdk.sources.streams.http.requests_native_auth.abstract_token import AbstractHeaderAuthenticator
+from airbyte_cdk.utils.constants import ENV_REQUEST_CACHE_PATH
+
+
+logger = logging.getLogger("airbyte")
 
 
 def getter(D: dict, key_or_keys, strict=True):
@@ -56,11 +67,17 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
     """
 
     DURATION = pendulum.duration(seconds=3600)  # Duration at which the current rate limit window resets
+    # GitHub advises against a lot of concurrent requests, they can trigger secondary rate limits
+    # https://docs.github.com/en/rest/using-the-rest-api/best-practices-for-using-the-rest-api#avoid-concurrent-requests
+    CONCURRENT_REQUESTS_PER_TOKEN = 2
+    MAX_CONCURRENT_REQUESTS = 16
 
     def __init__(self, tokens: List[str], auth_method: str = "token", auth_header: str = "Authorization"):
         self._auth_method = auth_method
         self._auth_header = auth_header
         self._tokens = {t: Token() for t in tokens}
+        # requests can be sent from several threads, the token budgets are updated under the lock
+        self._lock = threading.RLock()
         self.check_all_tokens()
         self._tokens_iter = cycle(self._tokens)
         self._active_token = next(self._tokens_iter)
@@ -78,16 +95,17 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
 
     def __call__(self, request):
         """Attach the HTTP headers required to authenticate on the HTTP request"""
-        while True:
-            current_token = self._tokens[self.current_active_token]
-            if "graphql" in request.path_url:
-                if self.process_token(current_token, "count_graphql", "reset_at_graphql"):
-                    break
-            else:
-                if self.process_token(current_token, "count_rest", "reset_at_rest"):
-                    break
+        with self._lock:
+            while True:
+                current_token = self._tokens[self.current_active_token]
+                if "graphql" in request.path_url:
+                    if self.process_token(current_token, "count_graphql", "reset_at_graphql"):
+                        break
+                else:
+                    if self.process_token(current_token, "count_rest", "reset_at_rest"):
+                        break
 
-        request.headers.update(self.get_auth_header())
+            request.headers.update(self.get_auth_header())
 
         return request
 
@@ -103,6 +121,17 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
         token = self.current_active_token
         return f"{self._auth_method} {token}"
 
+    @property
+    def max_concurrent_requests(self) -> int:
+        """
+        The number of REST requests which can be sent concurrently: a few per token with the remaining budget,
+        but not more than the remaining budget itself.
+        """
+        with self._lock:
+            available_tokens = [token for token in self._tokens.values() if token.count_rest > 0]
+            remaining_requests = sum(token.count_rest for token in available_tokens)
+        return max(1, min(len(available_tokens) * self.CONCURRENT_REQUESTS_PER_TOKEN, remaining_requests, self.MAX_CONCURRENT_REQUESTS))
+
     @property
     def max_time(self) -> int:
         return self._max_time
@@ -138,6 +167,16 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
         for token in self._tokens:
             self._check_token_limits(token)
 
+    def release_request(self, request: requests.PreparedRequest) -> None:
+        """
+        Give back the REST budget spent on the request, it is used for conditional requests answered with `304 Not Modified`
+        which don't count against the primary rate limit.
+        """
+        token = request.headers.get(self.auth_header, "").removeprefix(f"{self._auth_method} ")
+        with self._lock:
+            if token in self._tokens:
+                self._tokens[token].count_rest += 1
+
     def process_token(self, current_token, count_attr, reset_attr):
         if getattr(current_token, count_attr) > 0:
             setattr(current_token, count_attr, getattr(current_token, count_attr) - 1)
@@ -152,3 +191,86 @@ class MultipleTokenAuthenticatorWithRateLimiter(AbstractHeaderAuthenticator):
         else:
             self.update_token()
         return False
+
+
+class ETagCache:
+    """
+    Stores the ETag and the payload of the last successful response for each request, so the request can be sent
+    as a conditional one with `If-None-Match` header. Unchanged resources are answered with `304 Not Modified`,
+    which don't count against the primary rate limit, and the cached payload is replayed instead.
+    https://docs.github.com/en/rest/using-the-rest-api/best-practices-for-using-the-rest-api#use-conditional-requests-if-appropriate
+
+    Like the CDK HTTP cache, the entries are persisted in the `REQUEST_CACHE_PATH` directory if it is set,
+    otherwise they live in memory only. The entries of the requests which were not sent during the sync are dropped
+    when the cache is saved, so it only holds the pages of the last sync.
+    """
+
+    FILE_NAME = "github_etag_cache.json"
+
+    def __init__(self, path: Optional[Path] = None):
+        self._path = path
+        self._entries: MutableMapping[str, Mapping[str, Any]] = {}
+        self._modified = False
+        # keys of the requests sent since the cache was loaded
+        self._used_keys: Set[str] = set()
+        if path and path.exists():
+            try:
+                self._entries = json.loads(path.read_text())
+            except (OSError, ValueError) as e:
+                logger.warning(f"Unable to load ETag cache from {path}, starting with an empty one: {e}")
+
+    @classmethod
+    def from_env(cls) -> "ETagCache":
+        cache_dir = os.getenv(ENV_REQUEST_CACHE_PATH)
+        return cls(Path(cache_dir) / cls.FILE_NAME if cache_dir else None)
+
+    def get_etag(self, key: str) -> Optional[str]:
+        self._used_keys.add(key)
+        entry = self._entries.get(key)
+        return entry["etag"] if entry else None
+
+    def update(self, key: str, response: requests.Response) -> None:
+        """Remember the ETag and the payload of the successful response"""
+        self._used_keys.add(key)
+        etag = response.headers.get("ETag")
+        if not etag:
+            return
+        payload_hash = hashlib.sha256(response.content).hexdigest()
+        entry = self._entries.get(key)
+        if entry and entry["etag"] == etag and entry["hash"] == payload_hash:
+            return
+        self._entries[key] = {
+            "etag": etag,
+            "hash": payload_hash,
+            "content": response.text,
+            "link": response.headers.get("Link"),
+        }
+        self._modified = True
+
+    def replay(self, key: str, response: requests.Response) -> requests.Response:
+        """Build a successful response from the cached payload for the `304 Not Modified` response"""
+        entry = self._entries[key]
+        cached_response = requests.Response()
+        cached_response.status_code = requests.codes.OK
+        cached_response._content = entry["content"].encode("utf-8")
+        cached_response.encoding = "utf-8"
+        cached_response.headers = CaseInsensitiveDict(response.headers)
+        cached_response.headers["ETag"] = entry["etag"]
+        cached_response.headers.pop("Link", None)
+        if entry["link"]:
+            cached_response.headers["Link"] = entry["link"]
+        cached_response.url = response.url
+        cached_response.request = response.request
+        return cached_response
+
+    def save(self) -> None:
+        unused_keys = self._entries.keys() - self._used_keys
+        for key in unused_keys:
+            del self._entries[key]
+        self._modified = self._modified or bool(unused_keys)
+        if not self._path or not self._modified:
+            return
+        tmp_path = self._path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._entries))
+        tmp_path.replace(self._path)
+        self._modified = False
@@ -3,6 +3,8 @@
 #
 
 import json
+import threading
+import time
 from unittest.mock import patch
 
 import pendulum
@@ -10,12 +12,14 @@ import pytest
 import responses
 from freezegun import freeze_time
 from source_github import SourceGithub
-from source_github.streams import Organizations
+from source_github.streams import Organizations, Releases
 from source_github.utils import MultipleTokenAuthenticatorWithRateLimiter, read_full_refresh
 
 from airbyte_cdk.utils import AirbyteTracedException
 from airbyte_protocol.models import FailureType
 
+from .utils import read_incremental
+
 
 @responses.activate
 def test_multiple_tokens(rate_limit_mock_response):
@@ -146,3 +150,60 @@ def test_multiple_token_authenticator_with_rate_limiter_and_sleep(sleep_mock, ca
     list(read_full_refresh(stream))
     sleep_mock.assert_called_once_with(ACCEPTED_WAITING_TIME_IN_SECONDS)
     assert [(x.count_rest, x.count_graphql) for x in authenticator._tokens.values()] == [(500, 500), (500, 500), (498, 500)]
+
+
+@responses.activate
+def test_concurrent_repository_slices():
+    """
+    This test ensures that repository slices are read concurrently:
+     1. the number of concurrent requests is bounded by the number of tokens;
+     2. all requests are counted by the rate limiter, tokens are switched when the budget is spent;
+     3. the order of records within each repository and the state of each repository are the same as with sequential reads.
+    """
+    repositories = [f"organization/repository_{n}" for n in range(200)]
+    stream_state = {repository: {"created_at": "2022-01-02T00:00:00Z"} for repository in repositories[::2]}
+
+    def request_callback_rate_limits(request):
+        resp_body = {
+            "resources": {
+                "core": {"limit": 70, "used": 0, "remaining": 70, "reset": 4070908800},
+                "graphql": {"limit": 70, "used": 0, "remaining": 70, "reset": 4070908800},
+            }
+        }
+        return (200, {}, json.dumps(resp_body))
+
+    responses.add_callback(responses.GET, "https://api.github.com/rate_limit", callback=request_callback_rate_limits)
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1", "token2", "token3"])
+    assert authenticator.max_concurrent_requests == 6
+
+    lock = threading.Lock()
+    requests_in_flight = max_requests_in_flight = 0
+
+    def request_callback_releases(request):
+        nonlocal requests_in_flight, max_requests_in_flight
+        with lock:
+            requests_in_flight += 1
+            max_requests_in_flight = max(max_requests_in_flight, requests_in_flight)
+        time.sleep(0.01)
+        with lock:
+            requests_in_flight -= 1
+        resp_body = [{"id": 2, "created_at": "2022-01-03T00:00:00Z"}, {"id": 1, "created_at": "2022-01-01T00:00:00Z"}]
+        return (200, {}, json.dumps(resp_body))
+
+    for repository in repositories:
+        responses.add_callback(responses.GET, f"https://api.github.com/repos/{repository}/releases", callback=request_callback_releases)
+
+    stream = Releases(repositories=repositories, page_size_for_large_streams=100, authenticator=authenticator)
+    stream.state = stream_state
+    records = read_incremental(stream, stream_state)
+
+    expected_records = []
+    for n, repository in enumerate(repositories):
+        expected_records.append({"id": 2, "created_at": "2022-01-03T00:00:00Z", "repository": repository})
+        if n % 2:
+            expected_records.append({"id": 1, "created_at": "2022-01-01T00:00:00Z", "repository": repository})
+    assert [{k: record[k] for k in ("id", "created_at", "repository")} for record in records] == expected_records
+    assert stream.state == {repository: {"created_at": "2022-01-03T00:00:00Z"} for repository in repositories}
+
+    assert 1 < max_requests_in_flight <= 6
+    assert [x.count_rest for x in authenticator._tokens.values()] == [0, 0, 10]
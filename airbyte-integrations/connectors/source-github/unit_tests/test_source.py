@@ -4,6 +4,8 @@
 
 import logging
 import os
+import subprocess
+import sys
 from unittest.mock import MagicMock
 
 import pytest
@@ -288,3 +290,16 @@ def test_user_friendly_message(error_message, expected_user_friendly_message):
     source = SourceGithub()
     user_friendly_error_message = source.user_friendly_error_message(error_message)
     assert user_friendly_error_message == expected_user_friendly_message
+
+
+def test_github_schema_is_not_imported_on_startup():
+    """The generated GraphQL schema is heavy, it should be imported only when a GraphQL query is built"""
+    code = (
+        "import sys\n"
+        "import source_github.run\n"
+        "assert 'source_github.github_schema' not in sys.modules\n"
+        "from source_github.graphql import get_query_reviews\n"
+        "get_query_reviews(owner='airbytehq', name='airbyte', first=10, after=None)\n"
+        "assert 'source_github.github_schema' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -49,7 +49,7 @@ from source_github.streams import (
     WorkflowJobs,
     WorkflowRuns,
 )
-from source_github.utils import read_full_refresh
+from source_github.utils import ETagCache, MultipleTokenAuthenticatorWithRateLimiter, read_full_refresh
 
 from airbyte_cdk.models import ConfiguredAirbyteCatalog, SyncMode
 from airbyte_cdk.sources.streams.http.error_handlers import ErrorHandler, ErrorResolution, HttpStatusErrorHandler, ResponseAction
@@ -1004,6 +1004,92 @@ def test_streams_read_full_refresh():
     assert records == [{"repository": "organization/repository", "starred_at": "2022-02-02T00:00:00Z", "user": {"id": 2}, "user_id": 2}]
 
 
+@responses.activate
+def test_streams_read_full_refresh_conditional_requests(rate_limit_mock_response):
+    etag_cache = ETagCache()
+    authenticator = MultipleTokenAuthenticatorWithRateLimiter(tokens=["token1"])
+    repository_args = {
+        "repositories": ["organization/repository"],
+        "page_size_for_large_streams": 100,
+        "authenticator": authenticator,
+        "etag_cache": etag_cache,
+    }
+    url = "https://api.github.com/repos/organization/repository/tags"
+    next_page_link = f'<{url}?per_page=100&page=2>; rel="next"'
+
+    responses.add("GET", url, json=[{"name": "v1"}], headers={"ETag": '"page-1"', "Link": next_page_link})
+    responses.add(
+        "GET",
+        url,
+        json=[{"name": "v2"}],
+        headers={"ETag": '"page-2"'},
+        match=[matchers.query_param_matcher({"per_page": "100", "page": "2"})],
+    )
+    records = list(read_full_refresh(Tags(**repository_args)))
+    assert records == [{"name": "v1", "repository": "organization/repository"}, {"name": "v2", "repository": "organization/repository"}]
+    assert authenticator._tokens["token1"].count_rest == 4998
+
+    responses.reset()
+    responses.add("GET", url, status=requests.codes.NOT_MODIFIED, match=[matchers.header_matcher({"If-None-Match": '"page-1"'})])
+    responses.add(
+        "GET",
+        url,
+        status=requests.codes.NOT_MODIFIED,
+        match=[matchers.query_param_matcher({"per_page": "100", "page": "2"}), matchers.header_matcher({"If-None-Match": '"page-2"'})],
+    )
+    assert list(read_full_refresh(Tags(**repository_args))) == records
+    assert len(responses.calls) == 2
+    # not modified responses don't count against the rate limit
+    assert authenticator._tokens["token1"].count_rest == 4998
+
+    responses.reset()
+    responses.add("GET", url, json=[{"name": "v3"}], headers={"ETag": '"page-1-changed"'})
+    assert list(read_full_refresh(Tags(**repository_args))) == [{"name": "v3", "repository": "organization/repository"}]
+    assert etag_cache.get_etag(f"{url}?per_page=100") == '"page-1-changed"'
+
+
+def test_etag_cache_persistence(tmp_path):
+    response = requests.Response()
+    response.status_code = requests.codes.OK
+    response._content = b'[{"id": 1}]'
+    response.headers["ETag"] = '"etag"'
+
+    path = tmp_path / ETagCache.FILE_NAME
+    etag_cache = ETagCache(path)
+    etag_cache.update("key", response)
+    etag_cache.save()
+
+    restored_cache = ETagCache(path)
+    assert restored_cache.get_etag("key") == '"etag"'
+    not_modified_response = requests.Response()
+    not_modified_response.status_code = requests.codes.NOT_MODIFIED
+    assert restored_cache.replay("key", not_modified_response).json() == [{"id": 1}]
+
+    path.write_text("broken")
+    assert ETagCache(path).get_etag("key") is None
+
+
+def test_etag_cache_drops_entries_not_requested_during_sync(tmp_path):
+    response = requests.Response()
+    response.status_code = requests.codes.OK
+    response._content = b'[{"id": 1}]'
+    response.headers["ETag"] = '"etag"'
+
+    path = tmp_path / ETagCache.FILE_NAME
+    etag_cache = ETagCache(path)
+    etag_cache.update("deleted repository page", response)
+    etag_cache.update("key", response)
+    etag_cache.save()
+
+    next_sync_cache = ETagCache(path)
+    assert next_sync_cache.get_etag("key") == '"etag"'
+    next_sync_cache.save()
+
+    restored_cache = ETagCache(path)
+    assert restored_cache.get_etag("key") == '"etag"'
+    assert restored_cache.get_etag("deleted repository page") is None
+
+
 @responses.activate
 def test_stream_reviews_incremental_read():
     repository_args_with_start_date = {
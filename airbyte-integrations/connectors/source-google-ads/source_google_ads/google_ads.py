@@ -4,14 +4,18 @@
 
 
 from enum import Enum
-from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 
 import backoff
+import proto
 from google.ads.googleads.client import GoogleAdsClient
 from google.ads.googleads.v18.services.types.google_ads_service import GoogleAdsRow, SearchGoogleAdsResponse
 from google.api_core.exceptions import InternalServerError, ServerError, TooManyRequests
 from google.auth import exceptions
 from google.protobuf import json_format
+from google.protobuf.descriptor import Descriptor, FieldDescriptor
 from google.protobuf.message import Message
 from proto.marshal.collections import Repeated, RepeatedComposite
 
@@ -249,9 +253,68 @@ class GoogleAds:
 
         return field_value
 
+    @staticmethod
+    def compile_field_accessor(descriptor: Descriptor, field: str) -> Optional[Callable[[Message], Any]]:
+        """
+        Build a function which reads the field value from the raw protobuf message of the row and converts it
+        the same way as `get_field_value` does, but without walking through the proto-plus wrappers for each row.
+        Returns None for the fields which need the proto-plus marshaling: unknown fields, repeated or map fields
+        in the middle of the path and well-known types like `google.protobuf.StringValue`.
+        """
+        *parent_attrs, leaf_attr = field.split(".")
+        for level_attr in parent_attrs:
+            field_descriptor = descriptor.fields_by_name.get(level_attr)
+            if (
+                not field_descriptor
+                or field_descriptor.type != FieldDescriptor.TYPE_MESSAGE
+                or field_descriptor.label == FieldDescriptor.LABEL_REPEATED
+            ):
+                return None
+            descriptor = field_descriptor.message_type
+
+        field_descriptor = descriptor.fields_by_name.get(leaf_attr)
+        if not field_descriptor:
+            return None
+        message_type = field_descriptor.message_type
+        if message_type and (message_type.full_name.startswith("google.protobuf.") or message_type.GetOptions().map_entry):
+            return None
+
+        get_value = attrgetter(field)
+        if field_descriptor.label == FieldDescriptor.LABEL_REPEATED:
+            if message_type:
+                return lambda pb: [json_format.MessageToJson(value, indent=0).replace("\n", "") for value in get_value(pb)]
+            # proto-plus gives enum members for repeated enums, which `get_field_value` writes with `str`,
+            # that is as their numbers on the Python 3.11 the connector runs on
+            return lambda pb: [str(value) for value in get_value(pb)]
+        if field_descriptor.enum_type:
+            enum_names = {value.number: value.name for value in field_descriptor.enum_type.values}
+            # unknown enum values are left as numbers, like proto-plus does
+            return lambda pb: enum_names.get(get_value(pb), get_value(pb))
+        if message_type or field_descriptor.type == FieldDescriptor.TYPE_BYTES:
+            return lambda pb: repr(get_value(pb))
+        return get_value
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def get_field_accessors(row_type: type, fields: Tuple[str, ...]) -> List[Tuple[str, Callable[[Message], Any]]]:
+        """Compile the accessors for the selected fields once per row type and query"""
+        descriptor = row_type.pb().DESCRIPTOR
+        accessors = []
+        for field in fields:
+            accessor = GoogleAds.compile_field_accessor(descriptor, field)
+            if not accessor:
+                # fall back to the proto-plus wrappers for the fields which can't be read from the raw message
+                accessor = lambda pb, field=field: GoogleAds.get_field_value(row_type.wrap(pb), field, {})
+            accessors.append((field, accessor))
+        return accessors
+
     @staticmethod
     def parse_single_result(schema: Mapping[str, Any], result: GoogleAdsRow):
         props = schema.get("properties")
         fields = GoogleAds.get_fields_from_schema(schema)
+        if isinstance(result, proto.Message):
+            row_type = type(result)
+            pb = row_type.pb(result)
+            return {field: accessor(pb) for field, accessor in GoogleAds.get_field_accessors(row_type, tuple(fields))}
         single_record = {field: GoogleAds.get_field_value(result, field, props.get(field)) for field in fields}
         return single_record
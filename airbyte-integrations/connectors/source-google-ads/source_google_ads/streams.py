@@ -4,7 +4,9 @@
 
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import tee, zip_longest
+from typing import Any, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Tuple
 
 import backoff
 import pendulum
@@ -37,8 +39,9 @@ class GoogleAdsStream(Stream, ABC):
         return query
 
     def parse_response(self, response: SearchPager, stream_slice: Optional[Mapping[str, Any]] = None) -> Iterable[Mapping]:
+        schema = self.get_json_schema()
         for result in response:
-            yield self.google_ads_client.parse_single_result(self.get_json_schema(), result)
+            yield self.google_ads_client.parse_single_result(schema, result)
 
     def stream_slices(self, stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Optional[Mapping[str, any]]]:
         for customer in self.customers:
@@ -55,9 +58,14 @@ class GoogleAdsStream(Stream, ABC):
     )
     @detached(timeout_minutes=5)
     def request_records_job(self, customer_id, login_customer_id, query, stream_slice):
-        response_records = self.google_ads_client.send_request(query=query, customer_id=customer_id, login_customer_id=login_customer_id)
+        response_records = self._send_request(query, customer_id, login_customer_id, stream_slice)
         yield from self.parse_records_with_backoff(response_records, stream_slice)
 
+    def _send_request(
+        self, query: str, customer_id: str, login_customer_id: str, stream_slice: Mapping[str, Any]
+    ) -> Iterator[SearchGoogleAdsResponse]:
+        return self.google_ads_client.send_request(query=query, customer_id=customer_id, login_customer_id=login_customer_id)
+
     def read_records(self, sync_mode, stream_slice: Optional[Mapping[str, Any]] = None, **kwargs) -> Iterable[Mapping[str, Any]]:
         if stream_slice is None:
             return []
@@ -106,6 +114,12 @@ class IncrementalGoogleAdsStream(GoogleAdsStream, CheckpointMixin, ABC):
         self._start_date = start_date
         self._end_date = end_date
         self._state = {}
+        # the date slice that follows each produced slice, and the requests for slices which are sent in advance
+        self._next_slices = {}
+        self._prefetched_requests: MutableMapping[Tuple, Tuple[str, Future]] = {}
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        # a page token expiring means slices are read slowly enough for the prefetched responses to expire as well
+        self._prefetch_enabled = True
         super().__init__(**kwargs)
 
     @property
@@ -131,6 +145,14 @@ class IncrementalGoogleAdsStream(GoogleAdsStream, CheckpointMixin, ABC):
             return default
 
     def stream_slices(self, stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Optional[MutableMapping[str, any]]]:
+        stream_slices, next_stream_slices = tee(self._date_range_slices(stream_state))
+        next(next_stream_slices, None)
+        for stream_slice, next_stream_slice in zip_longest(stream_slices, next_stream_slices):
+            if stream_slice and next_stream_slice:
+                self._next_slices[self._slice_key(stream_slice)] = next_stream_slice
+            yield stream_slice
+
+    def _date_range_slices(self, stream_state: Mapping[str, Any] = None) -> Iterable[Optional[MutableMapping[str, any]]]:
         for customer in self.customers:
             stream_state = stream_state or {}
             if stream_state.get(customer.id):
@@ -159,6 +181,40 @@ class IncrementalGoogleAdsStream(GoogleAdsStream, CheckpointMixin, ABC):
                     chunk["login_customer_id"] = customer.login_customer_id
                 yield chunk
 
+    @staticmethod
+    def _slice_key(stream_slice: Mapping[str, Any]) -> Tuple:
+        return stream_slice["customer_id"], stream_slice.get("start_date"), stream_slice.get("end_date")
+
+    def _prefetch_next_slice(self, stream_slice: Mapping[str, Any]):
+        """
+        Send the request for the date slice that follows the given one in the prefetch thread,
+        so the response stream of the next slice opens while the records of the given slice are being read.
+        """
+        next_stream_slice = self._next_slices.pop(self._slice_key(stream_slice), None)
+        if not next_stream_slice or not self._prefetch_enabled:
+            return
+        query = self.get_query(next_stream_slice)
+        future = self._prefetch_executor.submit(
+            self.google_ads_client.send_request,
+            query=query,
+            customer_id=next_stream_slice["customer_id"],
+            login_customer_id=next_stream_slice["login_customer_id"],
+        )
+        self._prefetched_requests[self._slice_key(next_stream_slice)] = (query, future)
+
+    def _cancel_prefetched_requests(self):
+        for _, future in self._prefetched_requests.values():
+            future.cancel()
+        self._prefetched_requests.clear()
+
+    def _send_request(
+        self, query: str, customer_id: str, login_customer_id: str, stream_slice: Mapping[str, Any]
+    ) -> Iterator[SearchGoogleAdsResponse]:
+        prefetched_query, future = self._prefetched_requests.pop(self._slice_key(stream_slice), (None, None))
+        if future and prefetched_query == query:
+            return future.result()
+        return super()._send_request(query, customer_id, login_customer_id, stream_slice)
+
     def _update_state(self, customer_id: str, record: MutableMapping[str, Any]):
         """Update the state based on the latest record's cursor value."""
         current_state = self.get_current_state(customer_id)
@@ -194,20 +250,32 @@ class IncrementalGoogleAdsStream(GoogleAdsStream, CheckpointMixin, ABC):
         This method is overridden to handle GoogleAdsException with EXPIRED_PAGE_TOKEN error code,
         and update `start_date` key in the `stream_slice` with the latest read record's cursor value, then retry the sync.
         """
-        while True:
-            customer_id = stream_slice and stream_slice["customer_id"]
+        if stream_slice:
+            self._prefetch_next_slice(stream_slice)
 
-            try:
-                # count records to update slice date range with latest record time when limit is hit
-                records = super().read_records(sync_mode, stream_slice=stream_slice)
-                for record in records:
-                    self._update_state(customer_id, record)
-                    yield record
-            except ExpiredPageTokenError as exception:
-                # handle expired page error that was caught in parent class by updating stream_slice
-                self._handle_expired_page_exception(exception, stream_slice, customer_id)
-            else:
-                return
+        is_read = False
+        try:
+            while True:
+                customer_id = stream_slice and stream_slice["customer_id"]
+
+                try:
+                    # count records to update slice date range with latest record time when limit is hit
+                    records = super().read_records(sync_mode, stream_slice=stream_slice)
+                    for record in records:
+                        self._update_state(customer_id, record)
+                        yield record
+                except ExpiredPageTokenError as exception:
+                    # handle expired page error that was caught in parent class by updating stream_slice
+                    self._handle_expired_page_exception(exception, stream_slice, customer_id)
+                    self._prefetch_enabled = False
+                    self._cancel_prefetched_requests()
+                else:
+                    is_read = True
+                    return
+        finally:
+            # the request of the next slice is only kept once this one is read in full
+            if not is_read:
+                self._cancel_prefetched_requests()
 
     def get_query(self, stream_slice: Mapping[str, Any] = None) -> str:
         fields = GoogleAds.get_fields_from_schema(self.get_json_schema())
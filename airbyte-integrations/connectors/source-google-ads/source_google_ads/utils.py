@@ -217,102 +217,105 @@ class RunAsThread:
     The `RunAsThread` decorator is designed to run a generator function in a separate thread with a specified timeout.
     This is particularly useful when dealing with functions that involve potentially time-consuming operations,
     and you want to enforce a time limit for their execution.
+    The values are passed to the main thread through a bounded queue, so when the consumer is slow
+    the generator function waits for it instead of buffering the whole output in memory.
     """
 
-    def __init__(self, timeout_minutes):
+    # Marks the end of the values produced by the generator function
+    _EXHAUSTED = object()
+
+    def __init__(self, timeout_minutes, queue_size: int = 1000):
         """
         :param timeout_minutes: The maximum allowed time (in minutes) for the generator function to idle.
                                 If the timeout is reached, a TimeoutError is raised.
+        :param queue_size: The maximum number of values produced by the generator function and not consumed yet.
         """
         self._timeout_seconds = timeout_minutes * 60
+        self._queue_size = queue_size
 
     def __call__(self, generator_func):
         @functools.wraps(generator_func)
         def wrapper(*args, **kwargs):
             """
             The wrapper function sets up threading components, starts a separate thread to run the generator function.
-            It uses events and a queue for communication and synchronization between the main thread and the thread running the generator function.
+            It uses an event and a queue for communication and synchronization between the main thread and the thread running the generator function.
             """
             # Event and Queue initialization
-            write_event = threading.Event()
             exit_event = threading.Event()
-            the_queue = queue.Queue()
+            the_queue = queue.Queue(maxsize=self._queue_size)
 
             # Thread initialization and start
-            thread = threading.Thread(
-                target=self.target, args=(the_queue, write_event, exit_event, generator_func, args, kwargs), daemon=True
-            )
+            thread = threading.Thread(target=self.target, args=(the_queue, exit_event, generator_func, args, kwargs), daemon=True)
             thread.start()
 
-            # Records the starting time for the timeout calculation.
-            start_time = time.time()
-            while thread.is_alive() or not the_queue.empty():
-                # The main thread waits for the `write_event` to be set or until the specified timeout.
-                if the_queue.empty():
-                    write_event.wait(self._timeout_seconds)
-                try:
-                    # The main thread yields the result obtained from reading the queue.
-                    yield self.read(the_queue)
-                    # The timer is reset since a new result has been received, preventing the timeout from occurring.
-                    start_time = time.time()
-                except queue.Empty:
-                    # If exit_event is set it means that the generator function in the thread has completed its execution.
-                    if exit_event.is_set():
-                        break
-                    # Check if the timeout has been reached without new results.
-                    if time.time() - start_time > self._timeout_seconds:
+            try:
+                while True:
+                    try:
+                        # The main thread waits for the next result until the specified timeout.
+                        value = self.read(the_queue, timeout=self._timeout_seconds)
+                    except queue.Empty:
                         # The thread may continue to run for some time after reaching a timeout and even come to life and continue working.
-                        # That is why the exit event is set to signal the generator function to stop producing data.
-                        exit_event.set()
+                        # That is why the exit event is set (see `finally`) to signal the generator function to stop producing data.
                         raise TimeoutError(f"Method '{generator_func.__name__}' timed out after {self._timeout_seconds / 60.0} minutes")
-                    # The write event is cleared to reset it for the next iteration.
-                    write_event.clear()
+                    if value is self._EXHAUSTED:
+                        break
+                    yield value
+            finally:
+                # Signal the thread to stop producing data if the main thread stops reading:
+                # on timeout, on error or when the consumer doesn't need more values.
+                exit_event.set()
 
         return wrapper
 
-    def target(self, the_queue, write_event, exit_event, func, args, kwargs):
+    def target(self, the_queue, exit_event, func, args, kwargs):
         """
         This is a target function for the thread.
         It runs the actual generator function, writing its results to a queue.
         Exceptions raised during execution are also written to the queue.
         :param the_queue: A queue used for communication between the main thread and the thread running the generator function.
-        :param write_event: An event signaling the availability of new data in the queue.
-        :param exit_event: An event indicating whether the generator function should stop producing data due to a timeout.
+        :param exit_event: An event indicating whether the generator function should stop producing data
+                           because the main thread stopped reading.
         :param func: The generator function to be executed.
         :param args: Positional arguments for the generator function.
         :param kwargs: Keyword arguments for the generator function.
         :return: None
         """
+        generator = func(*args, **kwargs)
         try:
-            for value in func(*args, **kwargs):
-                # If the timeout has been reached we must stop producing any data
-                if exit_event.is_set():
+            for value in generator:
+                # If the main thread stopped reading we must stop producing any data
+                if not self.write(the_queue, value, exit_event):
                     break
-                self.write(the_queue, value, write_event)
             else:
                 # Notify the main thread that the generator function has completed its execution.
-                exit_event.set()
-                # Notify the main thread (even if the generator didn't produce any data) to prevent waiting for no reason.
-                if not write_event.is_set():
-                    write_event.set()
+                self.write(the_queue, self._EXHAUSTED, exit_event)
         except Exception as e:
-            self.write(the_queue, e, write_event)
+            self.write(the_queue, e, exit_event)
+        finally:
+            # Release the resources held by the generator function, e.g. the open response stream.
+            generator.close()
 
     @staticmethod
-    def write(the_queue, value, write_event):
+    def write(the_queue, value, exit_event, poll_interval=0.1):
         """
-        Puts a value into the queue and sets a write event to notify the main thread that new data is available.
+        Puts a value into the queue, waiting while the queue is full.
         :param the_queue: A queue used for communication between the main thread and the thread running the generator function.
         :param value: The value to be put into the communication queue.
                       This can be any type of data produced by the generator function, including results or exceptions.
-        :param write_event: An event signaling the availability of new data in the queue.
-        :return: None
+        :param exit_event: An event indicating that the main thread stopped reading.
+        :param poll_interval: A time in seconds between the checks of the exit event while the queue is full.
+        :return: True if the value was put into the queue, False if the main thread stopped reading.
         """
-        the_queue.put(value)
-        write_event.set()
+        while not exit_event.is_set():
+            try:
+                the_queue.put(value, timeout=poll_interval)
+                return True
+            except queue.Full:
+                continue
+        return False
 
     @staticmethod
-    def read(the_queue, timeout=0.001):
+    def read(the_queue, timeout):
         """
         Retrieves a value from the queue, handling the case where the value is an exception, and raising it.
         :param the_queue: A queue used for communication between the main thread and the thread running the generator function.
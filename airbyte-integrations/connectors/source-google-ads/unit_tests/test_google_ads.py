@@ -203,6 +203,43 @@ def test_parse_single_result():
     assert response == response
 
 
+def test_parse_single_result_compiled_accessors():
+    ads_row = GoogleAdsRow(
+        campaign={"id": 5, "name": "campaign", "status": "ENABLED", "excluded_parent_asset_field_types": [2, 5]},
+        ad_group_ad={
+            "ad": {
+                "type_": "TEXT_AD",
+                "final_urls": ["http://url_one.com"],
+                "responsive_search_ad": {"headlines": [{"text": "An exciting headline"}]},
+            },
+        },
+        metrics={"clicks": 10, "ctr": 0.5},
+    )
+    fields = [
+        "campaign.id",
+        "campaign.name",
+        "campaign.status",
+        "campaign.excluded_parent_asset_field_types",
+        "campaign.network_settings",
+        "ad_group_ad.ad.type",
+        "ad_group_ad.ad.final_urls",
+        "ad_group_ad.ad.responsive_search_ad.headlines",
+        "metrics.clicks",
+        "metrics.ctr",
+        "segments.date",
+        "ad_group_ad.ad.final_urls.unknown",
+        "campaign.unknown",
+    ]
+    schema = {"properties": {field: {} for field in fields}}
+
+    response = GoogleAds.parse_single_result(schema, ads_row)
+    assert response == {field: GoogleAds.get_field_value(ads_row, field, {}) for field in fields}
+    assert response["campaign.status"] == "ENABLED"
+    assert response["campaign.excluded_parent_asset_field_types"] == ["2", "5"]
+    assert response["ad_group_ad.ad.type"] == "TEXT_AD"
+    assert response["campaign.unknown"] is None
+
+
 def test_get_fields_metadata(mocker):
     # Mock the GoogleAdsClient to return our mock client
     mocker.patch("source_google_ads.google_ads.GoogleAdsClient", MockGoogleAdsClient)
@@ -3,8 +3,10 @@
 #
 
 
+import threading
 from unittest.mock import Mock
 
+import pendulum
 import pytest
 from google.ads.googleads.errors import GoogleAdsException
 from google.ads.googleads.v18.errors.types.errors import ErrorCode, GoogleAdsError, GoogleAdsFailure
@@ -12,7 +14,7 @@ from google.ads.googleads.v18.errors.types.request_error import RequestErrorEnum
 from google.api_core.exceptions import DataLoss, InternalServerError, ResourceExhausted, TooManyRequests, Unauthenticated
 from grpc import RpcError
 from source_google_ads.google_ads import GoogleAds
-from source_google_ads.streams import AdGroup, ClickView, Customer, CustomerLabel
+from source_google_ads.streams import AdGroup, ClickView, Customer, CustomerLabel, KeywordView
 
 from airbyte_cdk.models import FailureType, SyncMode
 from airbyte_cdk.utils import AirbyteTracedException
@@ -331,3 +333,95 @@ def test_ad_group_stream_query_removes_metrics_field_for_manager(customers_manag
     stream_config = dict(api=api, customers=customers, start_date="2020-01-01", conversion_window_days=10)
     stream = AdGroup(**stream_config)
     assert "metrics" in stream.get_query(stream_slice={"customer_id": "123"})
+
+
+class MockGoogleAdsPrefetch(GoogleAds):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.queries = []
+        self.next_slice_requested = threading.Event()
+
+    def parse_single_result(self, schema, result):
+        return result
+
+    def send_request(self, query: str, customer_id: str, login_customer_id: str = "none"):
+        self.queries.append(query)
+        if len(self.queries) == 2:
+            self.next_slice_requested.set()
+        return self.response(query)
+
+    def response(self, query):
+        # the first slice isn't read until the request for the second one is sent
+        assert self.next_slice_requested.wait(timeout=5)
+        start_date = query.split("segments.date >= '")[1][:10]
+        yield [{"segments.date": start_date, "keyword_view.resource_name": start_date}]
+
+
+def test_read_records_prefetches_next_date_slice(config, customers):
+    google_api = MockGoogleAdsPrefetch(credentials=config["credentials"])
+    stream = KeywordView(api=google_api, conversion_window_days=0, start_date="2021-01-01", end_date="2021-01-05", customers=customers)
+    stream.slice_duration = stream.slice_step
+
+    stream_slices = list(stream.stream_slices(stream_state={}))
+    assert [(stream_slice["start_date"], stream_slice["end_date"]) for stream_slice in stream_slices] == [
+        ("2021-01-01", "2021-01-02"),
+        ("2021-01-03", "2021-01-04"),
+        ("2021-01-05", "2021-01-05"),
+    ]
+
+    records = []
+    for stream_slice in stream_slices:
+        records.extend(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice))
+    assert [record["segments.date"] for record in records] == ["2021-01-01", "2021-01-03", "2021-01-05"]
+    # each slice is requested once
+    assert len(google_api.queries) == 3
+
+
+def test_read_records_cancels_prefetched_request_when_stopped_early(config, customers):
+    google_api = MockGoogleAdsPrefetch(credentials=config["credentials"])
+    google_api.next_slice_requested.set()
+    stream = KeywordView(api=google_api, conversion_window_days=0, start_date="2021-01-01", end_date="2021-01-05", customers=customers)
+    stream.slice_duration = stream.slice_step
+    stream_slices = list(stream.stream_slices(stream_state={}))
+    # keep the prefetch thread busy, so the request of the next slice is still queued when the read stops
+    prefetch_thread_released = threading.Event()
+    stream._prefetch_executor.submit(prefetch_thread_released.wait)
+
+    records = stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slices[0])
+    assert next(records)["segments.date"] == "2021-01-01"
+    [(_, future)] = stream._prefetched_requests.values()
+    records.close()
+    prefetch_thread_released.set()
+
+    assert future.cancelled()
+    assert stream._prefetched_requests == {}
+
+
+class MockGoogleAdsExpiredPageToken(MockGoogleAdsPrefetch):
+    def response(self, query):
+        start_date = query.split("segments.date >= '")[1][:10]
+        yield [{"segments.date": start_date, "keyword_view.resource_name": start_date}]
+        if self.queries.count(query) == 1 and start_date == "2021-01-01":
+            yield [{"segments.date": "2021-01-02", "keyword_view.resource_name": "2021-01-02"}]
+            raise exception
+
+
+def test_read_records_stops_prefetching_after_expired_page_token(config, customers):
+    google_api = MockGoogleAdsExpiredPageToken(credentials=config["credentials"])
+    stream = KeywordView(api=google_api, conversion_window_days=0, start_date="2021-01-01", end_date="2021-01-09", customers=customers)
+    stream.slice_duration = pendulum.duration(days=3)
+    stream_slices = list(stream.stream_slices(stream_state={}))
+    assert [(stream_slice["start_date"], stream_slice["end_date"]) for stream_slice in stream_slices] == [
+        ("2021-01-01", "2021-01-04"),
+        ("2021-01-05", "2021-01-08"),
+        ("2021-01-09", "2021-01-09"),
+    ]
+
+    records = list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slices[0]))
+    assert [record["segments.date"] for record in records] == ["2021-01-01", "2021-01-02", "2021-01-02"]
+    # the next slice was prefetched before the page token expired, its request is dropped and not prefetched again
+    assert stream._prefetched_requests == {}
+
+    records = list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slices[1]))
+    assert [record["segments.date"] for record in records] == ["2021-01-05"]
+    assert stream._prefetched_requests == {}
@@ -3,13 +3,15 @@
 #
 
 
+import threading
+import time
 from datetime import datetime
 from unittest.mock import Mock
 
 import backoff
 import pytest
 from source_google_ads import SourceGoogleAds
-from source_google_ads.utils import GAQL, generator_backoff
+from source_google_ads.utils import GAQL, RunAsThread, generator_backoff
 
 from airbyte_cdk.utils import AirbyteTracedException
 
@@ -202,3 +204,69 @@ def test_generator_backoff_retries_until_success():
     # Compare each expected call with the actual call
     for expected, actual in zip(expected_calls, actual_calls):
         assert expected == actual
+
+
+def test_run_as_thread_bounded_queue():
+    produced = 0
+
+    @RunAsThread(timeout_minutes=1, queue_size=10)
+    def producer():
+        nonlocal produced
+        for value in range(1000):
+            produced += 1
+            yield value
+
+    consumed = []
+    for value in producer():
+        consumed.append(value)
+        # the producer waits for a slow consumer: only the queue and the value being written are buffered
+        assert produced - len(consumed) <= 10 + 2
+        time.sleep(0.0001)
+    assert consumed == list(range(1000))
+
+
+def test_run_as_thread_propagates_error():
+    @RunAsThread(timeout_minutes=1, queue_size=10)
+    def producer():
+        yield 1
+        raise ValueError("producer failed")
+
+    records = producer()
+    assert next(records) == 1
+    with pytest.raises(ValueError, match="producer failed"):
+        next(records)
+
+
+def test_run_as_thread_stops_producer_on_consumer_error():
+    producer_closed = threading.Event()
+
+    @RunAsThread(timeout_minutes=1, queue_size=10)
+    def producer():
+        try:
+            value = 0
+            while True:
+                value += 1
+                yield value
+        finally:
+            producer_closed.set()
+
+    with pytest.raises(RuntimeError):
+        for value in producer():
+            if value == 5:
+                raise RuntimeError("consumer failed")
+
+    # the producer blocked on the full queue notices that the consumer is gone and releases its resources
+    assert producer_closed.wait(timeout=5)
+
+
+def test_run_as_thread_timeout():
+    @RunAsThread(timeout_minutes=0.001, queue_size=10)
+    def producer():
+        yield 1
+        time.sleep(1)
+        yield 2
+
+    records = producer()
+    assert next(records) == 1
+    with pytest.raises(TimeoutError):
+        next(records)
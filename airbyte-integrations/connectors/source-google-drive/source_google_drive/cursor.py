@@ -0,0 +1,55 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+
+import logging
+from typing import Any, Iterable, Optional, Set
+
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream.cursor import DefaultFileBasedCursor
+from airbyte_cdk.sources.file_based.types import StreamState
+
+
+class GoogleDriveCursor(DefaultFileBasedCursor):
+    """
+    Keeps a Google Drive changes page token in the state next to the files history, so that following syncs only list the files
+    changed since the previous one instead of the whole folder tree.
+    """
+
+    CHANGES_PAGE_TOKEN_KEY = "changes_page_token"
+
+    def __init__(self, stream_config: FileBasedStreamConfig, **kwargs: Any):
+        super().__init__(stream_config, **kwargs)
+        # Token the changes of the current sync are listed from, None if the whole folder tree has to be listed
+        self.changes_page_token: Optional[str] = None
+        # Token the changes of the next sync will be listed from
+        self._next_changes_page_token: Optional[str] = None
+        self._pending_files: Set[str] = set()
+
+    def set_initial_state(self, value: StreamState) -> None:
+        super().set_initial_state(value)
+        self.changes_page_token = value.get(self.CHANGES_PAGE_TOKEN_KEY)
+
+    def set_next_changes_page_token(self, page_token: str) -> None:
+        self._next_changes_page_token = page_token
+
+    def get_files_to_sync(self, all_files: Iterable[RemoteFile], logger: logging.Logger) -> Iterable[RemoteFile]:
+        for file in super().get_files_to_sync(all_files, logger):
+            self._pending_files.add(file.uri)
+            yield file
+
+    def add_file(self, file: RemoteFile) -> None:
+        super().add_file(file)
+        self._pending_files.discard(file.uri)
+
+    def get_state(self) -> StreamState:
+        state = super().get_state()
+        # The next token is only saved once all the files listed from the current one are synced,
+        # otherwise the files left would not be listed again if the sync is interrupted
+        if self._next_changes_page_token and not self._pending_files:
+            state[self.CHANGES_PAGE_TOKEN_KEY] = self._next_changes_page_token
+        elif self.changes_page_token:
+            state[self.CHANGES_PAGE_TOKEN_KEY] = self.changes_page_token
+        return state
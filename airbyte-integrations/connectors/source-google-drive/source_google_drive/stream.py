@@ -0,0 +1,25 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+
+from typing import Iterable
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream import DefaultFileBasedStream
+from source_google_drive.cursor import GoogleDriveCursor
+
+
+class GoogleDriveStream(DefaultFileBasedStream):
+    def get_files(self) -> Iterable[RemoteFile]:
+        """
+        List only the files changed since the previous sync when its changes page token is in the state, the whole folder tree otherwise.
+        """
+        if not isinstance(self._cursor, GoogleDriveCursor):
+            return super().get_files()
+
+        # The token is taken before listing, so that the files changed while listing are picked up by the next sync
+        self._cursor.set_next_changes_page_token(self.stream_reader.get_changes_start_page_token())
+        if self._cursor.changes_page_token:
+            return self.stream_reader.get_changed_files(self.config.globs or [], self._cursor.changes_page_token, self.logger)
+        return super().get_files()
@@ -7,10 +7,12 @@ import io
 import json
 import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from io import IOBase
 from os.path import getsize
-from typing import Dict, Iterable, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from google.oauth2 import credentials, service_account
 from googleapiclient.discovery import build
@@ -35,6 +37,8 @@ GOOGLE_SPREADSHEET_MIME_TYPE = "application/vnd.google-apps.spreadsheet"
 GOOGLE_DRAWING_MIME_TYPE = "application/vnd.google-apps.drawing"
 EXPORTABLE_DOCUMENTS_MIME_TYPES = [GOOGLE_DOC_MIME_TYPE, GOOGLE_PRESENTATION_MIME_TYPE, GOOGLE_DRAWING_MIME_TYPE]
 
+FILE_FIELDS = "id, name, modifiedTime, mimeType, webViewLink, driveId, createdTime, size"
+
 EXPORT_MEDIA_MIME_TYPE_DOC = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
 EXPORT_MEDIA_MIME_TYPE_SPREADSHEET = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 EXPORT_MEDIA_MIME_TYPE_PRESENTATION = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
@@ -67,6 +71,8 @@ class GoogleDriveRemoteFile(RemoteFile):
     # Only populated for items in shared drives.
     drive_id: Optional[str] = None
     created_at: datetime
+    # Size in bytes as listed by the Google Drive API, not populated for items without content such as shortcuts.
+    size: Optional[int] = None
 
     @property
     def url(self) -> str:
@@ -77,10 +83,15 @@ class GoogleDriveRemoteFile(RemoteFile):
 
 class SourceGoogleDriveStreamReader(AbstractFileBasedStreamReader):
     FILE_SIZE_LIMIT = 1_500_000_000
+    # Number of folders listed at the same time
+    FOLDER_LISTING_WORKERS = 4
 
     def __init__(self):
         super().__init__()
         self._drive_service = None
+        self._root_folder = None
+        # Google Drive clients of the folder listing threads
+        self._thread_local = threading.local()
 
     @property
     def config(self) -> SourceGoogleDriveSpec:
@@ -133,29 +144,17 @@ class SourceGoogleDriveStreamReader(AbstractFileBasedStreamReader):
         """
         Get all files matching the specified glob patterns.
         """
-        service = self.google_drive_service
         root_folder_id = get_folder_id(self.config.folder_url)
         # ignore prefix argument as it's legacy only and this is a new connector
         prefixes = self.get_prefixes_from_globs(globs)
 
-        folder_id_queue = [("", root_folder_id)]
         seen: Set[str] = set()
-        while len(folder_id_queue) > 0:
-            (path, folder_id) = folder_id_queue.pop()
-            # fetch all files in this folder (1000 is the max page size)
-            # supportsAllDrives and includeItemsFromAllDrives are required to access files in shared drives
-            # ref https://developers.google.com/workspace/drive/api/reference/rest/v3/files#File
-            request = service.files().list(
-                q=f"'{folder_id}' in parents",
-                pageSize=1000,
-                fields="nextPageToken, files(id, name, modifiedTime, mimeType, webViewLink, driveId, createdTime)",
-                supportsAllDrives=True,
-                includeItemsFromAllDrives=True,
-            )
-            while True:
-                results = request.execute()
-                new_files = results.get("files", [])
-                for new_file in new_files:
+        # the folders are listed concurrently as soon as they are found, and their files are processed in the order of a sequential listing
+        with ThreadPoolExecutor(max_workers=self.FOLDER_LISTING_WORKERS) as executor:
+            folder_listings: List[Tuple[str, Future]] = [("", executor.submit(self._list_folder, root_folder_id))]
+            while len(folder_listings) > 0:
+                (path, folder_listing) = folder_listings.pop()
+                for new_file in folder_listing.result():
                     # It's possible files and folders are linked up multiple times, this prevents us from getting stuck in a loop
                     if new_file["id"] in seen:
                         continue
@@ -167,32 +166,131 @@ class SourceGoogleDriveStreamReader(AbstractFileBasedStreamReader):
                         prefix_matches_folder_name = any(prefix.startswith(folder_name) for prefix in prefixes)
                         folder_name_matches_prefix = any(folder_name.startswith(prefix) for prefix in prefixes)
                         if prefix_matches_folder_name or folder_name_matches_prefix or len(prefixes) == 0:
-                            folder_id_queue.append((folder_name, new_file["id"]))
+                            folder_listings.append((folder_name, executor.submit(self._list_folder, new_file["id"])))
                         continue
                     else:
-                        last_modified = datetime.strptime(new_file["modifiedTime"], "%Y-%m-%dT%H:%M:%S.%fZ")
-                        created_at = datetime.strptime(new_file["createdTime"], "%Y-%m-%dT%H:%M:%S.%fZ")
-                        original_mime_type = new_file["mimeType"]
-                        mime_type = (
-                            self._get_export_mime_type(original_mime_type)
-                            if self._is_exportable_document(original_mime_type)
-                            else original_mime_type
-                        )
-                        remote_file = GoogleDriveRemoteFile(
-                            uri=file_name,
-                            last_modified=last_modified,
-                            created_at=created_at,
-                            id=new_file["id"],
-                            original_mime_type=original_mime_type,
-                            mime_type=mime_type,
-                            drive_id=new_file.get("driveId"),
-                            view_link=new_file.get("webViewLink"),
-                        )
+                        remote_file = self._to_remote_file(new_file, file_name)
                         if self.file_matches_globs(remote_file, globs):
                             yield remote_file
-                request = service.files().list_next(request, results)
-                if request is None:
-                    break
+
+    def _list_folder(self, folder_id: str) -> List[Dict[str, Any]]:
+        """
+        Fetch all files in the folder, with the Google Drive client of the current thread as the clients are not thread-safe.
+        """
+        if not hasattr(self._thread_local, "drive_service"):
+            self._thread_local.drive_service = self._build_google_service("drive", "v3")
+        service = self._thread_local.drive_service
+
+        # 1000 is the max page size
+        # supportsAllDrives and includeItemsFromAllDrives are required to access files in shared drives
+        # ref https://developers.google.com/workspace/drive/api/reference/rest/v3/files#File
+        request = service.files().list(
+            q=f"'{folder_id}' in parents",
+            pageSize=1000,
+            fields=f"nextPageToken, files({FILE_FIELDS})",
+            supportsAllDrives=True,
+            includeItemsFromAllDrives=True,
+        )
+        files = []
+        while request is not None:
+            results = request.execute()
+            files.extend(results.get("files", []))
+            request = service.files().list_next(request, results)
+        return files
+
+    def get_changes_start_page_token(self) -> str:
+        """
+        Returns the token to list the changes made to the drive of the folder from now on with `get_changed_files`.
+        ref: https://developers.google.com/workspace/drive/api/reference/rest/v3/changes/getStartPageToken
+        """
+        return self.google_drive_service.changes().getStartPageToken(**self._drive_params()).execute()["startPageToken"]
+
+    def get_changed_files(self, globs: List[str], page_token: str, logger: logging.Logger) -> Iterable[RemoteFile]:
+        """
+        Get the files matching the specified glob patterns which changed in the folder tree since the page token was taken.
+        The whole folder tree is listed instead if a folder in it changed, as the paths of the files below it may have changed too.
+        ref: https://developers.google.com/workspace/drive/api/reference/rest/v3/changes/list
+        """
+        service = self.google_drive_service
+        # path of each folder seen in the changes, relative to the folder of the source, None if the folder is outside of it
+        folder_paths: Dict[str, Optional[str]] = {self._get_root_folder()["id"]: ""}
+        changed_files: Dict[str, RemoteFile] = {}
+        while page_token:
+            results = (
+                service.changes()
+                .list(
+                    pageToken=page_token,
+                    pageSize=1000,
+                    fields=f"nextPageToken, changes(removed, file({FILE_FIELDS}, parents))",
+                    includeItemsFromAllDrives=True,
+                    **self._drive_params(),
+                )
+                .execute()
+            )
+            for change in results.get("changes", []):
+                changed_file = change.get("file")
+                if change.get("removed") or not changed_file:
+                    continue
+                folder_path = self._get_parents_path(changed_file.get("parents", []), folder_paths)
+                if folder_path is None:
+                    continue
+                if changed_file["mimeType"] == FOLDER_MIME_TYPE:
+                    logger.info(f"Folder {folder_path}{changed_file['name']} changed, listing all the files of the folder tree.")
+                    yield from self.get_matching_files(globs, None, logger)
+                    return
+                remote_file = self._to_remote_file(changed_file, folder_path + changed_file["name"])
+                if self.file_matches_globs(remote_file, globs):
+                    # a file changed several times is listed once, with its latest metadata
+                    changed_files[remote_file.id] = remote_file
+            page_token = results.get("nextPageToken")
+        yield from changed_files.values()
+
+    def _get_root_folder(self) -> Dict[str, str]:
+        if self._root_folder is None:
+            self._root_folder = (
+                self.google_drive_service.files()
+                .get(fileId=get_folder_id(self.config.folder_url), fields="id, driveId", supportsAllDrives=True)
+                .execute()
+            )
+        return self._root_folder
+
+    def _drive_params(self) -> Dict[str, Any]:
+        # changes of shared drives are only listed for the drive they are requested for
+        drive_id = self._get_root_folder().get("driveId")
+        return {"supportsAllDrives": True, "driveId": drive_id} if drive_id else {"supportsAllDrives": True}
+
+    def _get_parents_path(self, parent_ids: List[str], folder_paths: Dict[str, Optional[str]]) -> Optional[str]:
+        """
+        Returns the path of the first parent folder inside the folder of the source, None if there is none.
+        The folders not already in `folder_paths` are fetched along with their own parents and added to it.
+        """
+        for parent_id in parent_ids:
+            if parent_id not in folder_paths:
+                folder = (
+                    self.google_drive_service.files().get(fileId=parent_id, fields="id, name, parents", supportsAllDrives=True).execute()
+                )
+                parent_path = self._get_parents_path(folder.get("parents", []), folder_paths)
+                folder_paths[parent_id] = None if parent_path is None else f"{parent_path}{folder['name']}/"
+            if folder_paths[parent_id] is not None:
+                return folder_paths[parent_id]
+        return None
+
+    def _to_remote_file(self, drive_file: Dict[str, Any], file_name: str) -> GoogleDriveRemoteFile:
+        original_mime_type = drive_file["mimeType"]
+        mime_type = (
+            self._get_export_mime_type(original_mime_type) if self._is_exportable_document(original_mime_type) else original_mime_type
+        )
+        return GoogleDriveRemoteFile(
+            uri=file_name,
+            last_modified=datetime.strptime(drive_file["modifiedTime"], "%Y-%m-%dT%H:%M:%S.%fZ"),
+            created_at=datetime.strptime(drive_file["createdTime"], "%Y-%m-%dT%H:%M:%S.%fZ"),
+            id=drive_file["id"],
+            original_mime_type=original_mime_type,
+            mime_type=mime_type,
+            drive_id=drive_file.get("driveId"),
+            view_link=drive_file.get("webViewLink"),
+            size=drive_file.get("size"),
+        )
 
     def _is_exportable_document(self, mime_type: str):
         """
@@ -242,7 +340,7 @@ class SourceGoogleDriveStreamReader(AbstractFileBasedStreamReader):
 
     def file_size(self, file: GoogleDriveRemoteFile) -> int:
         """
-        Retrieves the size of a file in Google Drive.
+        Returns the size of a file in Google Drive, as listed with the file or else retrieved from its metadata.
 
         Args:
             file (RemoteFile): The file to get the size for.
@@ -251,6 +349,8 @@ class SourceGoogleDriveStreamReader(AbstractFileBasedStreamReader):
             int: The file size in bytes.
         ref: https://developers.google.com/drive/api/reference/rest/v3/files/get
         """
+        if file.size is not None:
+            return file.size
         try:
             file_metadata = self.google_drive_service.files().get(fileId=file.id, fields="size", supportsAllDrives=True).execute()
             return int(file_metadata["size"])
@@ -0,0 +1,37 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+
+import datetime
+from unittest.mock import MagicMock
+
+from source_google_drive.cursor import GoogleDriveCursor
+
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+
+
+def test_changes_page_token_is_saved_once_listed_files_are_synced():
+    cursor = GoogleDriveCursor(FileBasedStreamConfig(name="test", format=JsonlFormat()))
+    cursor.set_initial_state({"history": {}, "changes_page_token": "1"})
+    assert cursor.changes_page_token == "1"
+
+    cursor.set_next_changes_page_token("2")
+    files = [RemoteFile(uri=uri, last_modified=datetime.datetime(2021, 1, 1)) for uri in ("a.csv", "b.csv")]
+    files_to_sync = list(cursor.get_files_to_sync(files, MagicMock()))
+    assert files_to_sync == files
+
+    cursor.add_file(files[0])
+    assert cursor.get_state()["changes_page_token"] == "1"
+
+    cursor.add_file(files[1])
+    assert cursor.get_state()["changes_page_token"] == "2"
+
+
+def test_no_changes_page_token_before_first_listing():
+    cursor = GoogleDriveCursor(FileBasedStreamConfig(name="test", format=JsonlFormat()))
+    cursor.set_initial_state({})
+
+    assert "changes_page_token" not in cursor.get_state()
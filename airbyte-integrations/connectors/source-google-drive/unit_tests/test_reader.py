@@ -4,13 +4,14 @@
 
 
 import datetime
+import threading
 from os import path
 from typing import Dict
 from unittest.mock import ANY, MagicMock, call, patch
 
 import pytest
 from source_google_drive.spec import ServiceAccountCredentials, SourceGoogleDriveSpec
-from source_google_drive.stream_reader import GoogleDriveRemoteFile, SourceGoogleDriveStreamReader
+from source_google_drive.stream_reader import FOLDER_MIME_TYPE, GoogleDriveRemoteFile, SourceGoogleDriveStreamReader
 
 from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
 from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
@@ -51,6 +52,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             }
                         ]
@@ -64,6 +66,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
                 )
             ],
@@ -80,6 +83,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -87,6 +91,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/def/view?usp=drivesdk",
                             },
                         ]
@@ -100,6 +105,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
                 ),
                 GoogleDriveRemoteFile(
@@ -108,6 +114,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/def/view?usp=drivesdk",
                 ),
             ],
@@ -124,6 +131,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             }
                         ]
@@ -135,6 +143,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/def/view?usp=drivesdk",
                             }
                         ]
@@ -148,6 +157,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
                 ),
                 GoogleDriveRemoteFile(
@@ -156,6 +166,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/def/view?usp=drivesdk",
                 ),
             ],
@@ -182,6 +193,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -189,6 +201,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                         ]
@@ -203,6 +216,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/def/view?usp=drivesdk",
                             },
                             {
@@ -210,6 +224,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subsubfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/subsub/view?usp=drivesdk",
                             },
                         ]
@@ -224,6 +239,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "yet_another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/ghi/view?usp=drivesdk",
                             },
                         ]
@@ -237,6 +253,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
                 ),
                 GoogleDriveRemoteFile(
@@ -245,6 +262,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/def/view?usp=drivesdk",
                 ),
                 GoogleDriveRemoteFile(
@@ -253,6 +271,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/ghi/view?usp=drivesdk",
                 ),
             ],
@@ -269,6 +288,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -276,6 +296,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                         ]
@@ -290,6 +311,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -297,6 +319,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subsubfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/subsub/view?usp=drivesdk",
                             },
                         ]
@@ -311,6 +334,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -318,6 +342,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "link_to_subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                         ]
@@ -331,6 +356,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
                 ),
             ],
@@ -347,6 +373,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -354,6 +381,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                         ]
@@ -368,6 +396,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/def/view?usp=drivesdk",
                             },
                             {
@@ -375,6 +404,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/jsonl",
                                 "name": "non_matching.jsonl",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/ghi/view?usp=drivesdk",
                             },
                         ]
@@ -388,6 +418,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/def/view?usp=drivesdk",
                 ),
             ],
@@ -404,6 +435,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -411,6 +443,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                             # This won't get queued because it has no chance of matching the glob
@@ -419,6 +452,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "ignored_subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                         ]
@@ -433,6 +467,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/def/view?usp=drivesdk",
                             },
                             # This will get queued because it matches the prefix (event though it can't match the glob)
@@ -441,6 +476,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subsubfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/subsub/view?usp=drivesdk",
                             },
                         ]
@@ -455,6 +491,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "yet_another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/ghi/view?usp=drivesdk",
                             },
                         ]
@@ -468,6 +505,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/def/view?usp=drivesdk",
                 ),
             ],
@@ -484,6 +522,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "test.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             },
                             {
@@ -491,6 +530,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/sub/view?usp=drivesdk",
                             },
                         ]
@@ -505,6 +545,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/def/view?usp=drivesdk",
                             },
                             # This will get queued because it matches the prefix (event though it can't match the glob)
@@ -513,6 +554,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "subsubfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/subsub/view?usp=drivesdk",
                             },
                         ]
@@ -527,6 +569,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "text/csv",
                                 "name": "yet_another_file.csv",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/ghi/view?usp=drivesdk",
                             },
                             # This will get queued because it matches the prefix (event though it can't match the glob)
@@ -535,6 +578,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.folder",
                                 "name": "ignored_subsubsubfolder",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/subsubsub/view?usp=drivesdk",
                             },
                         ]
@@ -549,6 +593,7 @@ def flatten_list(list_of_lists):
                     mime_type="text/csv",
                     original_mime_type="text/csv",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/ghi/view?usp=drivesdk",
                 ),
             ],
@@ -565,6 +610,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.document",
                                 "name": "MyDoc",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/document/d/abc/edit?usp=drivesdk",
                             }
                         ]
@@ -578,6 +624,7 @@ def flatten_list(list_of_lists):
                     original_mime_type="application/vnd.google-apps.document",
                     mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/document/d/abc/edit?usp=drivesdk",
                 )
             ],
@@ -594,6 +641,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.presentation",
                                 "name": "MySlides",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/presentation/d/abc/edit?usp=drivesdk",
                             }
                         ]
@@ -607,6 +655,7 @@ def flatten_list(list_of_lists):
                     original_mime_type="application/vnd.google-apps.presentation",
                     mime_type="application/pdf",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/presentation/d/abc/edit?usp=drivesdk",
                 )
             ],
@@ -623,6 +672,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.drawing",
                                 "name": "MyDrawing",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/drawings/d/abc/edit?usp=drivesdk",
                             }
                         ]
@@ -636,6 +686,7 @@ def flatten_list(list_of_lists):
                     original_mime_type="application/vnd.google-apps.drawing",
                     mime_type="application/pdf",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/drawings/d/abc/edit?usp=drivesdk",
                 )
             ],
@@ -652,6 +703,7 @@ def flatten_list(list_of_lists):
                                 "mimeType": "application/vnd.google-apps.video",
                                 "name": "MyVideo",
                                 "modifiedTime": "2021-01-01T00:00:00.000Z",
+                                "createdTime": "2021-01-01T00:00:00.000Z",
                                 "webViewLink": "https://docs.google.com/file/d/abc/view?usp=drivesdk",
                             }
                         ]
@@ -665,6 +717,7 @@ def flatten_list(list_of_lists):
                     original_mime_type="application/vnd.google-apps.video",
                     mime_type="application/vnd.google-apps.video",
                     last_modified=datetime.datetime(2021, 1, 1),
+                    created_at=datetime.datetime(2021, 1, 1),
                     view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
                 )
             ],
@@ -708,6 +761,7 @@ def test_matching_files(mock_build_service, mock_service_account, glob, listing_
                 mime_type="text/csv",
                 original_mime_type="text/csv",
                 last_modified=datetime.datetime(2021, 1, 1),
+                created_at=datetime.datetime(2021, 1, 1),
                 view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
             ),
             b"test",
@@ -725,6 +779,7 @@ def test_matching_files(mock_build_service, mock_service_account, glob, listing_
                 mime_type="text/csv",
                 original_mime_type="text/csv",
                 last_modified=datetime.datetime(2021, 1, 1),
+                created_at=datetime.datetime(2021, 1, 1),
                 view_link=f"https://docs.google.com/file/d/abc/view?usp=drivesdk",
             ),
             b"test",
@@ -742,6 +797,7 @@ def test_matching_files(mock_build_service, mock_service_account, glob, listing_
                 mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 original_mime_type="application/vnd.google-apps.document",
                 last_modified=datetime.datetime(2021, 1, 1),
+                created_at=datetime.datetime(2021, 1, 1),
                 view_link=f"https://docs.google.com/document/d/abc/edit?usp=drivesdk",
             ),
             b"test",
@@ -812,6 +868,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="some/path/in/source/test.jsonl",
                 last_modified=datetime.datetime(2023, 10, 16, 6, 16, 6),
+                created_at=datetime.datetime(2023, 10, 16, 6, 16, 6),
                 mime_type="application/octet-stream",
                 id="1",
                 original_mime_type="application/octet-stream",
@@ -832,6 +889,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="subfolder/test2.jsonl",
                 last_modified=datetime.datetime(2023, 10, 19, 1, 43, 56),
+                created_at=datetime.datetime(2023, 10, 19, 1, 43, 56),
                 mime_type="application/octet-stream",
                 id="test2",
                 original_mime_type="application/octet-stream",
@@ -852,6 +910,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="testdoc_docx.docx",
                 last_modified=datetime.datetime(2023, 10, 27, 0, 45, 54),
+                created_at=datetime.datetime(2023, 10, 27, 0, 45, 54),
                 mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 id="testdoc_docx",
                 original_mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
@@ -868,6 +927,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="testdoc_pdf.pdf",
                 last_modified=datetime.datetime(2023, 10, 27, 0, 45, 58),
+                created_at=datetime.datetime(2023, 10, 27, 0, 45, 58),
                 mime_type="application/pdf",
                 id="testdoc_pdf",
                 original_mime_type="application/pdf",
@@ -884,6 +944,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="testdoc_ocr_pdf.pdf",
                 last_modified=datetime.datetime(2023, 10, 27, 0, 46, 4),
+                created_at=datetime.datetime(2023, 10, 27, 0, 46, 4),
                 mime_type="application/pdf",
                 id="testdoc_ocr_pdf",
                 original_mime_type="application/pdf",
@@ -900,6 +961,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="testdoc_google",
                 last_modified=datetime.datetime(2023, 11, 10, 13, 46, 18, 551000),
+                created_at=datetime.datetime(2023, 11, 10, 13, 46, 18, 551000),
                 mime_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
                 id="testdoc_google",
                 original_mime_type="application/vnd.google-apps.document",
@@ -916,6 +978,7 @@ def test_open_file(
             GoogleDriveRemoteFile(
                 uri="testdoc_presentation",
                 last_modified=datetime.datetime(2023, 11, 10, 13, 49, 6, 640000),
+                created_at=datetime.datetime(2023, 11, 10, 13, 49, 6, 640000),
                 mime_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
                 id="testdoc_presentation",
                 original_mime_type="application/vnd.google-apps.presentation",
@@ -991,7 +1054,7 @@ def test_upload_file(
         assert expected_paths["file_relative_path"] == file_reference.source_file_relative_path
         assert file.mime_type == file_record_data.mime_type
 
-        assert path.basename(expected_paths["staging_file_url"]) == file_record_data.filename
+        assert path.basename(expected_paths["staging_file_url"]) == file_record_data.file_name
         assert path.dirname(expected_paths["staging_file_url"].replace(f"{TEST_LOCAL_DIRECTORY}/", "")) == file_record_data.folder
 
         assert mock_downloader.next_chunk.call_count == 2
@@ -1010,6 +1073,7 @@ def test_upload_file(
             GoogleDriveRemoteFile(
                 uri="test.csv",
                 last_modified=datetime.datetime(2023, 10, 16, 6, 16, 6),
+                created_at=datetime.datetime(2023, 10, 16, 6, 16, 6),
                 mime_type="text/csv",
                 id="123",
                 original_mime_type="text/csv",
@@ -1022,6 +1086,7 @@ def test_upload_file(
             GoogleDriveRemoteFile(
                 uri="shared_drive_test.csv",
                 last_modified=datetime.datetime(2023, 10, 16, 6, 16, 6),
+                created_at=datetime.datetime(2023, 10, 16, 6, 16, 6),
                 mime_type="text/csv",
                 id="456",
                 original_mime_type="text/csv",
@@ -1071,3 +1136,141 @@ def test_source_uri_format(
 
     file_record_data, _ = create_reader().upload(file, local_directory=TEST_LOCAL_DIRECTORY, logger=MagicMock())
     assert file_record_data.source_uri == expected_source_uri
+
+
+class FakeDriveService:
+    """
+    In memory Drive API serving the files and changes listings, counting the requests made to each method.
+    """
+
+    def __init__(self, files, changes=None, on_list=None):
+        self.drive_files = {drive_file["id"]: drive_file for drive_file in files}
+        self.drive_changes = changes or {}
+        # called with the query of each files listing
+        self.on_list = on_list
+        self.calls = {"files.list": 0, "files.get": 0, "changes.list": 0, "changes.getStartPageToken": 0}
+
+    def _request(self, method, result):
+        self.calls[method] += 1
+        return MagicMock(execute=MagicMock(return_value=result))
+
+    def _list(self, q):
+        if self.on_list:
+            self.on_list(q)
+        return self._request(
+            "files.list", {"files": [f for f in self.drive_files.values() if f"'{f.get('parents', [None])[0]}' in parents" == q]}
+        )
+
+    def files(self):
+        service = MagicMock()
+        service.list.side_effect = lambda q, **kwargs: self._list(q)
+        service.list_next.return_value = None
+        service.get.side_effect = lambda fileId, **kwargs: self._request("files.get", self.drive_files[fileId])
+        return service
+
+    def changes(self):
+        service = MagicMock()
+        service.getStartPageToken.side_effect = lambda **kwargs: self._request("changes.getStartPageToken", {"startPageToken": "2"})
+        service.list.side_effect = lambda pageToken, **kwargs: self._request("changes.list", self.drive_changes[pageToken])
+        return service
+
+
+def drive_file(file_id, name, parent_id, mime_type="text/csv"):
+    return {
+        "id": file_id,
+        "name": name,
+        "parents": [parent_id],
+        "mimeType": mime_type,
+        "modifiedTime": "2021-01-01T00:00:00.000Z",
+        "createdTime": "2021-01-01T00:00:00.000Z",
+        "webViewLink": f"https://docs.google.com/file/d/{file_id}/view?usp=drivesdk",
+        "size": "1024",
+    }
+
+
+@pytest.fixture
+def drive_files():
+    # 1Z2Q3 is the folder of the source, other_folder is outside of it
+    return [
+        {"id": "1Z2Q3", "name": "root", "mimeType": FOLDER_MIME_TYPE},
+        drive_file("a", "a.csv", "1Z2Q3"),
+        drive_file("subfolder", "subfolder", "1Z2Q3", mime_type=FOLDER_MIME_TYPE),
+        drive_file("b", "b.csv", "subfolder"),
+        drive_file("c", "c.csv", "subfolder"),
+        {"id": "other_folder", "name": "other", "mimeType": FOLDER_MIME_TYPE},
+        drive_file("d", "d.csv", "other_folder"),
+    ]
+
+
+@patch("source_google_drive.stream_reader.service_account")
+@patch("source_google_drive.stream_reader.build")
+def test_changed_files(mock_build_service, mock_service_account, drive_files):
+    changes = {
+        "1": {"changes": [{"file": drive_files[3]}, {"file": drive_files[6]}], "nextPageToken": "1-2"},
+        "1-2": {"changes": [{"removed": True}, {"file": {**drive_files[3], "modifiedTime": "2021-01-02T00:00:00.000Z"}}]},
+    }
+    drive_service = FakeDriveService(drive_files, changes)
+    mock_build_service.return_value = drive_service
+    reader = create_reader()
+
+    changed_files = list(reader.get_changed_files(["**"], "1", MagicMock()))
+
+    assert [(changed_file.uri, changed_file.last_modified) for changed_file in changed_files] == [
+        ("subfolder/b.csv", datetime.datetime(2021, 1, 2))
+    ]
+    assert changed_files[0] == next(f for f in reader.get_matching_files(["**"], None, MagicMock()) if f.id == "b").copy(
+        update={"last_modified": datetime.datetime(2021, 1, 2)}
+    )
+    # changes of each folder tree are resolved once, without listing the folders
+    assert drive_service.calls["changes.list"] == 2
+    assert drive_service.calls["files.get"] == 3
+
+
+@patch("source_google_drive.stream_reader.service_account")
+@patch("source_google_drive.stream_reader.build")
+def test_changed_folder_lists_folder_tree(mock_build_service, mock_service_account, drive_files):
+    changes = {"1": {"changes": [{"file": drive_files[3]}, {"file": {**drive_files[2], "name": "renamed"}}]}}
+    drive_service = FakeDriveService(drive_files, changes)
+    mock_build_service.return_value = drive_service
+    reader = create_reader()
+
+    changed_files = list(reader.get_changed_files(["**"], "1", MagicMock()))
+
+    assert [changed_file.uri for changed_file in changed_files] == ["a.csv", "subfolder/b.csv", "subfolder/c.csv"]
+    assert drive_service.calls["files.list"] == 2
+
+
+@patch("source_google_drive.stream_reader.service_account")
+@patch("source_google_drive.stream_reader.build")
+def test_matching_files_lists_sibling_folders_concurrently(mock_build_service, mock_service_account, drive_files):
+    drive_files += [drive_file("subfolder2", "subfolder2", "1Z2Q3", mime_type=FOLDER_MIME_TYPE), drive_file("e", "e.csv", "subfolder2")]
+    # both sibling folders have to be listed at the same time for the barrier to be passed
+    barrier = threading.Barrier(2, timeout=10)
+
+    def on_list(q):
+        if q in ("'subfolder' in parents", "'subfolder2' in parents"):
+            barrier.wait()
+
+    drive_service = FakeDriveService(drive_files, on_list=on_list)
+    mock_build_service.return_value = drive_service
+    reader = create_reader()
+
+    found_files = list(reader.get_matching_files(["**"], None, MagicMock()))
+
+    assert [found_file.uri for found_file in found_files] == ["a.csv", "subfolder2/e.csv", "subfolder/b.csv", "subfolder/c.csv"]
+    assert drive_service.calls["files.list"] == 3
+    # a client is built for each listing thread
+    assert 1 < mock_build_service.call_count <= SourceGoogleDriveStreamReader.FOLDER_LISTING_WORKERS
+
+
+@patch("source_google_drive.stream_reader.service_account")
+@patch("source_google_drive.stream_reader.build")
+def test_file_size_is_listed(mock_build_service, mock_service_account, drive_files):
+    drive_service = FakeDriveService(drive_files)
+    mock_build_service.return_value = drive_service
+    reader = create_reader()
+
+    file_sizes = [reader.file_size(found_file) for found_file in reader.get_matching_files(["**"], None, MagicMock())]
+
+    assert file_sizes == [1024, 1024, 1024]
+    assert drive_service.calls["files.get"] == 0
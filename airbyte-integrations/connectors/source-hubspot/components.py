@@ -3,9 +3,12 @@
 #
 
 import logging
+import numbers
+import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import InitVar, dataclass, field
-from datetime import timedelta
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Union
+from datetime import timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, Union
 
 import dpath
 import requests
@@ -33,12 +36,28 @@ from airbyte_cdk.sources.declarative.requesters.requester import Requester
 from airbyte_cdk.sources.declarative.schema.schema_loader import SchemaLoader
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
 from airbyte_cdk.sources.types import Config, Record, StreamSlice, StreamState
+from airbyte_cdk.sources.utils.schema_helpers import expand_refs
 from airbyte_cdk.sources.utils.transform import TransformConfig, TypeTransformer
 from airbyte_cdk.utils.datetime_helpers import AirbyteDateTime, ab_datetime_format, ab_datetime_now, ab_datetime_parse
 
 
 logger = logging.getLogger("airbyte")
 
+# Matches the ISO 8601 datetime strings returned by the HubSpot API, e.g. "2021-01-10T00:00:00.000Z"
+ISO_DATETIME_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?(Z|[+-]\d{2}:\d{2})?")
+
+# Checks of the jsonschema Draft 7 types, used to report values that do not conform to the schema after normalization
+JSON_SCHEMA_TYPE_CHECKS = {
+    "array": lambda value: isinstance(value, list),
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": lambda value: not isinstance(value, bool) and (isinstance(value, int) or (isinstance(value, float) and value.is_integer())),
+    "null": lambda value: value is None,
+    "number": lambda value: isinstance(value, numbers.Number) and not isinstance(value, bool),
+    "object": lambda value: isinstance(value, dict),
+    "string": lambda value: isinstance(value, str),
+}
+JSON_SCHEMA_PYTHON_TYPES = {"array": list, "boolean": bool, "null": type(None), "object": dict, "string": str}
+
 
 @dataclass
 class NewtoLegacyFieldTransformation(RecordTransformation):
@@ -345,6 +364,169 @@ class EntitySchemaNormalization(TypeTransformer):
         config = TransformConfig.CustomSchemaNormalization
         super().__init__(config)
         self.registerCustomTransform(self.get_transform_function())
+        # compiled schemas by id, the schema is kept alongside so that a reused id is not mistaken for the same schema
+        self._compiled_schemas: Dict[int, Tuple[Mapping[str, Any], Any]] = {}
+        self._datetime_parser = DatetimeParser()
+
+    def transform(self, record: Dict[str, Any], schema: Mapping[str, Any]) -> None:
+        """
+        Normalizes the record the same way as the jsonschema traversal of TypeTransformer does, but with the cast of every
+        property resolved once per schema, so records with hundreds of properties are normalized in a single pass.
+        Schemas which can't be compiled are normalized by TypeTransformer.
+        """
+        cached_schema, compiled_schema = self._compiled_schemas.get(id(schema), (None, None))
+        if cached_schema is not schema:
+            compiled_schema = self._compile_schema(schema)
+            self._compiled_schemas[id(schema)] = (schema, compiled_schema)
+        if compiled_schema is None:
+            super().transform(record, schema)
+            return
+
+        type_check, normalize = compiled_schema
+        if type_check and not type_check(record):
+            self._log_type_error(record, schema["type"], ())
+        if normalize:
+            normalize(record, ())
+
+    def _compile_schema(self, schema: Mapping[str, Any]) -> Optional[Tuple[Optional[Callable[[Any], bool]], Optional[Callable]]]:
+        expand_refs(schema)
+        try:
+            return self._compile_type_check(schema), self._compile_normalizer(schema)
+        except ValueError as e:
+            logger.debug(f"Falling back to the jsonschema normalization: {e}")
+            return None
+
+    def _compile_normalizer(self, schema: Mapping[str, Any]) -> Optional[Callable[[Any, Tuple[Union[str, int], ...]], None]]:
+        """
+        Compiles the function which casts and type checks the nested values of an object or array in place.
+        Returns None if the schema has no nested values.
+        """
+        properties = [
+            (
+                key,
+                self._compile_cast(subschema),
+                self._compile_type_check(subschema),
+                subschema.get("type"),
+                self._compile_normalizer(subschema),
+            )
+            for key, subschema in schema.get("properties", {}).items()
+        ]
+        items_schema = schema.get("items")
+        if items_schema is not None and not isinstance(items_schema, dict):
+            raise ValueError(f"Unsupported items schema: {items_schema}")
+        items = items_schema is not None and (
+            self._compile_cast(items_schema),
+            self._compile_type_check(items_schema),
+            items_schema.get("type"),
+            self._compile_normalizer(items_schema),
+        )
+        if not properties and not items:
+            return None
+
+        def normalize(value: Any, path: Tuple[Union[str, int], ...]) -> None:
+            # like the jsonschema traversal, all values of an object or array are cast before the nested values are
+            if properties and isinstance(value, dict):
+                present_properties = [entry for entry in properties if entry[0] in value]
+                for key, cast, _, _, _ in present_properties:
+                    value[key] = cast(value[key])
+                for key, _, type_check, target_type, normalize_nested in present_properties:
+                    nested_value = value[key]
+                    if type_check and not type_check(nested_value):
+                        self._log_type_error(nested_value, target_type, path + (key,))
+                    if normalize_nested:
+                        normalize_nested(nested_value, path + (key,))
+            if items and isinstance(value, list):
+                cast, type_check, target_type, normalize_nested = items
+                for index, item in enumerate(value):
+                    value[index] = cast(item)
+                for index, item in enumerate(value):
+                    if type_check and not type_check(item):
+                        self._log_type_error(item, target_type, path + (index,))
+                    if normalize_nested:
+                        normalize_nested(item, path + (index,))
+
+        return normalize
+
+    @staticmethod
+    def _compile_type_check(schema: Mapping[str, Any]) -> Optional[Callable[[Any], bool]]:
+        target_type = schema.get("type")
+        if target_type is None:
+            return None
+        target_types = [target_type] if isinstance(target_type, str) else target_type
+        unknown_types = set(target_types) - JSON_SCHEMA_TYPE_CHECKS.keys()
+        if unknown_types:
+            raise ValueError(f"Unknown types {unknown_types} in schema")
+
+        python_types = tuple(JSON_SCHEMA_PYTHON_TYPES[json_type] for json_type in target_types if json_type in JSON_SCHEMA_PYTHON_TYPES)
+        if len(python_types) == len(target_types):
+            return lambda value: isinstance(value, python_types)
+        checks = [JSON_SCHEMA_TYPE_CHECKS[json_type] for json_type in target_types]
+        return lambda value: any(check(value) for check in checks)
+
+    def _log_type_error(self, value: Any, target_type: Any, path: Tuple[Union[str, int], ...]) -> None:
+        # same message as TypeTransformer.get_error_message
+        field_path = ".".join(map(str, path))
+        logger.warning(
+            f"Failed to transform value from type '{self._get_type_structure(value)}' to type '{target_type}' at path: '{field_path}'"
+        )
+
+    def _compile_cast(self, field_schema: Mapping[str, Any]) -> Callable[[Any], Any]:
+        """
+        Compiles the cast done by the transform function for a single field schema, with all lookups in the schema done upfront.
+        """
+        target_type = field_schema.get("type")
+        if target_type is None:
+            raise ValueError(f"Field schema without type: {field_schema}")
+        target_format = field_schema.get("format")
+        nullable = "null" in target_type
+        is_string = "string" in target_type
+        is_number = "number" in target_type
+        is_boolean = "boolean" in target_type
+        keep_datetime_string = field_schema.get("__ab_apply_cast_datetime") is False
+        # default_convert casts strings to strings when it's the only not null type
+        default_is_string = [
+            json_type for json_type in ([target_type] if isinstance(target_type, str) else target_type) if json_type != "null"
+        ] == ["string"]
+        nested_casts = None
+        if "properties" in field_schema:
+            nested_casts = {key: self._compile_cast(subschema) for key, subschema in field_schema["properties"].items() if subschema}
+        default_convert = self.default_convert
+        convert_datetime = self.convert_datetime_string_to_ab_datetime
+        datetime_parser = self._datetime_parser
+
+        def cast(value: Any) -> Any:
+            if nullable:
+                if value is None:
+                    return value
+                # Sometimes hubspot output empty string on field with format set.
+                if target_format and value == "":
+                    return None
+            if isinstance(value, str):
+                if not is_string and value == "":
+                    return None
+                if is_number:
+                    # do not cast numeric IDs into float, use integer instead
+                    return (int if value.isnumeric() else float)(value.replace(",", ""))
+                if is_boolean and value.lower() in ("true", "false"):
+                    return value.lower() == "true"
+                if target_format:
+                    if keep_datetime_string:
+                        return value
+                    if target_format == "date":
+                        dt = convert_datetime(value)
+                        return datetime_parser.format(dt, "%Y-%m-%d") if dt else value
+                    if target_format == "date-time":
+                        dt = convert_datetime(value)
+                        return ab_datetime_format(dt) if dt else value
+                if default_is_string:
+                    return value
+            elif nested_casts is not None and isinstance(value, dict):
+                return {
+                    key: nested_casts[key](nested_value) if key in nested_casts else nested_value for key, nested_value in value.items()
+                }
+            return default_convert(value, field_schema)
+
+        return cast
 
     def get_transform_function(self):
         def transform_function(original_value: str, field_schema: Dict[str, Any]) -> Any:
@@ -414,6 +596,21 @@ class EntitySchemaNormalization(TypeTransformer):
         if not datetime_str:
             return None
 
+        # Fast path for the ISO 8601 strings most datetime fields come in, which gives the same result as the parsing below
+        iso_datetime = ISO_DATETIME_PATTERN.fullmatch(datetime_str)
+        if iso_datetime:
+            year, month, day, hour, minute, second, fraction, offset = iso_datetime.groups()
+            try:
+                tzinfo = timezone.utc
+                if offset and offset != "Z":
+                    sign = -1 if offset[0] == "-" else 1
+                    tzinfo = timezone(sign * timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6])))
+                return AirbyteDateTime(
+                    int(year), int(month), int(day), int(hour), int(minute), int(second), int((fraction or "0").ljust(6, "0")), tzinfo
+                )
+            except ValueError:
+                pass
+
         # Hubspot sometimes returns datetime strings as a float which can cause an OverflowError. When a float
         # string is detected, the string is converted into an integer string before parsing
         try:
@@ -478,11 +675,13 @@ class HubspotAssociationsExtractor(RecordExtractor):
     - Navigates a specified `field_path` within the JSON response to extract a list of primary entities.
     - Gets records IDs to use in associations retriever body.
     - Uses a secondary retriever to fetch associated objects for each entity (based on provided `associations_list`).
+      The associations of a page are read concurrently, at most `max_concurrent_requests` at a time.
     - Merges associated object IDs back into each entity's record under the corresponding association name.
     Attributes:
         field_path: Path to the list of records in the API response.
         entity: The field used for associations retriever endpoint.
         associations_list: List of associations to fetch (e.g., ["contacts", "companies"]).
+        max_concurrent_requests: Maximum number of association types read at the same time.
     """
 
     field_path: List[Union[InterpolatedString, str]]
@@ -491,6 +690,7 @@ class HubspotAssociationsExtractor(RecordExtractor):
     config: Config
     parameters: InitVar[Mapping[str, Any]]
     decoder: Decoder = field(default_factory=lambda: JsonDecoder(parameters={}))
+    max_concurrent_requests: int = 4
 
     def __post_init__(self, parameters: Mapping[str, Any]) -> None:
         self._field_path = [InterpolatedString.create(path, parameters=parameters) for path in self.field_path]
@@ -530,24 +730,29 @@ class HubspotAssociationsExtractor(RecordExtractor):
             records_by_pk = {record["id"]: record for record in records}
             record_ids = [{"id": record["id"]} for record in records]
 
-            slices = self._associations_retriever.stream_slices()
-
-            for _slice in slices:
-                # Append the list of extracted records so they are usable during interpolation of the JSON request body
-                stream_slice = StreamSlice(
-                    cursor_slice=_slice.cursor_slice, partition=_slice.partition, extra_fields={"record_ids": record_ids}
-                )
-                logger.debug(f"Reading {_slice} associations of {self._entity.eval(config=self.config)}")
-                associations = self._associations_retriever.read_records({}, stream_slice=stream_slice)
-                for group in associations:
-                    slice_value = stream_slice["association_name"]
-                    current_record = records_by_pk[group["from"]["id"]]
-                    associations_list = current_record.get(slice_value, [])
-                    associations_list.extend(association["toObjectId"] for association in group["to"])
-                    # Associations are defined in the schema as string ids but come in the API response as integer ids
-                    current_record[slice_value] = [str(association) for association in associations_list]
+            # Append the list of extracted records so they are usable during interpolation of the JSON request body
+            stream_slices = [
+                StreamSlice(cursor_slice=_slice.cursor_slice, partition=_slice.partition, extra_fields={"record_ids": record_ids})
+                for _slice in self._associations_retriever.stream_slices()
+            ]
+
+            max_workers = max(1, min(self.max_concurrent_requests, len(stream_slices)))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Results are merged in the order of the association types, regardless of which request completes first
+                for stream_slice, associations in zip(stream_slices, executor.map(self._read_associations, stream_slices)):
+                    for group in associations:
+                        slice_value = stream_slice["association_name"]
+                        current_record = records_by_pk[group["from"]["id"]]
+                        associations_list = current_record.get(slice_value, [])
+                        associations_list.extend(association["toObjectId"] for association in group["to"])
+                        # Associations are defined in the schema as string ids but come in the API response as integer ids
+                        current_record[slice_value] = [str(association) for association in associations_list]
             yield from records_by_pk.values()
 
+    def _read_associations(self, stream_slice: StreamSlice) -> List[Mapping[str, Any]]:
+        logger.debug(f"Reading {stream_slice} associations of {self._entity.eval(config=self.config)}")
+        return list(self._associations_retriever.read_records({}, stream_slice=stream_slice))
+
 
 def build_associations_retriever(
     *,
@@ -2,6 +2,8 @@
 # Copyright (c) 2025 Airbyte, Inc., all rights reserved.
 #
 
+import copy
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -9,6 +11,7 @@ import requests
 from requests import Response
 
 from airbyte_cdk.sources.declarative.retrievers import SimpleRetriever
+from airbyte_cdk.sources.utils.transform import TypeTransformer
 
 
 @pytest.mark.parametrize(
@@ -441,8 +444,12 @@ def test_associations_extractor(config, components_module):
         parameters={},
     )
 
+    mocked_associations_records = {"companies": companies_mocked_associations_records, "contacts": contacts_mocked_associations_records}
+
     with patch.object(
-        SimpleRetriever, "read_records", side_effect=[companies_mocked_associations_records, contacts_mocked_associations_records]
+        SimpleRetriever,
+        "read_records",
+        side_effect=lambda records_schema, stream_slice: mocked_associations_records[stream_slice["association_name"]],
     ):
         records = list(extractor.extract_records(response=Response()))
 
@@ -456,6 +463,40 @@ def test_associations_extractor(config, components_module):
         assert records[1]["contacts"] == expected_records[1]["contacts"]
 
 
+def test_associations_extractor_reads_associations_concurrently(config, components_module):
+    associations = ["companies", "contacts", "tickets"]
+    decoder = Mock()
+    decoder.decode.return_value = [{"results": [{"id": "123"}, {"id": "456"}]}]
+
+    # every association request waits until all of them are in flight
+    all_requests_sent = threading.Barrier(len(associations), timeout=5)
+
+    def read_records(records_schema, stream_slice):
+        all_requests_sent.wait()
+        association_id = associations.index(stream_slice["association_name"])
+        return [
+            {"from": {"id": record["id"]}, "to": [{"toObjectId": association_id}]} for record in stream_slice.extra_fields["record_ids"]
+        ]
+
+    extractor = components_module.HubspotAssociationsExtractor(
+        field_path=["results"],
+        entity="deals",
+        associations_list=associations,
+        decoder=decoder,
+        config=config,
+        parameters={},
+    )
+
+    with patch.object(SimpleRetriever, "read_records", side_effect=read_records):
+        records = list(extractor.extract_records(response=Response()))
+
+    assert records == [
+        {"id": "123", "companies": ["0"], "contacts": ["1"], "tickets": ["2"]},
+        {"id": "456", "companies": ["0"], "contacts": ["1"], "tickets": ["2"]},
+    ]
+    assert [list(record) for record in records] == [["id", *associations], ["id", *associations]]
+
+
 def test_extractor_supports_entity_interpolation(config, components_module):
     parameters = {"entity": "engagements_emails"}
 
@@ -532,6 +573,60 @@ def test_entity_schema_normalization(components_module, original_value, field_sc
     assert normalized_value == expected_value
 
 
+def test_entity_schema_normalization_transform_matches_type_transformer(components_module, caplog):
+    properties_schema = {
+        "name": {"type": ["null", "string"]},
+        "amount": {"type": ["null", "number"]},
+        "num_employees": {"type": ["null", "number"]},
+        "is_public": {"type": ["null", "boolean"]},
+        "closedate": {"type": ["null", "string"], "format": "date-time"},
+        "first_deal_date": {"type": ["null", "string"], "format": "date"},
+        "hs_lastmodifieddate": {"type": ["null", "string"], "format": "date-time", "__ab_apply_cast_datetime": False},
+        "hs_object_id": {"type": ["null", "integer"]},
+        "tags": {"type": ["null", "array"], "items": {"type": ["null", "string"]}},
+    }
+    schema = {
+        "type": ["null", "object"],
+        "properties": {
+            "id": {"type": ["null", "string"]},
+            "updatedAt": {"type": ["null", "string"], "format": "date-time"},
+            "properties": {"type": ["null", "object"], "properties": properties_schema},
+            **{f"properties_{name}": field_schema for name, field_schema in properties_schema.items()},
+        },
+    }
+    properties = {
+        "name": "Acme",
+        "amount": "1,250.5",
+        "num_employees": "",
+        "is_public": "False",
+        "closedate": "2025-05-26T08:02:03.123Z",
+        "first_deal_date": "1748246523456",
+        "hs_lastmodifieddate": "2025-05-26T08:02:03.123Z",
+        "hs_object_id": "not a number",
+        "tags": ["a", 1],
+    }
+    record = {
+        "id": "1",
+        "updatedAt": "2025-05-26T08:02:03+02:00",
+        "properties": properties,
+        **{f"properties_{name}": value for name, value in properties.items()},
+    }
+
+    entity_schema_normalization = components_module.EntitySchemaNormalization()
+    expected_record = copy.deepcopy(record)
+    TypeTransformer.transform(entity_schema_normalization, expected_record, copy.deepcopy(schema))
+    expected_warnings = list(caplog.messages)
+    caplog.clear()
+
+    for _ in range(2):
+        normalized_record = copy.deepcopy(record)
+        entity_schema_normalization.transform(normalized_record, schema)
+        assert normalized_record == expected_record
+        assert caplog.messages == expected_warnings
+        caplog.clear()
+    assert len(entity_schema_normalization._compiled_schemas) == 1
+
+
 @pytest.mark.parametrize(
     "json_response,last_page_size,last_record,last_page_token_value,expected_next_page_token",
     [
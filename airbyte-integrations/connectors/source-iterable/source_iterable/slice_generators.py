@@ -95,11 +95,13 @@ class AdjustableSliceGenerator(SliceGenerator):
     previous request
     3. Knowing previous slice range we can calculate days per minute processing
     speed. Dividing this speed by REQUEST_PER_MINUTE_LIMIT (4) we can calculate
-    next slice range. Next range cannot be greater than MAX_RANGE_DAYS (180 days)
+    next slice range. Next range cannot be less than MIN_RANGE_DAYS (1 day) or
+    greater than MAX_RANGE_DAYS (180 days)
 
     If processing of previous slice havent been completed "reduce_range" method
     should be called. It would reset next range start date to previous slice
-    and reduce next slice range by RANGE_REDUCE_FACTOR (2 times)
+    (or to the date the slice was processed up to, if provided) and reduce next
+    slice range by RANGE_REDUCE_FACTOR (2 times)
 
     In case if range havent been adjusted before getting next slice (it could
     happend if there were no records for given date range), next slice would
@@ -107,6 +109,7 @@ class AdjustableSliceGenerator(SliceGenerator):
     """
 
     REQUEST_PER_MINUTE_LIMIT = 4
+    MIN_RANGE_DAYS: int = 1
     INITIAL_RANGE_DAYS: int = 30
     DEFAULT_RANGE_DAYS: int = 90
     MAX_RANGE_DAYS: int = 180
@@ -135,17 +138,21 @@ class AdjustableSliceGenerator(SliceGenerator):
         else:
             days_per_minute = self._current_range / minutes_spent
             next_range = math.floor(days_per_minute / self.REQUEST_PER_MINUTE_LIMIT)
-            self._current_range = min(next_range or self.DEFAULT_RANGE_DAYS, self.MAX_RANGE_DAYS)
+            self._current_range = min(max(next_range, self.MIN_RANGE_DAYS), self.MAX_RANGE_DAYS)
         self._range_adjusted = True
 
-    def reduce_range(self) -> StreamSlice:
+    def reduce_range(self, resume_date: Optional[DateTime] = None) -> StreamSlice:
         """
         This method is supposed to be called when slice processing failed.
         Reset next slice start date to previous one and reduce slice range by
-        RANGE_REDUCE_FACTOR (2 times).
+        RANGE_REDUCE_FACTOR (2 times). If part of the slice have been processed
+        already, resume_date is the date it was processed up to and the
+        updated slice starts from it instead.
         Returns updated slice to try again.
         """
         self._current_range = int(max(self._current_range / self.RANGE_REDUCE_FACTOR, self.INITIAL_RANGE_DAYS))
+        if resume_date:
+            self._prev_start_date = resume_date
         start_date = self._prev_start_date
         end_date = min(self._end_date, start_date + (pendulum.Duration(days=self._current_range)))
         self._start_date = end_date
@@ -4,6 +4,7 @@
 
 import csv
 import json
+import time
 from abc import ABC, abstractmethod
 from io import StringIO
 from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Union
@@ -21,11 +22,13 @@ from airbyte_cdk.sources.streams.http import HttpStream
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, UserDefinedBackoffException
 from airbyte_cdk.sources.utils.schema_helpers import ResourceSchemaLoader
 from source_iterable.slice_generators import AdjustableSliceGenerator, RangeSliceGenerator, StreamSlice
-from source_iterable.utils import dateutil_parse
+from source_iterable.utils import parse_datetime
 
 
 EVENT_ROWS_LIMIT = 200
 CAMPAIGNS_PER_REQUEST = 20
+# Size of the blocks export responses are read and split into records in
+EXPORT_CHUNK_SIZE = 1024 * 1024
 
 
 class IterableStream(HttpStream, ABC):
@@ -167,7 +170,7 @@ class IterableExportStream(IterableStream, CheckpointMixin, ABC):
         if isinstance(value, int):
             value = pendulum.from_timestamp(value / 1000.0)
         elif isinstance(value, str):
-            value = dateutil_parse(value)
+            value = parse_datetime(value)
         else:
             raise ValueError(f"Unsupported type of datetime field {type(value)}")
         return value
@@ -215,10 +218,21 @@ class IterableExportStream(IterableStream, CheckpointMixin, ABC):
         return params
 
     def parse_response(self, response: requests.Response, **kwargs) -> Iterable[Mapping]:
-        for obj in response.iter_lines():
-            record = json.loads(obj)
-            record[self.cursor_field] = self._field_to_datetime(record[self.cursor_field])
-            yield record
+        pending = b""
+        for chunk in response.iter_content(chunk_size=EXPORT_CHUNK_SIZE):
+            lines = (pending + chunk).split(b"\n")
+            # the last line is incomplete until the next chunk is read
+            pending = lines.pop()
+            yield from self._parse_lines(lines)
+        yield from self._parse_lines([pending])
+
+    def _parse_lines(self, lines: List[bytes]) -> Iterable[Mapping]:
+        cursor_field = self.cursor_field
+        for line in lines:
+            if line.strip():
+                record = json.loads(line)
+                record[cursor_field] = self._field_to_datetime(record[cursor_field])
+                yield record
 
     def request_kwargs(
         self,
@@ -288,7 +302,11 @@ class IterableExportStreamAdjustableRange(IterableExportStream, ABC):
     In case of slice processing request failed with ChunkedEncodingError (which
     means that API server closed connection cause of request takes to much
     time) make CHUNKED_ENCODING_ERROR_RETRIES (6) retries each time reducing
-    slice length.
+    slice length. Records of the slice are exported in order of the cursor field,
+    so the retry resumes the export from the cursor value of the last emitted
+    record instead of the slice start, and records emitted before the
+    connection was closed are not emitted again. The retries are counted again
+    from zero after every retry which emitted new records.
 
     See AdjustableSliceGenerator description for more details on next slice length adjustment alghorithm.
     """
@@ -306,6 +324,14 @@ class IterableExportStreamAdjustableRange(IterableExportStream, ABC):
         self._adjustable_generator = AdjustableSliceGenerator(start_datetime, self._end_date)
         return self._adjustable_generator
 
+    @staticmethod
+    def _resume_second(cursor_value: DateTime) -> int:
+        """
+        Export date range parameters have a precision of seconds, so the export
+        can only be resumed from the start of the second of a cursor value.
+        """
+        return int(cursor_value.timestamp())
+
     def read_records(
         self,
         sync_mode: SyncMode,
@@ -313,8 +339,17 @@ class IterableExportStreamAdjustableRange(IterableExportStream, ABC):
         stream_slice: StreamSlice,
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Mapping[str, Any]]:
-        start_time = pendulum.now()
-        for _ in range(self.CHUNKED_ENCODING_ERROR_RETRIES):
+        # The second the export can be resumed from and how many records of
+        # it have been emitted already.
+        resume_second, resume_second_records = None, 0
+        retries = 0
+        while True:
+            records_to_skip = resume_second_records
+            emitted_records = False
+            # Only the time spent on the request of the last attempt is used to
+            # adjust the range, not the time the records are consumed for.
+            start_time = time.monotonic()
+            consumer_time = 0.0
             try:
                 self.logger.info(
                     f"Processing slice of {(stream_slice.end_date - stream_slice.start_date).total_days()} days for stream {self.name}"
@@ -325,16 +360,30 @@ class IterableExportStreamAdjustableRange(IterableExportStream, ABC):
                     stream_slice=stream_slice,
                     stream_state=stream_state,
                 ):
-                    now = pendulum.now()
-                    self._adjustable_generator.adjust_range(now - start_time)
+                    record_resume_second = self._resume_second(record[self.cursor_field])
+                    if records_to_skip and record_resume_second == resume_second:
+                        # the record has been emitted before the connection was closed
+                        records_to_skip -= 1
+                        continue
+                    records_to_skip = 0
+                    if record_resume_second != resume_second:
+                        resume_second, resume_second_records = record_resume_second, 0
+                    resume_second_records += 1
+                    emitted_records = True
+                    yielded_at = time.monotonic()
                     yield record
-                    start_time = now
+                    consumer_time += time.monotonic() - yielded_at
+                if resume_second is not None:
+                    request_time = time.monotonic() - start_time - consumer_time
+                    self._adjustable_generator.adjust_range(pendulum.duration(seconds=request_time))
                 break
             except ChunkedEncodingError:
+                retries = 1 if emitted_records else retries + 1
+                if retries >= self.CHUNKED_ENCODING_ERROR_RETRIES:
+                    raise Exception(f"ChunkedEncodingError: Reached maximum number of retires: {self.CHUNKED_ENCODING_ERROR_RETRIES}")
                 self.logger.warn("ChunkedEncodingError occurred, decrease days range and try again")
-                stream_slice = self._adjustable_generator.reduce_range()
-        else:
-            raise Exception(f"ChunkedEncodingError: Reached maximum number of retires: {self.CHUNKED_ENCODING_ERROR_RETRIES}")
+                resume_date = pendulum.from_timestamp(resume_second) if resume_second is not None else None
+                stream_slice = self._adjustable_generator.reduce_range(resume_date)
 
 
 class IterableExportEventsStreamAdjustableRange(IterableExportStreamAdjustableRange, ABC):
@@ -2,8 +2,16 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import re
+from functools import lru_cache
+
 import dateutil.parser
 import pendulum
+from pendulum.datetime import DateTime
+
+
+# Datetime strings of export records, e.g. "2021-01-01 00:00:00 +00:00"
+ISO_DATETIME_PATTERN = re.compile(r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))? ?(?:(Z)|([+-])(\d{2}):?(\d{2}))?")
 
 
 def dateutil_parse(text):
@@ -22,3 +30,27 @@ def dateutil_parse(text):
         dt.microsecond,
         tz=dt.tzinfo or pendulum.tz.UTC,
     )
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(text: str) -> DateTime:
+    """
+    Same as `dateutil_parse`, but ISO 8601 strings are parsed without dateutil.
+    Results are cached, as records of an export share the datetime strings of the same seconds.
+    """
+    match = ISO_DATETIME_PATTERN.fullmatch(text)
+    if not match:
+        return dateutil_parse(text)
+    year, month, day, hour, minute, second, fraction, utc, sign, offset_hours, offset_minutes = match.groups()
+    tz = pendulum.tz.UTC
+    if sign:
+        offset = (int(offset_hours) * 60 + int(offset_minutes)) * 60
+        if offset:
+            tz = pendulum.tz.fixed_timezone(-offset if sign == "-" else offset)
+    try:
+        # the timezone has a fixed offset, so the datetime is created directly without converting it to the timezone
+        return DateTime(
+            int(year), int(month), int(day), int(hour), int(minute), int(second), int((fraction or "0").ljust(6, "0")), tzinfo=tz
+        )
+    except ValueError:
+        return dateutil_parse(text)
@@ -4,7 +4,9 @@
 
 import datetime
 import json
+import threading
 import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import List
 from unittest import mock
 
@@ -15,7 +17,9 @@ import responses
 from requests.exceptions import ChunkedEncodingError
 from source_iterable.slice_generators import AdjustableSliceGenerator
 from source_iterable.source import SourceIterable
+from source_iterable.streams import EmailSend
 
+from airbyte_cdk.models import SyncMode
 from airbyte_cdk.models import Type as MessageType
 
 
@@ -117,3 +121,86 @@ def test_email_stream_chunked_encoding(mocker, mock_lists_resp, catalog, days_du
     assert len(ranges) == len(records)
     # since read is called on source instance, under the hood .streams() is called which triggers one more http call
     assert len(responses.calls) == 3 * len(ranges)
+
+
+class CutExportHandler(BaseHTTPRequestHandler):
+    """
+    Serves the export records of the requested date range as a chunked response, cutting the connection
+    in the middle of a record on the first request.
+    """
+
+    protocol_version = "HTTP/1.1"
+    records: List[dict] = []
+    cut_after_records: int = 0
+    requests: List[dict] = []
+
+    def do_GET(self):
+        query = {key: values[0] for key, values in urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query).items()}
+        self.requests.append(query)
+        start_date, end_date = pendulum.parse(query["startDateTime"]), pendulum.parse(query["endDateTime"])
+        lines = [json.dumps(record) for record in self.records if start_date <= pendulum.parse(record["createdAt"]) <= end_date]
+
+        cut = len(self.requests) == 1
+        self.send_response(200)
+        self.send_header("Transfer-Encoding", "chunked")
+        if cut:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        for line in lines[: self.cut_after_records] if cut else lines:
+            self._write_chunk(f"{line}\n")
+        if cut:
+            self._write_chunk(lines[self.cut_after_records][:10])
+            self.close_connection = True
+            return
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, data: str):
+        self.wfile.write(f"{len(data):x}\r\n{data}\r\n".encode())
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+def test_email_stream_resumes_after_chunked_encoding_error(mocker):
+    created_at = ["2020-01-01 10:00:00", "2020-01-01 11:00:00", "2020-01-01 12:00:00", "2020-01-01 12:00:00", "2020-01-01 12:00:00"]
+    created_at += [f"2020-01-0{day} 10:00:00" for day in range(2, 10)]
+    records = [{"createdAt": value, "messageId": str(index)} for index, value in enumerate(created_at)]
+    handler = type("Handler", (CutExportHandler,), {"records": records, "cut_after_records": 4, "requests": []})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    mocker.patch.object(EmailSend, "url_base", f"http://127.0.0.1:{server.server_address[1]}/api/")
+
+    try:
+        stream = EmailSend(authenticator=None, start_date="2020-01-01", end_date="2020-01-10")
+        stream.state = {}
+        stream_slice = next(iter(stream.stream_slices(sync_mode=SyncMode.full_refresh)))
+        output = list(stream.read_records(sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=stream_slice))
+    finally:
+        server.shutdown()
+
+    # every record is read exactly once
+    assert [record["messageId"] for record in output] == [record["messageId"] for record in records]
+    # the export is resumed from the second of the last record read before the connection was closed
+    assert [request["startDateTime"] for request in handler.requests] == ["2020-01-01 00:00:00", "2020-01-01 12:00:00"]
+
+
+@responses.activate
+def test_email_stream_range_is_adjusted_on_request_time_only(time_mock):
+    def response_cb(req):
+        time_mock.tick(delta=datetime.timedelta(minutes=1))
+        return (200, {}, "\n".join(json.dumps({"createdAt": f"2020-01-01 1{hour}:00:00"}) for hour in range(3)))
+
+    responses.add_callback("GET", "https://api.iterable.com/api/export/data.json", callback=response_cb)
+    stream = EmailSend(authenticator=None, start_date="2020-01-01", end_date="2020-06-01")
+    stream.state = {}
+    stream_slice = next(iter(stream.stream_slices(sync_mode=SyncMode.full_refresh)))
+    for _ in stream.read_records(sync_mode=SyncMode.full_refresh, cursor_field=None, stream_slice=stream_slice):
+        # time spent by the consumer of the records
+        time_mock.tick(delta=datetime.timedelta(hours=1))
+
+    next_slice = next(stream._adjustable_generator)
+    # 30 days read in 1 minute
+    assert (next_slice.end_date - next_slice.start_date).total_days() == int(
+        AdjustableSliceGenerator.INITIAL_RANGE_DAYS / AdjustableSliceGenerator.REQUEST_PER_MINUTE_LIMIT
+    )
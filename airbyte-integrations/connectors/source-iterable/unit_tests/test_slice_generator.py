@@ -25,6 +25,15 @@ def test_slice_gen():
     assert days[1] == AdjustableSliceGenerator.DEFAULT_RANGE_DAYS
 
 
+def test_slow_slice_range_is_not_less_than_min_range():
+    generator = AdjustableSliceGenerator(TEST_DATE)
+    next(generator)
+    # 30 days in 10 hours
+    generator.adjust_range(pendulum.Duration(hours=10))
+    stream_slice = next(generator)
+    assert (stream_slice.end_date - stream_slice.start_date).total_days() == AdjustableSliceGenerator.MIN_RANGE_DAYS
+
+
 @freezegun.freeze_time(TEST_DATE + pendulum.Duration(days=1000))
 def test_slice_gen_no_range_adjust():
     start_date = TEST_DATE
@@ -103,3 +112,14 @@ def test_reduce_range():
     reduced_slice = slice_generator.reduce_range()
     assert reduced_slice.start_date == datetime(2022, 1, 1)
     assert reduced_slice.end_date == datetime(2022, 1, 31)
+
+
+def test_reduce_range_resumes_from_date():
+    slice_generator = AdjustableSliceGenerator(start_date=pendulum.parse("2022-01-01"), end_date=pendulum.parse("2022-03-31"))
+    next(slice_generator)
+    reduced_slice = slice_generator.reduce_range(pendulum.parse("2022-01-20T10:00:00"))
+    assert reduced_slice.start_date == pendulum.parse("2022-01-20T10:00:00")
+    assert reduced_slice.end_date == pendulum.parse("2022-02-19T10:00:00")
+    # the next failure of the slice resumes from the same date
+    assert slice_generator.reduce_range().start_date == pendulum.parse("2022-01-20T10:00:00")
+    assert next(slice_generator).start_date == pendulum.parse("2022-02-19T10:00:00")
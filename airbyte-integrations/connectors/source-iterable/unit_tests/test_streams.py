@@ -7,7 +7,7 @@ import pytest
 import requests
 import responses
 from source_iterable.source import SourceIterable
-from source_iterable.streams import Campaigns, CampaignsMetrics, Templates
+from source_iterable.streams import Campaigns, CampaignsMetrics, EmailSend, Templates
 from source_iterable.utils import dateutil_parse
 
 from airbyte_cdk import AirbyteTracedException
@@ -174,6 +174,20 @@ def test_templates_parse_response():
         assert list(records) == [{"id": 1, "createdAt": dateutil_parse("2022-01-01")}]
 
 
+def test_export_parse_response_with_lines_split_across_chunks(mocker):
+    stream = EmailSend(authenticator=None, start_date="2019-10-10T00:00:00")
+    body = b'{"createdAt": "2022-01-01 10:00:00 +00:00", "id": 1}\n\n{"createdAt": "2022-01-02 10:00:00 +00:00", "id": 2}\n'
+    response = mocker.Mock(spec=requests.Response)
+    response.iter_content.return_value = [body[i : i + 7] for i in range(0, len(body), 7)]
+
+    records = stream.parse_response(response=response)
+
+    assert list(records) == [
+        {"id": 1, "createdAt": dateutil_parse("2022-01-01 10:00:00 +00:00")},
+        {"id": 2, "createdAt": dateutil_parse("2022-01-02 10:00:00 +00:00")},
+    ]
+
+
 @pytest.mark.parametrize(
     "stream,date,slice,expected_path",
     [
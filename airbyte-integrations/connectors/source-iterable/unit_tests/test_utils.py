@@ -3,10 +3,31 @@
 #
 
 import pendulum
-from source_iterable.utils import dateutil_parse
+import pytest
+from source_iterable.utils import dateutil_parse, parse_datetime
 
 
 def test_dateutil_parse():
     assert pendulum.parse("2021-04-08 14:23:30 +00:00", strict=False) == dateutil_parse("2021-04-08 14:23:30 +00:00")
     assert pendulum.parse("2021-04-14T16:51:23+00:00", strict=False) == dateutil_parse("2021-04-14T16:51:23+00:00")
     assert pendulum.parse("2021-04-14T16:23:30.700000+00:00", strict=False) == dateutil_parse("2021-04-14T16:23:30.700000+00:00")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2021-04-08 14:23:30 +00:00",
+        "2021-04-14T16:51:23+00:00",
+        "2021-04-14T16:23:30.700000+00:00",
+        "2021-04-14T16:23:30.7Z",
+        "2021-04-14 16:23:30 -05:30",
+        "2021-04-14 16:23:30",
+        "2021-04-14",
+        "April 14, 2021",
+    ],
+)
+def test_parse_datetime(value):
+    parsed = parse_datetime(value)
+
+    assert parsed == dateutil_parse(value)
+    assert parsed.utcoffset() == dateutil_parse(value).utcoffset()
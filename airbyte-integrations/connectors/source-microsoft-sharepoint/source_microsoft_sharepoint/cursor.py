@@ -0,0 +1,76 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, Mapping, Optional, Set
+
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream.cursor import DefaultFileBasedCursor
+from airbyte_cdk.sources.file_based.types import StreamState
+
+
+class MicrosoftSharePointCursor(DefaultFileBasedCursor):
+    """
+    Keeps a Microsoft Graph delta link per drive in the state next to the files history, so that following syncs only list the files
+    changed since the previous one instead of walking every folder of the drives.
+
+    Each drive moves to its next delta link on its own, as soon as all the files listed from its current one are synced,
+    so the drives whose files were synced before an interrupted sync are not listed from their old delta link again.
+    """
+
+    DELTA_LINKS_KEY = "delta_links"
+    DELTA_LINKS_TAKEN_AT_KEY = "delta_links_taken_at"
+
+    def __init__(self, stream_config: FileBasedStreamConfig, **kwargs: Any):
+        super().__init__(stream_config, **kwargs)
+        # Links the changes of the current sync are listed from and when they were taken, keyed by drive id,
+        # a drive without a link is listed in full
+        self.delta_links: Dict[str, str] = {}
+        self.delta_links_taken_at: Dict[str, datetime] = {}
+        # Links the changes of the next sync will be listed from
+        self._next_delta_links: Dict[str, str] = {}
+        self._next_delta_links_taken_at: Optional[datetime] = None
+        # Uris of the files listed but not synced yet, keyed by the id of their drive
+        self._pending_files: Dict[Optional[str], Set[str]] = defaultdict(set)
+
+    def set_initial_state(self, value: StreamState) -> None:
+        super().set_initial_state(value)
+        delta_links, taken_at = value.get(self.DELTA_LINKS_KEY) or {}, value.get(self.DELTA_LINKS_TAKEN_AT_KEY) or {}
+        for drive_id, delta_link in delta_links.items():
+            if drive_id in taken_at:
+                self.delta_links[drive_id] = delta_link
+                self.delta_links_taken_at[drive_id] = datetime.strptime(taken_at[drive_id], self.DATE_TIME_FORMAT)
+
+    def set_next_delta_links(self, delta_links: Mapping[str, str], taken_at: datetime) -> None:
+        self._next_delta_links = dict(delta_links)
+        self._next_delta_links_taken_at = taken_at
+
+    def get_files_to_sync(self, all_files: Iterable[RemoteFile], logger: logging.Logger) -> Iterable[RemoteFile]:
+        for file in super().get_files_to_sync(all_files, logger):
+            self._pending_files[getattr(file, "drive_id", None)].add(file.uri)
+            yield file
+
+    def add_file(self, file: RemoteFile) -> None:
+        super().add_file(file)
+        self._pending_files[getattr(file, "drive_id", None)].discard(file.uri)
+
+    def get_state(self) -> StreamState:
+        state = super().get_state()
+        delta_links, taken_at = dict(self.delta_links), dict(self.delta_links_taken_at)
+        if self._next_delta_links:
+            # Drives which are not listed anymore are dropped
+            delta_links = {drive_id: link for drive_id, link in delta_links.items() if drive_id in self._next_delta_links}
+            for drive_id, next_delta_link in self._next_delta_links.items():
+                if not self._pending_files[drive_id]:
+                    delta_links[drive_id], taken_at[drive_id] = next_delta_link, self._next_delta_links_taken_at
+        if delta_links:
+            state[self.DELTA_LINKS_KEY] = delta_links
+            state[self.DELTA_LINKS_TAKEN_AT_KEY] = {
+                drive_id: taken_at[drive_id].strftime(self.DATE_TIME_FORMAT) for drive_id in delta_links
+            }
+        return state
@@ -0,0 +1,29 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+
+from datetime import datetime
+from typing import Iterable
+
+from airbyte_cdk.sources.file_based.remote_file import RemoteFile
+from airbyte_cdk.sources.file_based.stream import DefaultFileBasedStream
+from source_microsoft_sharepoint.cursor import MicrosoftSharePointCursor
+
+
+class MicrosoftSharePointStream(DefaultFileBasedStream):
+    def get_files(self) -> Iterable[RemoteFile]:
+        """
+        List the files of each drive changed since its delta link in the state, and all the files of the drives without one.
+        """
+        if not isinstance(self._cursor, MicrosoftSharePointCursor):
+            return super().get_files()
+
+        # Delta links are requested before the drives are walked: an edit made while walking them shows up again in the next delta
+        taken_at = datetime.utcnow()
+        self._cursor.set_next_delta_links(self.stream_reader.get_delta_links(), taken_at)
+        if self._cursor.delta_links:
+            return self.stream_reader.get_changed_files(
+                self.config.globs or [], self._cursor.delta_links, self._cursor.delta_links_taken_at, self.logger
+            )
+        return super().get_files()
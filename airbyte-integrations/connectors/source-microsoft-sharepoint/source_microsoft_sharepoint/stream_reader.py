@@ -5,11 +5,12 @@
 
 import logging
 import re
-from datetime import datetime
+from datetime import datetime, timedelta
 from functools import lru_cache
+from http import HTTPStatus
 from io import IOBase
 from os.path import getsize
-from typing import Any, Callable, Dict, Iterable, List, MutableMapping, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple
 
 import requests
 import smart_open
@@ -20,6 +21,8 @@ from office365.onedrive.drives.drive import Drive
 from office365.runtime.auth.token_response import TokenResponse
 from office365.sharepoint.client_context import ClientContext
 from office365.sharepoint.search.service import SearchService
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from airbyte_cdk import AirbyteTracedException, FailureType
 from airbyte_cdk.models import AirbyteRecordMessageFileReference
@@ -31,6 +34,7 @@ from source_microsoft_sharepoint.spec import SourceMicrosoftSharePointSpec
 
 from .exceptions import ErrorFetchingMetadata
 from .utils import (
+    LOGGER,
     FolderNotFoundException,
     MicrosoftSharePointRemoteFile,
     execute_query_with_retry,
@@ -41,6 +45,7 @@ from .utils import (
 
 SITE_TITLE = "Title"
 SITE_PATH = "Path"
+GRAPH_API_URL = "https://graph.microsoft.com/v1.0"
 
 
 class SourceMicrosoftSharePointClient:
@@ -109,11 +114,24 @@ class SourceMicrosoftSharePointStreamReader(AbstractFileBasedStreamReader):
 
     ROOT_PATH = [".", "/"]
     FILE_SIZE_LIMIT = 1_500_000_000
+    # Graph API requests are retried on throttling and server errors, waiting as long as the Retry-After header asks to
+    GRAPH_API_RETRY = Retry(
+        total=5,
+        backoff_factor=2,
+        status_forcelist=[HTTPStatus.TOO_MANY_REQUESTS, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    GRAPH_API_POOL_SIZE = 10
+    # Folders modified this close to the time the delta links were taken are considered renamed or moved since, to allow for clock skew
+    DELTA_LINK_CLOCK_SKEW = timedelta(minutes=5)
 
     def __init__(self):
         super().__init__()
         self._auth_client = None
         self._one_drive_client = None
+        self._session = None
 
     @property
     def config(self) -> SourceMicrosoftSharePointSpec:
@@ -133,6 +151,17 @@ class SourceMicrosoftSharePointStreamReader(AbstractFileBasedStreamReader):
             self._one_drive_client = self.auth_client.client
         return self._one_drive_client
 
+    @property
+    def session(self) -> requests.Session:
+        # One pooled session for all the Graph API requests, so that connections are reused across folders and drives
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.GRAPH_API_POOL_SIZE, pool_maxsize=self.GRAPH_API_POOL_SIZE, max_retries=self.GRAPH_API_RETRY
+            )
+            self._session.mount("https://", adapter)
+        return self._session
+
     def get_access_token(self):
         # Directly fetch a new access token from the auth_client each time it's called
         return self.auth_client._get_access_token()["access_token"]
@@ -183,32 +212,32 @@ class SourceMicrosoftSharePointStreamReader(AbstractFileBasedStreamReader):
 
         access_token = self.get_access_token()
         headers = {"Authorization": f"Bearer {access_token}"}
-        base_url = f"https://graph.microsoft.com/v1.0/drives/{drive_id}"
+        base_url = f"{GRAPH_API_URL}/drives/{drive_id}"
 
         def get_files(url: str, path: str) -> Iterable[MicrosoftSharePointRemoteFile]:
-            response = requests.get(url, headers=headers)
-            if response.status_code != 200:
-                error_info = response.json().get("error", {}).get("message", "No additional error information provided.")
-                raise RuntimeError(f"Failed to retrieve files from URL '{url}'. HTTP status: {response.status_code}. Error: {error_info}")
-
-            data = response.json()
-            for child in data.get("value", []):
-                new_path = path + "/" + child["name"]
-                if child.get("file"):  # Object is a file
-                    # last_modified and created_at are type string e.g. "2025-04-16T14:41:00Z"
-                    last_modified = datetime.strptime(child["lastModifiedDateTime"], "%Y-%m-%dT%H:%M:%SZ")
-                    created_at = datetime.strptime(child["createdDateTime"], "%Y-%m-%dT%H:%M:%SZ")
-                    yield MicrosoftSharePointRemoteFile(
-                        uri=new_path, download_url=child["@microsoft.graph.downloadUrl"], last_modified=last_modified, created_at=created_at
+            # Folders with many children are returned in pages
+            while url:
+                response = self.session.get(url, headers=headers)
+                if response.status_code != 200:
+                    error_info = response.json().get("error", {}).get("message", "No additional error information provided.")
+                    raise RuntimeError(
+                        f"Failed to retrieve files from URL '{url}'. HTTP status: {response.status_code}. Error: {error_info}"
                     )
-                else:  # Object is a folder, retrieve children
-                    child_url = f"{base_url}/items/{child['id']}/children"  # Use item endpoint for nested objects
-                    yield from get_files(child_url, new_path)
+
+                data = response.json()
+                for child in data.get("value", []):
+                    new_path = path + "/" + child["name"]
+                    if child.get("file"):  # Object is a file
+                        yield self._to_remote_file(child, new_path)
+                    else:  # Object is a folder, retrieve children
+                        child_url = f"{base_url}/items/{child['id']}/children"  # Use item endpoint for nested objects
+                        yield from get_files(child_url, new_path)
+                url = data.get("@odata.nextLink")
             yield from []
 
         # Initial request to item endpoint
         item_url = f"{base_url}/items/{object_id}"
-        item_response = requests.get(item_url, headers=headers)
+        item_response = self.session.get(item_url, headers=headers)
         if item_response.status_code != 200:
             error_info = item_response.json().get("error", {}).get("message", "No additional error information provided.")
             raise RuntimeError(
@@ -219,17 +248,30 @@ class SourceMicrosoftSharePointStreamReader(AbstractFileBasedStreamReader):
         # Check if the object is a file or a folder
         item_data = item_response.json()
         if item_data.get("file"):  # Initial object is a file
-            new_path = path + "/" + item_data["name"]
-            last_modified = datetime.strptime(item_data["lastModifiedDateTime"], "%Y-%m-%dT%H:%M:%SZ")
-            created_at = datetime.strptime(item_data["createdDateTime"], "%Y-%m-%dT%H:%M:%SZ")
-            yield MicrosoftSharePointRemoteFile(
-                uri=new_path, download_url=item_data["@microsoft.graph.downloadUrl"], last_modified=last_modified, created_at=created_at
-            )
+            yield self._to_remote_file(item_data, path + "/" + item_data["name"])
         else:
             # Initial object is a folder, start file retrieval
             yield from get_files(f"{item_url}/children", path)
 
-    def _list_directories_and_files(self, root_folder, path) -> Iterable[MicrosoftSharePointRemoteFile]:
+    @staticmethod
+    def _to_remote_file(item: Mapping[str, Any], uri: str, drive_id: Optional[str] = None) -> MicrosoftSharePointRemoteFile:
+        # last_modified and created_at are type string e.g. "2025-04-16T14:41:00Z"
+        return MicrosoftSharePointRemoteFile(
+            uri=uri,
+            download_url=item["@microsoft.graph.downloadUrl"],
+            last_modified=datetime.strptime(item["lastModifiedDateTime"], "%Y-%m-%dT%H:%M:%SZ"),
+            created_at=datetime.strptime(item["createdDateTime"], "%Y-%m-%dT%H:%M:%SZ"),
+            drive_id=drive_id,
+        )
+
+    def _get_graph_api_json(self, url: str, headers: Mapping[str, str], params: Optional[Mapping[str, str]] = None) -> Mapping[str, Any]:
+        response = self.session.get(url, headers=headers, params=params)
+        if response.status_code != 200:
+            error_info = response.json().get("error", {}).get("message", "No additional error information provided.")
+            raise RuntimeError(f"Failed to retrieve URL '{url}'. HTTP status: {response.status_code}. Error: {error_info}")
+        return response.json()
+
+    def _list_directories_and_files(self, root_folder, path, drive_id: Optional[str] = None) -> Iterable[MicrosoftSharePointRemoteFile]:
         """Enumerates folders and files starting from a root folder."""
         drive_items = execute_query_with_retry(root_folder.children.get())
         for item in drive_items:
@@ -241,9 +283,10 @@ class SourceMicrosoftSharePointStreamReader(AbstractFileBasedStreamReader):
                     download_url=item.properties["@microsoft.graph.downloadUrl"],
                     last_modified=item.properties["lastModifiedDateTime"],
                     created_at=item.properties["createdDateTime"],
+                    drive_id=drive_id,
                 )
             else:
-                yield from self._list_directories_and_files(item, item_path)
+                yield from self._list_directories_and_files(item, item_path, drive_id)
         yield from []
 
     def _get_files_by_drive_name(self, drives, folder_path) -> Iterable[MicrosoftSharePointRemoteFile]:
@@ -265,7 +308,111 @@ class SourceMicrosoftSharePointStreamReader(AbstractFileBasedStreamReader):
                         continue
                     folder_path_url = drive.web_url + "/" + folder_path
 
-                yield from self._list_directories_and_files(folder, folder_path_url)
+                yield from self._list_directories_and_files(folder, folder_path_url, drive.id)
+
+    def _get_changed_files_by_drive_name(
+        self, drives, folder_path, delta_links: Mapping[str, str], changed_since: Mapping[str, datetime], logger: logging.Logger
+    ) -> Iterable[MicrosoftSharePointRemoteFile]:
+        """Yields files from the specified drive changed since its delta link, or all of them when it has to be listed in full."""
+        path_levels = [level for level in folder_path.split("/") if level]
+        folder_path = "/".join(path_levels)
+
+        for drive in drives:
+            if drive.drive_type != "documentLibrary":
+                continue
+            changed_files = (
+                self._get_drive_changes(drive, folder_path, delta_links[drive.id], changed_since[drive.id])
+                if drive.id in delta_links
+                else None
+            )
+            if changed_files is None:
+                logger.info(f"Listing all the files of drive {drive.name}")
+                yield from self._get_files_by_drive_name([drive], folder_path)
+            else:
+                yield from changed_files
+
+    def _get_drive_changes(
+        self, drive, folder_path: str, delta_link: str, changed_since: datetime
+    ) -> Optional[List[MicrosoftSharePointRemoteFile]]:
+        """
+        Lists the files under the folder path of the drive changed since the delta link was taken.
+
+        Returns None when the drive has to be listed in full instead: when the delta link expired, or when a folder was renamed or moved
+        since, as delta only returns the folder itself and not the files under it, whose paths changed too.
+        """
+        headers = self._get_headers()
+        base_url = f"{GRAPH_API_URL}/drives/{drive.id}"
+
+        items = []
+        url = delta_link
+        while url:
+            response = self.session.get(url, headers=headers)
+            if response.status_code == HTTPStatus.GONE:
+                return None
+            if response.status_code != 200:
+                error_info = response.json().get("error", {}).get("message", "No additional error information provided.")
+                raise RuntimeError(
+                    f"Failed to retrieve changes of drive '{drive.id}'. HTTP status: {response.status_code}. Error: {error_info}"
+                )
+            data = response.json()
+            items.extend(item for item in data.get("value", []) if not item.get("deleted"))
+            url = data.get("@odata.nextLink")
+
+        # Changed folders have their current name and parent, the paths of the other ones are requested as needed
+        folders = {item["id"]: item for item in items if "folder" in item or "root" in item}
+        folder_paths = {}
+
+        def get_folder_path(folder_id: str) -> str:
+            if folder_id not in folder_paths:
+                if folder_id not in folders:
+                    folders[folder_id] = self._get_graph_api_json(
+                        f"{base_url}/items/{folder_id}", headers, params={"$select": "id,name,root,parentReference"}
+                    )
+                folder = folders[folder_id]
+                if "root" in folder:
+                    folder_paths[folder_id] = ""
+                else:
+                    parent_path = get_folder_path(folder["parentReference"]["id"])
+                    folder_paths[folder_id] = f"{parent_path}/{folder['name']}" if parent_path else folder["name"]
+            return folder_paths[folder_id]
+
+        if folder_path in self.ROOT_PATH:
+            folder_path_url, path_prefix = drive.web_url, ""
+        else:
+            folder_path_url, path_prefix = drive.web_url + "/" + folder_path, f"{folder_path}/" if folder_path else ""
+
+        files = []
+        for item in items:
+            if "root" in item:
+                continue
+            parent_path = get_folder_path(item["parentReference"]["id"])
+            item_path = f"{parent_path}/{item['name']}" if parent_path else item["name"]
+            # paths are matched case-insensitively, like the folder path is by `get_by_path`
+            if not item_path.lower().startswith(path_prefix.lower()):
+                continue
+            if "folder" in item:
+                # Folders also show up when files under them change, only the ones modified since were renamed or moved
+                last_modified = datetime.strptime(item["lastModifiedDateTime"], "%Y-%m-%dT%H:%M:%SZ")
+                if last_modified >= changed_since - self.DELTA_LINK_CLOCK_SKEW:
+                    return None
+            elif "file" in item:
+                if "@microsoft.graph.downloadUrl" not in item:
+                    item = self._get_graph_api_json(f"{base_url}/items/{item['id']}", headers)
+                files.append(self._to_remote_file(item, folder_path_url + "/" + item_path[len(path_prefix) :], drive.id))
+        return files
+
+    def get_delta_links(self) -> Dict[str, str]:
+        """
+        Returns a delta link to the current state of each SharePoint drive, keyed by drive id, to list the changes made from now on.
+        """
+        delta_links = {}
+        if self.config.search_scope in ("ACCESSIBLE_DRIVES", "ALL"):
+            headers = self._get_headers()
+            for drive in self.drives:
+                if drive.drive_type == "documentLibrary":
+                    data = self._get_graph_api_json(f"{GRAPH_API_URL}/drives/{drive.id}/root/delta", headers, params={"token": "latest"})
+                    delta_links[drive.id] = data["@odata.deltaLink"]
+        return delta_links
 
     def get_all_sites(self) -> List[MutableMapping[str, Any]]:
         """
@@ -373,10 +520,18 @@ class SourceMicrosoftSharePointStreamReader(AbstractFileBasedStreamReader):
             if parent_reference and parent_reference["driveId"] not in drive_ids:
                 yield from self._get_shared_drive_object(parent_reference["driveId"], drive_item.id, drive_item.web_url)
 
-    def get_all_files(self) -> Iterable[MicrosoftSharePointRemoteFile]:
+    def get_all_files(
+        self,
+        delta_links: Optional[Mapping[str, str]] = None,
+        changed_since: Optional[Mapping[str, datetime]] = None,
+        logger: logging.Logger = LOGGER,
+    ) -> Iterable[MicrosoftSharePointRemoteFile]:
         if self.config.search_scope in ("ACCESSIBLE_DRIVES", "ALL"):
             # Get files from accessible drives
-            yield from self._get_files_by_drive_name(self.drives, self.config.folder_path)
+            if delta_links:
+                yield from self._get_changed_files_by_drive_name(self.drives, self.config.folder_path, delta_links, changed_since, logger)
+            else:
+                yield from self._get_files_by_drive_name(self.drives, self.config.folder_path)
 
         # skip this step for application authentication flow
         if self.config.credentials.auth_type != "Client" or (
@@ -410,6 +565,16 @@ class SourceMicrosoftSharePointStreamReader(AbstractFileBasedStreamReader):
                 failure_type=FailureType.config_error,
             )
 
+    def get_changed_files(
+        self, globs: List[str], delta_links: Mapping[str, str], changed_since: Mapping[str, datetime], logger: logging.Logger
+    ) -> Iterable[RemoteFile]:
+        """
+        Retrieve the files matching the specified glob patterns changed since the delta link of their drive was taken, at the time
+        in `changed_since` for the drive. Drives without a delta link and shared items are listed in full.
+        """
+        files = self.get_all_files(delta_links, changed_since, logger)
+        yield from filter_http_urls(self.filter_files_by_globs_and_start_date(list(files), globs), logger)
+
     def open_file(self, file: RemoteFile, mode: FileReadMode, encoding: Optional[str], logger: logging.Logger) -> IOBase:
         # choose correct compression mode because the url is random and doesn't end with filename extension
         file_extension = file.uri.split(".")[-1]
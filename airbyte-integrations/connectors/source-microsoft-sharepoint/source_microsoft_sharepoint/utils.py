@@ -5,7 +5,7 @@ from datetime import datetime
 from enum import Enum
 from functools import lru_cache
 from http import HTTPStatus
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from office365.graph_client import GraphClient
 from office365.onedrive.sites.site import Site
@@ -30,6 +30,8 @@ class FolderNotFoundException(Exception):
 class MicrosoftSharePointRemoteFile(RemoteFile):
     download_url: str
     created_at: datetime
+    # Id of the drive the file was listed from, None for the shared items
+    drive_id: Optional[str] = None
 
 
 def filter_http_urls(files, logger):
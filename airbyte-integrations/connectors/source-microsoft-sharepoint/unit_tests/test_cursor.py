@@ -0,0 +1,79 @@
+#
+# Copyright (c) 2023 Airbyte, Inc., all rights reserved.
+#
+
+
+import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from source_microsoft_sharepoint.cursor import MicrosoftSharePointCursor
+from source_microsoft_sharepoint.utils import MicrosoftSharePointRemoteFile
+
+from airbyte_cdk.sources.file_based.config.file_based_stream_config import FileBasedStreamConfig
+from airbyte_cdk.sources.file_based.config.jsonl_format import JsonlFormat
+
+
+PREVIOUS_SYNC_STATE = {
+    "history": {},
+    "delta_links": {"documents": "documents_link_1", "archive": "archive_link_1"},
+    "delta_links_taken_at": {"documents": "2025-01-01T00:00:00.000000Z", "archive": "2025-01-01T00:00:00.000000Z"},
+}
+
+
+def remote_file(uri, drive_id):
+    return MicrosoftSharePointRemoteFile(
+        uri=uri,
+        download_url=f"https://download/{uri}",
+        last_modified=datetime.datetime(2025, 1, 1),
+        created_at=datetime.datetime(2025, 1, 1),
+        drive_id=drive_id,
+    )
+
+
+@pytest.fixture
+def cursor():
+    cursor = MicrosoftSharePointCursor(FileBasedStreamConfig(name="test", format=JsonlFormat()))
+    cursor.set_initial_state(PREVIOUS_SYNC_STATE)
+    return cursor
+
+
+def test_delta_links_are_read_from_state(cursor):
+    assert cursor.delta_links == {"documents": "documents_link_1", "archive": "archive_link_1"}
+    assert cursor.delta_links_taken_at == {"documents": datetime.datetime(2025, 1, 1), "archive": datetime.datetime(2025, 1, 1)}
+
+
+def test_each_drive_moves_to_its_next_delta_link_once_its_files_are_synced(cursor):
+    cursor.set_next_delta_links({"documents": "documents_link_2", "archive": "archive_link_2"}, datetime.datetime(2025, 1, 2))
+    files = [remote_file("report.csv", "documents"), remote_file("2024.csv", "archive")]
+    assert list(cursor.get_files_to_sync(files, MagicMock())) == files
+
+    cursor.add_file(files[0])
+    state = cursor.get_state()
+    assert state["delta_links"] == {"documents": "documents_link_2", "archive": "archive_link_1"}
+    assert state["delta_links_taken_at"] == {"documents": "2025-01-02T00:00:00.000000Z", "archive": "2025-01-01T00:00:00.000000Z"}
+
+    cursor.add_file(files[1])
+    state = cursor.get_state()
+    assert state["delta_links"] == {"documents": "documents_link_2", "archive": "archive_link_2"}
+    assert state["delta_links_taken_at"] == {"documents": "2025-01-02T00:00:00.000000Z", "archive": "2025-01-02T00:00:00.000000Z"}
+
+
+def test_drive_listed_in_full_gets_no_delta_link_until_its_files_are_synced(cursor):
+    cursor.set_next_delta_links({"documents": "documents_link_2", "new_library": "new_library_link_1"}, datetime.datetime(2025, 1, 2))
+    files = [remote_file("readme.csv", "new_library"), remote_file("shared.csv", None)]
+    list(cursor.get_files_to_sync(files, MagicMock()))
+
+    # the pending shared item does not hold any drive back, the drives which are not listed anymore are dropped
+    assert cursor.get_state()["delta_links"] == {"documents": "documents_link_2"}
+
+    cursor.add_file(files[0])
+    assert cursor.get_state()["delta_links"] == {"documents": "documents_link_2", "new_library": "new_library_link_1"}
+
+
+def test_no_delta_links_before_first_listing():
+    cursor = MicrosoftSharePointCursor(FileBasedStreamConfig(name="test", format=JsonlFormat()))
+    cursor.set_initial_state({})
+
+    assert cursor.delta_links == {}
+    assert "delta_links" not in cursor.get_state()
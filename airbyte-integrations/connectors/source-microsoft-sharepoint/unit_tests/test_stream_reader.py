@@ -618,7 +618,7 @@ not_empty_subfolder_response = {
         ),
     ],
 )
-@patch("source_microsoft_sharepoint.stream_reader.requests.get")
+@patch("source_microsoft_sharepoint.stream_reader.requests.Session.get")
 @patch("source_microsoft_sharepoint.stream_reader.SourceMicrosoftSharePointStreamReader.get_access_token")
 def test_get_shared_drive_object(
     mock_get_access_token,
@@ -967,3 +967,155 @@ def test_get_all_sites_with_no_results(test_case, search_job_value, primary_quer
             "contentclass:STS_Site NOT Path:https://test-tenant-my.sharepoint.com"
         )
         mock_execute_query.assert_called_once_with(mock_search_job)
+
+
+GRAPH_DRIVE_URL = "https://graph.microsoft.com/v1.0/drives/drive_id"
+DELTA_LINK = f"{GRAPH_DRIVE_URL}/root/delta?token=previous"
+
+
+def graph_item(item_id, name, parent_id=None, is_file=True, last_modified="2025-01-01T00:00:00Z", **kwargs):
+    item = {"id": item_id, "name": name, "lastModifiedDateTime": last_modified, "createdDateTime": "2024-01-01T00:00:00Z", **kwargs}
+    if parent_id:
+        item["parentReference"] = {"driveId": "drive_id", "id": parent_id}
+    if is_file:
+        item["file"] = {"mimeType": "text/csv"}
+        item["@microsoft.graph.downloadUrl"] = f"https://download/{item_id}"
+    else:
+        item["folder"] = {}
+    return item
+
+
+@pytest.fixture
+def delta_reader(setup_reader_class):
+    drive = MagicMock(id="drive_id", drive_type="documentLibrary", web_url="https://contoso.sharepoint.com/Shared%20Documents")
+    drive.name = "Documents"
+    setup_reader_class.config.search_scope = "ACCESSIBLE_DRIVES"
+    with (
+        patch.object(SourceMicrosoftSharePointStreamReader, "drives", new_callable=PropertyMock, return_value=[drive]),
+        patch.object(SourceMicrosoftSharePointStreamReader, "get_access_token", return_value="dummy_access_token"),
+        patch.object(SourceMicrosoftSharePointStreamReader, "_get_files_by_drive_name") as mock_get_files_by_drive_name,
+    ):
+        mock_get_files_by_drive_name.return_value = [
+            MicrosoftSharePointRemoteFile(
+                uri="listed.csv",
+                download_url="https://download/listed",
+                last_modified=datetime(2025, 1, 1),
+                created_at=datetime(2025, 1, 1),
+            )
+        ]
+        yield setup_reader_class
+
+
+@pytest.mark.parametrize(
+    "folder_path, expected_uris",
+    [
+        (
+            ".",
+            {
+                "https://contoso.sharepoint.com/Shared%20Documents/b.csv",
+                "https://contoso.sharepoint.com/Shared%20Documents/docs/a.csv",
+                "https://contoso.sharepoint.com/Shared%20Documents/reports/2024/c.csv",
+            },
+        ),
+        ("reports", {"https://contoso.sharepoint.com/Shared%20Documents/reports/2024/c.csv"}),
+        # folder paths are case-insensitive
+        ("Reports", {"https://contoso.sharepoint.com/Shared%20Documents/Reports/2024/c.csv"}),
+    ],
+)
+def test_get_changed_files_from_delta(requests_mock, delta_reader, folder_path, expected_uris):
+    delta_reader.config.folder_path = folder_path
+    requests_mock.get(
+        DELTA_LINK,
+        json={
+            "value": [
+                {"id": "root_id", "name": "root", "root": {}, "folder": {}, "lastModifiedDateTime": "2025-01-01T00:00:00Z"},
+                # Folders show up when the files under them change
+                graph_item("docs_id", "docs", "root_id", is_file=False, last_modified="2024-01-01T00:00:00Z"),
+                graph_item("a_id", "a.csv", "docs_id"),
+            ],
+            "@odata.nextLink": f"{GRAPH_DRIVE_URL}/root/delta?token=page_2",
+        },
+    )
+    requests_mock.get(
+        f"{GRAPH_DRIVE_URL}/root/delta?token=page_2",
+        json={
+            "value": [
+                graph_item("b_id", "b.csv", "root_id"),
+                graph_item("c_id", "c.csv", "2024_id"),
+                {"id": "deleted_id", "deleted": {"state": "deleted"}},
+            ],
+            "@odata.deltaLink": f"{GRAPH_DRIVE_URL}/root/delta?token=next",
+        },
+    )
+    # Paths of the folders not in the changes are requested once
+    requests_mock.get(f"{GRAPH_DRIVE_URL}/items/2024_id", json=graph_item("2024_id", "2024", "reports_id", is_file=False))
+    requests_mock.get(f"{GRAPH_DRIVE_URL}/items/reports_id", json=graph_item("reports_id", "reports", "root_id", is_file=False))
+
+    files = list(delta_reader.get_changed_files(["**"], {"drive_id": DELTA_LINK}, {"drive_id": datetime(2025, 1, 1)}, MagicMock()))
+
+    assert {file.uri for file in files} == expected_uris
+    assert {file.drive_id for file in files} == {"drive_id"}
+    assert requests_mock.call_count == 4
+    delta_reader._get_files_by_drive_name.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "delta_response",
+    [
+        pytest.param(
+            {
+                "json": {
+                    "value": [graph_item("docs_id", "renamed", "root_id", is_file=False, last_modified="2025-01-01T00:01:00Z")],
+                    "@odata.deltaLink": f"{GRAPH_DRIVE_URL}/root/delta?token=next",
+                }
+            },
+            id="folder_renamed",
+        ),
+        pytest.param({"status_code": 410, "json": {"error": {"message": "Resync required"}}}, id="delta_link_expired"),
+    ],
+)
+def test_get_changed_files_lists_drive_in_full(requests_mock, delta_reader, delta_response):
+    requests_mock.get(DELTA_LINK, **delta_response)
+    requests_mock.get(f"{GRAPH_DRIVE_URL}/items/root_id", json={"id": "root_id", "name": "root", "root": {}, "folder": {}})
+
+    files = list(delta_reader.get_changed_files(["**"], {"drive_id": DELTA_LINK}, {"drive_id": datetime(2025, 1, 1)}, MagicMock()))
+
+    assert [file.uri for file in files] == ["listed.csv"]
+    delta_reader._get_files_by_drive_name.assert_called_once_with(delta_reader.drives, ".")
+
+
+def test_get_changed_files_lists_drives_without_delta_link_in_full(requests_mock, delta_reader):
+    files = list(
+        delta_reader.get_changed_files(["**"], {"other_drive_id": DELTA_LINK}, {"other_drive_id": datetime(2025, 1, 1)}, MagicMock())
+    )
+
+    assert [file.uri for file in files] == ["listed.csv"]
+    assert requests_mock.call_count == 0
+
+
+def test_get_shared_drive_object_reads_all_children_pages(requests_mock):
+    item_url = f"{GRAPH_DRIVE_URL}/items/folder_id"
+    requests_mock.get(item_url, json=graph_item("folder_id", "folder", is_file=False))
+    requests_mock.get(
+        f"{item_url}/children", json={"value": [graph_item("a_id", "a.csv")], "@odata.nextLink": f"{item_url}/children?page=2"}
+    )
+    requests_mock.get(f"{item_url}/children?page=2", json={"value": [graph_item("b_id", "b.csv")]})
+    reader = SourceMicrosoftSharePointStreamReader()
+
+    with patch.object(SourceMicrosoftSharePointStreamReader, "get_access_token", return_value="dummy_access_token"):
+        files = list(reader._get_shared_drive_object("drive_id", "folder_id", "https://contoso.sharepoint.com/folder"))
+
+    assert [file.uri for file in files] == ["https://contoso.sharepoint.com/folder/a.csv", "https://contoso.sharepoint.com/folder/b.csv"]
+
+
+def test_get_delta_links(requests_mock, delta_reader):
+    requests_mock.get(f"{GRAPH_DRIVE_URL}/root/delta?token=latest", json={"value": [], "@odata.deltaLink": DELTA_LINK})
+
+    assert delta_reader.get_delta_links() == {"drive_id": DELTA_LINK}
+
+
+def test_graph_api_session_is_reused_and_retries(requests_mock):
+    reader = SourceMicrosoftSharePointStreamReader()
+
+    assert reader.session is reader.session
+    assert reader.session.get_adapter(GRAPH_DRIVE_URL).max_retries.status_forcelist == [429, 500, 502, 503, 504]
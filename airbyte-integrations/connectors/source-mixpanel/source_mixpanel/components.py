@@ -2,11 +2,13 @@
 
 import json
 import logging
+import re
 from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Union
 
 import dpath.util
+import orjson
 import pendulum
 import requests
 
@@ -20,8 +22,9 @@ from airbyte_cdk.sources.declarative.requesters.paginators.strategies.page_incre
 from airbyte_cdk.sources.declarative.transformations import RecordTransformation
 from airbyte_cdk.sources.declarative.types import Config, Record, StreamSlice, StreamState
 from airbyte_cdk.sources.streams.http.error_handlers import ErrorResolution, ResponseAction
+from airbyte_cdk.sources.streams.http.error_handlers.response_models import SUCCESS_RESOLUTION
 from source_mixpanel.backoff_strategy import DEFAULT_API_BUDGET
-from source_mixpanel.property_transformation import transform_property_names
+from source_mixpanel.property_transformation import transform_property_name_set
 from source_mixpanel.source import raise_config_error
 
 
@@ -359,6 +362,25 @@ class ExportHttpRequester(MixpanelHttpRequester):
         return request_params
 
 
+# Export responses can hold millions of events, they are read in larger chunks than the 512 bytes iter_lines uses by default
+EXPORT_CHUNK_SIZE = 64 * 1024
+# orjson reads integers that do not fit in 64 bits as floats, lines that may hold one are parsed with json instead
+LONG_NUMBER_PATTERN = re.compile(r"\d{19}")
+
+
+def loads(record_line: Union[str, bytes]) -> Any:
+    if isinstance(record_line, bytes):
+        # iter_lines yields bytes when the response has no encoding
+        record_line = record_line.decode()
+    if LONG_NUMBER_PATTERN.search(record_line):
+        return json.loads(record_line)
+    try:
+        return orjson.loads(record_line)
+    except orjson.JSONDecodeError:
+        # orjson is stricter than json, so only fail if json can't parse the line either
+        return json.loads(record_line)
+
+
 def iter_dicts(lines, logger=logging.getLogger("airbyte")):
     """
     The incoming stream has to be JSON lines format.
@@ -371,7 +393,7 @@ def iter_dicts(lines, logger=logging.getLogger("airbyte")):
             logger.warning(f"Couldn't fetch data from Export API. Response: {record_line}")
             return
         try:
-            yield json.loads(record_line)
+            yield loads(record_line)
         except ValueError:
             parts.append(record_line)
         else:
@@ -379,7 +401,7 @@ def iter_dicts(lines, logger=logging.getLogger("airbyte")):
 
         if len(parts) > 1:
             try:
-                yield json.loads("".join(parts))
+                yield loads("".join(parts))
             except ValueError:
                 pass
             else:
@@ -387,10 +409,9 @@ def iter_dicts(lines, logger=logging.getLogger("airbyte")):
 
 
 class ExportDpathExtractor(DpathExtractor):
-    def extract_records(self, response: requests.Response) -> List[Mapping[str, Any]]:
+    def extract_records(self, response: requests.Response) -> Iterable[Mapping[str, Any]]:
         # We prefer response.iter_lines() to response.text.split_lines() as the later can missparse text properties embeding linebreaks
-        records = list(iter_dicts(response.iter_lines(decode_unicode=True)))
-        return records
+        return iter_dicts(response.iter_lines(chunk_size=EXPORT_CHUNK_SIZE, decode_unicode=True))
 
 
 class ExportErrorHandler(DefaultErrorHandler):
@@ -398,6 +419,7 @@ class ExportErrorHandler(DefaultErrorHandler):
     Custom error handler for handling export errors specific to Mixpanel streams.
 
     This handler addresses:
+    - successful responses, which are not read here so that the export stays streamed.
     - 400 status code with "to_date cannot be later than today" message, indicating a potential timezone mismatch.
     - ConnectionResetError during response parsing, indicating a need to retry the request.
 
@@ -407,6 +429,10 @@ class ExportErrorHandler(DefaultErrorHandler):
 
     def interpret_response(self, response_or_exception: Optional[Union[requests.Response, Exception]] = None) -> ErrorResolution:
         if isinstance(response_or_exception, requests.Response):
+            if response_or_exception.ok:
+                # the response filters look for error messages in the body, which would load the whole export in memory
+                # before it is streamed to the extractor
+                return SUCCESS_RESOLUTION
             try:
                 # trying to parse response to avoid ConnectionResetError and retry if it occurs
                 iter_dicts(response_or_exception.iter_lines(decode_unicode=True))
@@ -433,15 +459,13 @@ class PropertiesTransformation(RecordTransformation):
         stream_state: Optional[StreamState] = None,
         stream_slice: Optional[StreamSlice] = None,
     ) -> None:
-        updated_record = {}
         to_transform = record[self.properties_field] if self.properties_field else record
-
-        for result in transform_property_names(to_transform.keys()):
-            updated_record[result.transformed_name] = to_transform[result.source_name]
+        updated_record = {
+            result.transformed_name: to_transform[result.source_name] for result in transform_property_name_set(frozenset(to_transform))
+        }
 
         if self.properties_field:
-            record[self.properties_field].clear()
-            record[self.properties_field].update(updated_record)
+            record[self.properties_field] = updated_record
         else:
             record.clear()
             record.update(updated_record)
@@ -3,7 +3,8 @@
 #
 
 from collections import defaultdict
-from typing import Iterable, Iterator, NamedTuple
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Iterator, NamedTuple, Tuple
 
 
 class TransformationResult(NamedTuple):
@@ -36,3 +37,12 @@ def transform_property_names(property_names: Iterable[str]) -> Iterator[Transfor
 
         lowercase_properties.add(lowercase_property_name)
         yield TransformationResult(source_name=property_name, transformed_name=property_name_transformed)
+
+
+@lru_cache(maxsize=1024)
+def transform_property_name_set(property_names: FrozenSet[str]) -> Tuple[TransformationResult, ...]:
+    """
+    Cached `transform_property_names` for a set of property names.
+    Records of a stream mostly share the same few sets of properties, so each set is only transformed once.
+    """
+    return tuple(transform_property_names(property_names))
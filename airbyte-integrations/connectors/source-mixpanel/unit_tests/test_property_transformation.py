@@ -9,6 +9,8 @@ that will conflict in further data normalization, like:
 """
 
 import pytest
+from source_mixpanel.components import PropertiesTransformation
+from source_mixpanel.property_transformation import transform_property_name_set
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.declarative.types import StreamSlice
@@ -60,3 +62,20 @@ def test_export_stream_conflict_names(requests_mock, export_response, config_raw
     assert record["userName"] == "1"
     assert record["_userName"] == "2"
     assert record["__username"] == "3"
+
+
+def test_properties_transformation_reuses_transformed_names():
+    transform_property_name_set.cache_clear()
+    transformation = PropertiesTransformation(properties_field="properties")
+    records = [
+        {"event": "Problem event", "properties": {"$userName": "1", "userName": "2", "username": str(i), "time": i}} for i in range(3)
+    ]
+
+    for record in records:
+        transformation.transform(record)
+
+    assert [record["properties"] for record in records] == [
+        {"__username": str(i), "time": i, "userName": "1", "_userName": "2"} for i in range(3)
+    ]
+    assert list(records[0]["properties"]) == ["userName", "time", "_userName", "__username"]
+    assert transform_property_name_set.cache_info().misses == 1
@@ -10,6 +10,7 @@ from unittest import mock
 
 import pendulum
 import pytest
+import requests
 import responses
 import source_mixpanel
 from source_mixpanel import SourceMixpanel
@@ -697,6 +698,34 @@ def test_export_iter_dicts():
     assert list(iter_dicts([record_string, record_string[:2], record_string[2:], record_string])) == [record, record, record]
     # drop record parts because they are not standing nearby
     assert list(iter_dicts([record_string, record_string[:2], record_string, record_string[2:]])) == [record, record]
+    # integers wider than 64 bits are still parsed
+    assert list(iter_dicts(['{"id": 123456789012345678901234567890}', '{"id": -9223372036854775809}'])) == [
+        {"id": 123456789012345678901234567890},
+        {"id": -9223372036854775809},
+    ]
+
+
+def test_export_extractor_streams_records(requests_mock, export_config):
+    stream = init_stream("export", export_config)
+    record = {"event": "Viewed page", "properties": {"time": 1485302410, "distinct_id": "1"}}
+    requests_mock.register_uri("GET", get_url_to_mock(stream), text="\n".join([json.dumps(record)] * 3))
+    requests_mock.register_uri("GET", "https://mixpanel.com/api/query/events/properties/top", json={})
+    stream_slice = StreamSlice(partition={}, cursor_slice={"start_time": "2017-01-25T00:00:00Z", "end_time": "2017-01-26T00:00:00Z"})
+
+    extract_records = source_mixpanel.components.ExportDpathExtractor.extract_records
+    content_consumed = []
+
+    def extract_streamed_records(self, response):
+        content_consumed.append(response._content_consumed)
+        return extract_records(self, response)
+
+    with mock.patch.object(source_mixpanel.components.ExportDpathExtractor, "extract_records", extract_streamed_records):
+        records = list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice))
+
+    assert stream.retriever.requester.stream_response
+    assert len(records) == 3
+    # the body is still to be read when the records are extracted
+    assert content_consumed == [False]
 
 
 @responses.activate
@@ -4,7 +4,9 @@
 
 import logging as Logger
 from abc import ABC
-from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, TypeVar
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import timedelta
+from typing import Any, Dict, Iterable, List, Mapping, MutableMapping, Optional, Tuple, TypeVar
 
 import pendulum
 import pydantic
@@ -14,6 +16,7 @@ from requests import HTTPError
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources import Source
 from airbyte_cdk.sources.streams import CheckpointMixin, Stream
+from airbyte_cdk.sources.streams.call_rate import APIBudget, HttpRequestMatcher, MovingWindowCallRatePolicy, Rate
 from airbyte_cdk.sources.streams.http import HttpStream, HttpSubStream
 from airbyte_cdk.sources.streams.http.availability_strategy import HttpAvailabilityStrategy
 from airbyte_cdk.sources.streams.http.exceptions import UserDefinedBackoffException
@@ -22,6 +25,10 @@ from airbyte_cdk.sources.streams.http.exceptions import UserDefinedBackoffExcept
 # maximum block hierarchy recursive request depth
 MAX_BLOCK_DEPTH = 30
 
+# Notion's average rate limit, shared by all the block children requests
+# Docs: https://developers.notion.com/reference/request-limits
+REQUESTS_PER_SECOND = 3
+
 
 class NotionAvailabilityStrategy(HttpAvailabilityStrategy):
     """
@@ -265,11 +272,32 @@ class Blocks(HttpSubStream, IncrementalNotionStream):
 
     http_method = "GET"
 
-    # block id stack for block hierarchy traversal
-    block_id_stack = []
+    # number of blocks whose children are requested at the same time
+    max_workers = 3
 
-    def path(self, **kwargs) -> str:
-        return f"blocks/{self.block_id_stack[-1]}/children"
+    # State field holding the `last_edited_time` of each page whose blocks were read, a page is not read again until it advances
+    page_checkpoints_field = "page_last_edited_times"
+    # The checkpoints of every page read are only sent with the state every this many pages and once the last page is read
+    state_checkpoint_interval = 100
+
+    def __init__(self, **kwargs):
+        # pages read during this sync, pages no longer returned by the parent stream are dropped from the state
+        self._page_checkpoints = {}
+        self._pages_read = 0
+        kwargs.setdefault(
+            "api_budget",
+            APIBudget(
+                policies=[
+                    MovingWindowCallRatePolicy(
+                        rates=[Rate(limit=REQUESTS_PER_SECOND, interval=timedelta(seconds=1))], matchers=[HttpRequestMatcher()]
+                    )
+                ]
+            ),
+        )
+        super().__init__(**kwargs)
+
+    def path(self, stream_slice: Mapping[str, Any] = None, **kwargs) -> str:
+        return f"blocks/{stream_slice['block_id']}/children"
 
     def request_params(self, next_page_token: Mapping[str, Any] = None, **kwargs) -> MutableMapping[str, Any]:
         params = {"page_size": self.page_size}
@@ -283,18 +311,18 @@ class Blocks(HttpSubStream, IncrementalNotionStream):
         cursor_field: List[str] = None,
         stream_state: Mapping[str, Any] = None,
     ) -> Iterable[Optional[Mapping[str, Any]]]:
-        # gather parent stream records in full
-        slices = list(super().stream_slices(SyncMode.full_refresh, cursor_field, stream_state))
-
         self.is_finished = False
-        for page in slices:
-            page_id = page["parent"]["id"]
-            self.block_id_stack.append(page_id)
-
+        page_slice = None
+        # each page is yielded once the next one is known, so that the last one can be told apart
+        for page in super().stream_slices(SyncMode.full_refresh, cursor_field, stream_state):
+            if page_slice:
+                yield page_slice
+            page_slice = {"page_id": page["parent"]["id"], "last_edited_time": page["parent"].get("last_edited_time")}
+
+        if page_slice:
             # stream sync is finished when it is on the last slice
-            self.is_finished = page_id == slices[-1]["parent"]["id"]
-
-            yield {"page_id": page_id}
+            self.is_finished = True
+            yield page_slice
 
     def transform(self, record: Mapping[str, Any]) -> Mapping[str, Any]:
         transform_object_field = record.get("type")
@@ -320,21 +348,85 @@ class Blocks(HttpSubStream, IncrementalNotionStream):
             if record["type"] not in ("child_page", "child_database", "ai_block"):
                 yield self.transform(record)
 
-    def read_records(self, **kwargs) -> Iterable[Mapping[str, Any]]:
-        # if reached recursive limit, don't read anymore
-        if len(self.block_id_stack) > MAX_BLOCK_DEPTH:
-            return
+    def read_records(
+        self, sync_mode: SyncMode, stream_slice: Mapping[str, Any] = None, stream_state: Mapping[str, Any] = None, **kwargs
+    ) -> Iterable[Mapping[str, Any]]:
+        if sync_mode == SyncMode.full_refresh:
+            stream_state = None
 
-        records = super().read_records(**kwargs)
-        for record in records:
+        self.state = stream_state or {}
+
+        page_id = stream_slice["page_id"]
+        page_last_edited_time = stream_slice.get("last_edited_time")
+        # Notion truncates `last_edited_time` to the minute, so a page edited within the last minute may still change without it advancing
+        settled_time = pendulum.now("UTC").subtract(minutes=1).format("YYYY-MM-DDTHH:mm:ss.SSS[Z]")
+
+        if not self._is_page_unchanged(page_id, page_last_edited_time, stream_state):
+            block_children = self._read_block_tree(page_id, sync_mode, stream_state)
+            # the page's records are emitted once its whole subtree is read, in the depth first order of the hierarchy
+            for record in self._walk_block_tree(page_id, block_children):
+                self.state = self._get_updated_state(self.state, record)
+                yield record
+
+        if page_last_edited_time and page_last_edited_time <= settled_time:
+            self._page_checkpoints[page_id] = page_last_edited_time
+        self._pages_read += 1
+        if self.is_finished or self._pages_read % self.state_checkpoint_interval == 0:
+            self.state = {**self.state, self.page_checkpoints_field: dict(self._page_checkpoints)}
+
+    def _is_page_unchanged(self, page_id: str, page_last_edited_time: Optional[str], stream_state: Optional[Mapping[str, Any]]) -> bool:
+        """
+        A page's `last_edited_time` advances whenever any of its blocks is edited, so the block tree of a page which did not advance
+        since it was last read has nothing new to sync.
+        """
+        checkpoint = (stream_state or {}).get(self.page_checkpoints_field, {}).get(page_id)
+        return bool(checkpoint and page_last_edited_time and page_last_edited_time <= checkpoint)
+
+    def _read_children(self, block_id: str, sync_mode: SyncMode, stream_state: Mapping[str, Any]) -> List[Mapping[str, Any]]:
+        # skip IncrementalNotionStream.read_records, the state is only updated from the records emitted by read_records
+        records = super(IncrementalNotionStream, self).read_records(
+            sync_mode, stream_slice={"block_id": block_id}, stream_state=stream_state
+        )
+        try:
+            return list(records)
+        except UserDefinedBackoffException as e:
+            message = self.check_invalid_start_cursor(e.response)
+            if message:
+                self.logger.error(f"Skipping children of block {block_id} in stream {self.name}, error message: {message}")
+                return []
+            raise e
+
+    def _read_block_tree(self, page_id: str, sync_mode: SyncMode, stream_state: Mapping[str, Any]) -> Mapping[str, List[Mapping[str, Any]]]:
+        """
+        Read the children of every block under the page, `max_workers` blocks at a time, a block's children being requested as soon
+        as the block is read. Returns the children records of each block read.
+        """
+        block_children = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            pending: Dict[Future, Tuple[str, int]] = {executor.submit(self._read_children, page_id, sync_mode, stream_state): (page_id, 1)}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    block_id, depth = pending.pop(future)
+                    block_children[block_id] = future.result()
+                    # if reached recursive limit, don't read anymore
+                    if depth >= MAX_BLOCK_DEPTH:
+                        continue
+                    for record in block_children[block_id]:
+                        if record.get("has_children", False):
+                            child_future = executor.submit(self._read_children, record["id"], sync_mode, stream_state)
+                            pending[child_future] = (record["id"], depth + 1)
+        finally:
+            executor.shutdown(cancel_futures=True)
+        return block_children
+
+    def _walk_block_tree(self, block_id: str, block_children: Mapping[str, List[Mapping[str, Any]]]) -> Iterable[Mapping[str, Any]]:
+        for record in block_children.get(block_id, []):
             if record.get("has_children", False):
-                # do the depth first traversal recursive call, get children blocks
-                self.block_id_stack.append(record["id"])
-                yield from self.read_records(**kwargs)
+                yield from self._walk_block_tree(record["id"], block_children)
             yield record
 
-        self.block_id_stack.pop()
-
     def should_retry(self, response: requests.Response) -> bool:
         if response.status_code == 404:
             setattr(self, "raise_on_http_errors", False)
@@ -3,6 +3,7 @@
 #
 
 import re
+import threading
 import time
 from http import HTTPStatus
 from unittest.mock import MagicMock, patch
@@ -11,7 +12,7 @@ import freezegun
 import pytest
 import requests
 from pytest import fixture, mark
-from source_notion.streams import Blocks, IncrementalNotionStream, NotionStream, Pages
+from source_notion.streams import MAX_BLOCK_DEPTH, Blocks, IncrementalNotionStream, NotionStream, Pages
 
 from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.http.exceptions import DefaultBackoffException, UserDefinedBackoffException
@@ -134,7 +135,10 @@ def test_stream_slices(blocks, requests_mock):
         },
     )
     inputs = {"sync_mode": SyncMode.incremental, "cursor_field": [], "stream_state": {}}
-    expected_stream_slice = [{"page_id": "aaa"}, {"page_id": "bbb"}]
+    expected_stream_slice = [
+        {"page_id": "aaa", "last_edited_time": "2022-10-10T00:00:00.000Z"},
+        {"page_id": "bbb", "last_edited_time": "2022-10-10T00:00:00.000Z"},
+    ]
     assert list(stream.stream_slices(**inputs)) == expected_stream_slice
 
 
@@ -178,6 +182,69 @@ def test_end_of_stream_state(blocks, requests_mock):
                 assert state_value == "2021-10-01T00:00:00.000Z"
 
 
+@freezegun.freeze_time("2022-10-20T00:00:00Z")
+def test_unchanged_pages_are_not_read_again(parent, args, requests_mock):
+    pages = [{"id": "aaa", "last_edited_time": "2022-10-10T00:00:00.000Z"}, {"id": "bbb", "last_edited_time": "2022-10-10T00:00:00.000Z"}]
+    requests_mock.post("https://api.notion.com/v1/search", json={"results": pages, "next_cursor": None})
+    children_requests = {}
+    for page in pages:
+        block = {"id": f"{page['id']} block", "type": "heading_1", "has_children": False, "last_edited_time": "2022-10-10T00:00:00.000Z"}
+        children_requests[page["id"]] = requests_mock.get(
+            f"https://api.notion.com/v1/blocks/{page['id']}/children", json={"results": [block], "next_cursor": None}
+        )
+
+    def read(stream_state):
+        stream = Blocks(parent=parent, **args)
+        stream.state = stream_state
+        records = []
+        for stream_slice in stream.stream_slices(SyncMode.incremental, stream_state=stream_state):
+            records.extend(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice, stream_state=stream_state))
+        return records, stream.state
+
+    records, state = read({})
+    assert [record["id"] for record in records] == ["aaa block", "bbb block"]
+    assert state["page_last_edited_times"] == {"aaa": "2022-10-10T00:00:00.000Z", "bbb": "2022-10-10T00:00:00.000Z"}
+
+    # a block of the second page is edited
+    pages[1]["last_edited_time"] = "2022-10-15T00:00:00.000Z"
+    records, state = read({"last_edited_time": "2022-10-01T00:00:00.000Z", "page_last_edited_times": state["page_last_edited_times"]})
+
+    assert [record["id"] for record in records] == ["bbb block"]
+    assert children_requests["aaa"].call_count == 1
+    assert children_requests["bbb"].call_count == 2
+    assert state["page_last_edited_times"] == {"aaa": "2022-10-10T00:00:00.000Z", "bbb": "2022-10-15T00:00:00.000Z"}
+
+
+@freezegun.freeze_time("2022-10-20T00:00:00Z")
+def test_page_checkpoints_are_sent_every_interval_and_on_last_page(blocks, requests_mock, mocker):
+    mocker.patch.object(Blocks, "state_checkpoint_interval", 2)
+    pages = [{"id": page_id, "last_edited_time": "2022-10-10T00:00:00.000Z"} for page_id in ("aaa", "bbb", "ccc")]
+    requests_mock.post("https://api.notion.com/v1/search", json={"results": pages, "next_cursor": None})
+    for page in pages:
+        requests_mock.get(f"https://api.notion.com/v1/blocks/{page['id']}/children", json={"results": [], "next_cursor": None})
+
+    page_checkpoints = []
+    for stream_slice in blocks.stream_slices(SyncMode.incremental, stream_state={}):
+        list(blocks.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice, stream_state={}))
+        page_checkpoints.append(blocks.state.get("page_last_edited_times"))
+
+    assert page_checkpoints == [
+        None,
+        {"aaa": "2022-10-10T00:00:00.000Z", "bbb": "2022-10-10T00:00:00.000Z"},
+        {"aaa": "2022-10-10T00:00:00.000Z", "bbb": "2022-10-10T00:00:00.000Z", "ccc": "2022-10-10T00:00:00.000Z"},
+    ]
+
+
+@freezegun.freeze_time("2022-10-10T00:00:30Z")
+def test_recently_edited_page_is_not_checkpointed(blocks, requests_mock):
+    requests_mock.get("https://api.notion.com/v1/blocks/aaa/children", json={"results": [], "next_cursor": None})
+    stream_slice = {"page_id": "aaa", "last_edited_time": "2022-10-10T00:00:00.000Z"}
+
+    list(blocks.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice, stream_state={}))
+
+    assert blocks.state["page_last_edited_times"] == {}
+
+
 def test_get_updated_state(stream):
     stream.is_finished = False
 
@@ -212,15 +279,15 @@ def test_record_filter(blocks, requests_mock):
     inputs = {
         "sync_mode": sync_mode,
         "stream_state": {"last_edited_time": "2021-10-10T00:00:00.000Z"},
+        "stream_slice": {"page_id": root},
     }
-    stream.block_id_stack = [root]
     assert next(stream.read_records(**inputs)) == record
 
     inputs = {
         "sync_mode": sync_mode,
         "stream_state": {"last_edited_time": "2021-10-30T00:00:00.000Z"},
+        "stream_slice": {"page_id": root},
     }
-    stream.block_id_stack = [root]
     assert list(stream.read_records(**inputs)) == []
 
     # 'child_page' and 'child_database' should not be included
@@ -228,11 +295,10 @@ def test_record_filter(blocks, requests_mock):
     inputs = {
         "sync_mode": sync_mode,
         "stream_state": {"last_edited_time": "2021-10-10T00:00:00.000Z"},
+        "stream_slice": {"page_id": root},
     }
-    stream.block_id_stack = [root]
     assert list(stream.read_records(**inputs)) == []
     record["type"] = "child_database"
-    stream.block_id_stack = [root]
     assert list(stream.read_records(**inputs)) == []
 
 
@@ -253,11 +319,50 @@ def test_recursive_read(blocks, requests_mock):
     requests_mock.get(f"https://api.notion.com/v1/blocks/{record1['id']}/children", json={"results": [record2], "next_cursor": None})
     requests_mock.get(f"https://api.notion.com/v1/blocks/{record2['id']}/children", json={"results": [record3], "next_cursor": None})
 
-    inputs = {"sync_mode": SyncMode.incremental}
-    stream.block_id_stack = [root]
+    inputs = {"sync_mode": SyncMode.incremental, "stream_slice": {"page_id": root}}
     assert list(stream.read_records(**inputs)) == [record3, record2, record1, record4]
 
 
+def test_read_block_tree_concurrently(blocks, mocker):
+    # block records tree, the children of record1 and record2 have to be requested at the same time for the barrier to be passed:
+    #
+    # root |-> record1 -> record3 -> record5
+    #      |-> record2 -> record4
+    root = "aaa"
+    records = {
+        f"id{index}": {"id": f"id{index}", "type": "heading_1", "has_children": index < 5, "last_edited_time": "2022-10-10T00:00:00.000Z"}
+        for index in range(1, 6)
+    }
+    tree = {root: ["id1", "id2"], "id1": ["id3"], "id2": ["id4"], "id3": ["id5"], "id4": []}
+    barrier = threading.Barrier(2, timeout=10)
+
+    def read_children(block_id, sync_mode, stream_state):
+        if block_id in ("id1", "id2"):
+            barrier.wait()
+        return [records[child_id] for child_id in tree[block_id]]
+
+    read_children_mock = mocker.patch.object(blocks, "_read_children", side_effect=read_children)
+
+    records_read = list(blocks.read_records(sync_mode=SyncMode.incremental, stream_slice={"page_id": root}))
+
+    assert [record["id"] for record in records_read] == ["id5", "id3", "id1", "id4", "id2"]
+    assert sorted(call.args[0] for call in read_children_mock.call_args_list) == sorted(tree)
+
+
+def test_read_block_tree_depth_limit(blocks, mocker):
+    # a chain of blocks deeper than the limit, each having a single child
+    def read_children(block_id, sync_mode, stream_state):
+        depth = int(block_id)
+        return [{"id": str(depth + 1), "type": "heading_1", "has_children": True, "last_edited_time": "2022-10-10T00:00:00.000Z"}]
+
+    read_children_mock = mocker.patch.object(blocks, "_read_children", side_effect=read_children)
+
+    records_read = list(blocks.read_records(sync_mode=SyncMode.incremental, stream_slice={"page_id": "1"}))
+
+    assert read_children_mock.call_count == MAX_BLOCK_DEPTH
+    assert [record["id"] for record in records_read] == [str(depth) for depth in range(MAX_BLOCK_DEPTH + 1, 1, -1)]
+
+
 def test_invalid_start_cursor(parent, requests_mock, caplog):
     stream = parent
     error_message = "The start_cursor provided is invalid: wrong_start_cursor"
@@ -391,8 +496,7 @@ def test_empty_blocks_results(requests_mock):
             "next_cursor": None,
         },
     )
-    stream.block_id_stack = ["aaa"]
-    assert list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=[])) == []
+    assert list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice={"page_id": "aaa"})) == []
 
 
 @pytest.mark.parametrize(
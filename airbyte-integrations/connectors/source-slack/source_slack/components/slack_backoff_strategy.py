@@ -2,7 +2,7 @@
 # Copyright (c) 2024 Airbyte, Inc., all rights reserved.
 #
 import logging
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 from requests import RequestException, Response
 
@@ -10,8 +10,10 @@ from airbyte_cdk.sources.streams.http.error_handlers import BackoffStrategy
 
 
 class SlackBackoffStrategy(BackoffStrategy):
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, on_retry_after: Optional[Callable[[float], None]] = None):
         self.logger = logger
+        # Notified of each `Retry-After` value, so that requests sent concurrently can be held back as well
+        self.on_retry_after = on_retry_after
 
     def backoff_time(self, response_or_exception: Optional[Union[Response, RequestException]], **kwargs) -> Optional[float]:
         """
@@ -22,7 +24,10 @@ class SlackBackoffStrategy(BackoffStrategy):
         Rate Limits Docs: https://api.slack.com/docs/rate-limits#web
         """
         if isinstance(response_or_exception, Response) and "Retry-After" in response_or_exception.headers:
-            return int(response_or_exception.headers["Retry-After"])
+            retry_after = int(response_or_exception.headers["Retry-After"])
+            if self.on_retry_after:
+                self.on_retry_after(retry_after)
+            return retry_after
         else:
             self.logger.info("Retry-after header not found. Using default backoff value")
             return 5
@@ -3,8 +3,14 @@
 #
 
 
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Iterable, List, Mapping, MutableMapping, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import groupby
+from queue import Full, Queue
+from typing import Any, Deque, Iterable, List, Mapping, MutableMapping, Optional, Tuple
 
 import pendulum
 import requests
@@ -208,9 +214,97 @@ class IncrementalMessageStream(ChanneledStream, CheckpointMixin, ABC):
 
 
 class ChannelMessages(HttpSubStream, IncrementalMessageStream):
+    # Number of channels whose history is read at the same time by `read_channel_slices`
+    max_concurrent_channels = 4
+    # Number of slices each channel reads ahead of the one being consumed, the channel waits for them to be consumed past it
+    max_queued_slices = 2
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._retry_after_lock = threading.Lock()
+        # Monotonic time before which no new page is requested, pushed back each time Slack answers with a `Retry-After`
+        self._resume_reads_at = 0.0
+
     def path(self, **kwargs) -> str:
         return "conversations.history"
 
+    def get_backoff_strategy(self) -> BackoffStrategy:
+        return SlackBackoffStrategy(logger=self.logger, on_retry_after=self._hold_reads)
+
+    def _hold_reads(self, retry_after: float) -> None:
+        with self._retry_after_lock:
+            self._resume_reads_at = max(self._resume_reads_at, time.monotonic() + retry_after)
+
+    def _wait_for_rate_limit(self) -> None:
+        delay = self._resume_reads_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _fetch_next_page(
+        self,
+        stream_slice: Optional[Mapping[str, Any]] = None,
+        stream_state: Optional[Mapping[str, Any]] = None,
+        next_page_token: Optional[Mapping[str, Any]] = None,
+    ) -> Tuple[requests.PreparedRequest, requests.Response]:
+        self._wait_for_rate_limit()
+        return super()._fetch_next_page(stream_slice, stream_state, next_page_token)
+
+    @staticmethod
+    def _put(channel_queue: Queue, item: Any, stopped: threading.Event) -> bool:
+        """
+        Wait for room in the queue unless the slices stopped being consumed, returns whether the item was queued.
+        """
+        while not stopped.is_set():
+            try:
+                channel_queue.put(item, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def _read_channel(self, channel_slices: List[Mapping[str, Any]], channel_queue: Queue, stopped: threading.Event) -> None:
+        try:
+            for stream_slice in channel_slices:
+                if stopped.is_set():
+                    return
+                messages = list(self.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice))
+                if not self._put(channel_queue, (stream_slice, messages), stopped):
+                    return
+        finally:
+            # tell the consumer the channel is done, the error it may have failed with is raised by its future
+            self._put(channel_queue, None, stopped)
+
+    def _consume_channel(self, channel_read: Tuple[Future, Queue]) -> Iterable[Tuple[Mapping[str, Any], List[Mapping[str, Any]]]]:
+        future, channel_queue = channel_read
+        for channel_slice in iter(channel_queue.get, None):
+            yield channel_slice
+        future.result()
+
+    def read_channel_slices(
+        self, stream_slices: Iterable[Mapping[str, Any]]
+    ) -> Iterable[Tuple[Mapping[str, Any], List[Mapping[str, Any]]]]:
+        """
+        Read the messages of each slice, `max_concurrent_channels` channels at a time.
+        The slices of a channel are read one after another by the same worker, so each channel moves its own cursor
+        forward, and every worker waits out the `Retry-After` Slack sent to any of them before requesting its next page.
+        Each slice is handed over with its messages as soon as it is read, in the order the slices were given, and a channel
+        reads at most `max_queued_slices` slices ahead of the one being consumed.
+        """
+        pending: Deque[Tuple[Future, Queue]] = deque()
+        stopped = threading.Event()
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_channels) as executor:
+            try:
+                for _, channel_slices in groupby(stream_slices, key=lambda stream_slice: stream_slice.get("channel")):
+                    if len(pending) == self.max_concurrent_channels:
+                        yield from self._consume_channel(pending.popleft())
+                    channel_queue = Queue(maxsize=self.max_queued_slices)
+                    pending.append((executor.submit(self._read_channel, list(channel_slices), channel_queue, stopped), channel_queue))
+                while pending:
+                    yield from self._consume_channel(pending.popleft())
+            finally:
+                # let the workers return if the slices stop being consumed
+                stopped.set()
+
     @property
     def use_cache(self) -> bool:
         return True
@@ -231,6 +325,11 @@ class ChannelMessages(HttpSubStream, IncrementalMessageStream):
 
 
 class Threads(IncrementalMessageStream):
+    # State field holding the `latest_reply` of each thread read so far, in least to most recently read order
+    thread_checkpoints_field = "latest_replies"
+    # Oldest checkpoints are evicted past this size, their threads are read again the next time they show up in the lookback window
+    max_thread_checkpoints = 10_000
+
     def __init__(self, lookback_window: Mapping[str, int], **kwargs):
         self.messages_lookback_window = lookback_window
         super().__init__(**kwargs)
@@ -238,6 +337,44 @@ class Threads(IncrementalMessageStream):
     def path(self, **kwargs) -> str:
         return "conversations.replies"
 
+    def request_params(self, stream_state: Mapping[str, Any], stream_slice: Mapping[str, Any] = None, **kwargs) -> MutableMapping[str, Any]:
+        params = super().request_params(stream_state=stream_state, stream_slice=stream_slice, **kwargs)
+        params.pop("latest_reply", None)
+        return params
+
+    @staticmethod
+    def _thread_key(channel: str, thread_ts: str) -> str:
+        return f"{channel}:{thread_ts}"
+
+    def _has_new_replies(self, channel: str, message: Mapping[str, Any], thread_checkpoints: Mapping[str, str]) -> bool:
+        if not message.get("reply_count"):
+            return False
+        latest_reply = message.get("latest_reply")
+        checkpoint = thread_checkpoints.get(self._thread_key(channel, message[self.sub_primary_key_2]))
+        return not (latest_reply and checkpoint) or float(latest_reply) > float(checkpoint)
+
+    def _checkpoint_thread(self, current_stream_state: MutableMapping[str, Any], stream_slice: Mapping[str, Any]) -> Mapping[str, Any]:
+        current_stream_state = current_stream_state or {}
+        thread_checkpoints = current_stream_state.setdefault(self.thread_checkpoints_field, {})
+        thread_key = self._thread_key(stream_slice["channel"], stream_slice[self.sub_primary_key_2])
+        # re-insert the thread to mark it as the most recently read one
+        thread_checkpoints.pop(thread_key, None)
+        thread_checkpoints[thread_key] = stream_slice["latest_reply"]
+        while len(thread_checkpoints) > self.max_thread_checkpoints:
+            del thread_checkpoints[next(iter(thread_checkpoints))]
+        return current_stream_state
+
+    def read_records(
+        self,
+        sync_mode: SyncMode,
+        cursor_field: List[str] = None,
+        stream_slice: Mapping[str, Any] = None,
+        stream_state: Mapping[str, Any] = None,
+    ) -> Iterable[Mapping[str, Any]]:
+        yield from super().read_records(sync_mode, cursor_field=cursor_field, stream_slice=stream_slice, stream_state=stream_state)
+        if stream_slice and stream_slice.get("latest_reply"):
+            self.state = self._checkpoint_thread(self.state, stream_slice)
+
     def stream_slices(self, stream_state: Mapping[str, Any] = None, **kwargs) -> Iterable[Optional[Mapping[str, Any]]]:
         """
         The logic for incrementally syncing threads is not very obvious, so buckle up.
@@ -251,13 +388,16 @@ class Threads(IncrementalMessageStream):
 
         A pragmatic workaround is to say we want threads to be at least N days fresh i.e: look back N days into the past,
         get every message since, and read all of the thread responses. This is essentially the approach we're taking here via slicing:
-        create slices from N days into the past and read all messages in threads since then. We could optionally filter out records we have
-        already read, but that's omitted to keep the logic simple to reason about.
+        create slices from N days into the past and read all messages in threads since then.
+
+        Only messages that started a thread are sliced, and a thread is skipped if its `latest_reply` is not newer than the one
+        checkpointed in the state when it was last read.
 
         Good luck.
         """
 
         stream_state = stream_state or {}
+        thread_checkpoints = stream_state.get(self.thread_checkpoints_field, {})
         channels_stream = Channels(
             authenticator=self._http_client._session.auth,
             channel_filter=self.channel_filter,
@@ -283,10 +423,17 @@ class Threads(IncrementalMessageStream):
         )
 
         slice_yielded = False
-        for message_chunk in messages_stream.stream_slices(stream_state={self.cursor_field: messages_start_date.timestamp()}):
+        message_chunks = messages_stream.stream_slices(stream_state={self.cursor_field: messages_start_date.timestamp()})
+        for message_chunk, messages in messages_stream.read_channel_slices(message_chunks):
             self.logger.info(f"Syncing replies {message_chunk}")
-            for message in messages_stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=message_chunk):
-                yield {"channel": message_chunk["channel"], self.sub_primary_key_2: message[self.sub_primary_key_2]}
+            for message in messages:
+                if not self._has_new_replies(message_chunk["channel"], message, thread_checkpoints):
+                    continue
+                yield {
+                    "channel": message_chunk["channel"],
+                    self.sub_primary_key_2: message[self.sub_primary_key_2],
+                    "latest_reply": message.get("latest_reply"),
+                }
                 slice_yielded = True
         if not slice_yielded:
             # yield an empty slice to checkpoint state later
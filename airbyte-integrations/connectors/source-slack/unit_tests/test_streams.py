@@ -2,14 +2,17 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 #
 
+import threading
+import time
 from unittest.mock import MagicMock, Mock
 
 import pendulum
 import pytest
 from requests import Response
 from source_slack import SourceSlack
-from source_slack.streams import Channels, JoinChannelsStream, Threads
+from source_slack.streams import ChannelMessages, Channels, JoinChannelsStream, Threads
 
+from airbyte_cdk.models import SyncMode
 from airbyte_cdk.sources.streams.http.error_handlers import ResponseAction
 from airbyte_cdk.sources.streams.http.requests_native_auth import TokenAuthenticator
 
@@ -33,14 +36,38 @@ def get_stream_by_name(stream_name, config):
         (
             "2020-01-01T00:00:00Z",
             "2020-01-02T00:00:00Z",
-            [{"ts": 1577866844}, {"ts": 1577877406}],
+            [
+                {"ts": 1577866844, "reply_count": 1, "latest_reply": "1577866900.000100"},
+                {"ts": 1577877406, "reply_count": 2, "latest_reply": "1577877500.000100"},
+                {"ts": 1577877410},
+            ],
             {},
             [
-                # two messages per each channel
-                {"channel": "airbyte-for-beginners", "ts": 1577866844},
-                {"channel": "airbyte-for-beginners", "ts": 1577877406},
-                {"channel": "good-reads", "ts": 1577866844},
-                {"channel": "good-reads", "ts": 1577877406},
+                # two threads per each channel, the message without replies is skipped
+                {"channel": "airbyte-for-beginners", "ts": 1577866844, "latest_reply": "1577866900.000100"},
+                {"channel": "airbyte-for-beginners", "ts": 1577877406, "latest_reply": "1577877500.000100"},
+                {"channel": "good-reads", "ts": 1577866844, "latest_reply": "1577866900.000100"},
+                {"channel": "good-reads", "ts": 1577877406, "latest_reply": "1577877500.000100"},
+            ],
+        ),
+        (
+            "2020-01-01T00:00:00Z",
+            "2020-01-02T00:00:00Z",
+            [
+                {"ts": 1577866844, "reply_count": 1, "latest_reply": "1577866900.000100"},
+                {"ts": 1577877406, "reply_count": 2, "latest_reply": "1577877500.000100"},
+            ],
+            {
+                "latest_replies": {
+                    "airbyte-for-beginners:1577866844": "1577866900.000100",
+                    "airbyte-for-beginners:1577877406": "1577877400.000100",
+                    "good-reads:1577866844": "1577866900.000100",
+                }
+            },
+            [
+                # only the threads with replies newer than their checkpoint
+                {"channel": "airbyte-for-beginners", "ts": 1577877406, "latest_reply": "1577877500.000100"},
+                {"channel": "good-reads", "ts": 1577877406, "latest_reply": "1577877500.000100"},
             ],
         ),
         ("2020-01-02T00:00:00Z", "2020-01-01T00:00:00Z", [], {}, [{}]),
@@ -83,6 +110,164 @@ def test_threads_stream_slices(requests_mock, authenticator, token_config, start
     assert slices == expected_result
 
 
+def test_threads_second_sync_reads_only_updated_threads(mocker, requests_mock, authenticator, token_config):
+    # the messages change between the syncs, so they must not be read from the cache
+    mocker.patch.object(ChannelMessages, "use_cache", False)
+    token_config["channel_filter"] = []
+    messages = [
+        {"ts": "1577866844.000100", "reply_count": 1, "latest_reply": "1577866900.000100"},
+        {"ts": "1577877406.000100", "reply_count": 1, "latest_reply": "1577877500.000100"},
+        {"ts": "1577877410.000100"},
+    ]
+    for channel in ("airbyte-for-beginners", "good-reads"):
+        requests_mock.register_uri(
+            "GET",
+            f"https://slack.com/api/conversations.history?limit=1000&channel={channel}",
+            json={"messages": messages},
+        )
+    replies = requests_mock.register_uri(
+        "GET",
+        "https://slack.com/api/conversations.replies",
+        json={"messages": [{"ts": "1577866844.000100"}, {"ts": "1577866900.000100"}]},
+    )
+
+    def read(stream_state):
+        stream = Threads(
+            authenticator=authenticator,
+            default_start_date=pendulum.parse("2020-01-01T00:00:00Z"),
+            end_date=pendulum.parse("2020-01-02T00:00:00Z"),
+            lookback_window=pendulum.Duration(days=token_config["lookback_window"]),
+        )
+        stream.state = stream_state
+        for stream_slice in stream.stream_slices(stream_state=stream_state):
+            list(stream.read_records(sync_mode=SyncMode.incremental, stream_slice=stream_slice, stream_state=stream_state))
+        return stream.state
+
+    state = read({})
+    assert replies.call_count == 4
+
+    # a new reply is posted in one of the threads
+    messages[1]["latest_reply"] = "1577877600.000100"
+    state = read(state)
+
+    second_sync_requests = replies.request_history[4:]
+    assert [request.qs["channel"][0] for request in second_sync_requests] == ["airbyte-for-beginners", "good-reads"]
+    assert [request.qs["ts"][0] for request in second_sync_requests] == ["1577877406.000100", "1577877406.000100"]
+    assert "latest_reply" not in second_sync_requests[0].qs
+    assert state["latest_replies"] == {
+        "airbyte-for-beginners:1577866844.000100": "1577866900.000100",
+        "good-reads:1577866844.000100": "1577866900.000100",
+        "airbyte-for-beginners:1577877406.000100": "1577877600.000100",
+        "good-reads:1577877406.000100": "1577877600.000100",
+    }
+
+
+def test_channel_messages_reads_channels_concurrently(mocker, authenticator):
+    # both channels have to be read at the same time for the barrier to be passed
+    barrier = threading.Barrier(2, timeout=10)
+
+    def read_records(sync_mode, stream_slice):
+        barrier.wait()
+        return [{"channel_id": stream_slice["channel"], "ts": stream_slice["oldest"]}]
+
+    stream = ChannelMessages(
+        parent=Channels(authenticator=authenticator, channel_filter=[]),
+        authenticator=authenticator,
+        default_start_date=pendulum.parse("2020-01-01T00:00:00Z"),
+        end_date=pendulum.parse("2020-10-01T00:00:00Z"),
+    )
+    mocker.patch.object(stream, "read_records", side_effect=read_records)
+    stream_slices = list(stream.stream_slices())
+
+    channel_slices = list(stream.read_channel_slices(stream_slices))
+
+    assert [stream_slice["channel"] for stream_slice in stream_slices] == ["airbyte-for-beginners"] * 3 + ["good-reads"] * 3
+    assert channel_slices == [
+        (stream_slice, [{"channel_id": stream_slice["channel"], "ts": stream_slice["oldest"]}]) for stream_slice in stream_slices
+    ]
+
+
+def test_channel_messages_wait_for_retry_after(mocker, authenticator):
+    sleep = mocker.patch("source_slack.streams.time.sleep")
+    stream = ChannelMessages(
+        parent=Channels(authenticator=authenticator, channel_filter=[]),
+        authenticator=authenticator,
+        default_start_date=pendulum.parse("2020-01-01T00:00:00Z"),
+    )
+    stream._wait_for_rate_limit()
+    sleep.assert_not_called()
+
+    stream.get_backoff_strategy().backoff_time(MagicMock(spec=Response, headers={"Retry-After": 30}))
+    stream._wait_for_rate_limit()
+
+    assert 29 < sleep.call_args.args[0] <= 30
+
+
+def test_channel_messages_read_ahead_is_bounded(mocker, authenticator):
+    read_slices = []
+
+    def read_records(sync_mode, stream_slice):
+        read_slices.append(stream_slice)
+        return [{"channel_id": stream_slice["channel"], "ts": stream_slice["oldest"]}]
+
+    stream = ChannelMessages(
+        parent=Channels(authenticator=authenticator, channel_filter=[]),
+        authenticator=authenticator,
+        default_start_date=pendulum.parse("2020-01-01T00:00:00Z"),
+    )
+    mocker.patch.object(stream, "max_queued_slices", 1)
+    mocker.patch.object(stream, "read_records", side_effect=read_records)
+    stream_slices = [{"channel": "airbyte-for-beginners", "oldest": oldest, "latest": oldest + 1} for oldest in range(10)]
+
+    channel_slices = stream.read_channel_slices(stream_slices)
+    assert next(channel_slices)[0] == stream_slices[0]
+    # the slice waiting in the queue and the one waiting for room in it
+    time.sleep(0.5)
+    assert read_slices == stream_slices[:3]
+
+    channel_slices.close()
+    assert read_slices == stream_slices[:3]
+
+
+def test_channel_messages_wait_for_rate_limit_before_each_page(requests_mock, mocker, authenticator):
+    requests_mock.get(
+        "https://slack.com/api/conversations.history",
+        [
+            {"json": {"messages": [{"ts": "1577866844.000100"}], "response_metadata": {"next_cursor": "page-2"}}},
+            {"json": {"messages": [{"ts": "1577866845.000100"}], "response_metadata": {"next_cursor": ""}}},
+        ],
+    )
+    # the pages of the other tests would be answered from the cache
+    mocker.patch.object(ChannelMessages, "use_cache", False)
+    stream = ChannelMessages(
+        parent=Channels(authenticator=authenticator, channel_filter=[]),
+        authenticator=authenticator,
+        default_start_date=pendulum.parse("2020-01-01T00:00:00Z"),
+    )
+    wait_for_rate_limit = mocker.patch.object(stream, "_wait_for_rate_limit")
+
+    stream_slice = {"channel": "airbyte-for-beginners", "oldest": 1577836800.0, "latest": 1577923200.0}
+    records = list(stream.read_records(sync_mode=SyncMode.full_refresh, stream_slice=stream_slice))
+
+    assert [record["float_ts"] for record in records] == [1577866844.0001, 1577866845.0001]
+    assert wait_for_rate_limit.call_count == 2
+
+
+def test_threads_checkpoints_are_bounded(authenticator, token_config, mocker):
+    stream = Threads(
+        authenticator=authenticator,
+        default_start_date=pendulum.parse(token_config["start_date"]),
+        lookback_window=token_config["lookback_window"],
+    )
+    mocker.patch.object(Threads, "max_thread_checkpoints", 2)
+
+    state = {}
+    for thread_ts in ("1", "2", "1", "3"):
+        state = stream._checkpoint_thread(state, {"channel": "C1", "ts": thread_ts, "latest_reply": f"{thread_ts}.5"})
+
+    assert state == {"latest_replies": {"C1:1": "1.5", "C1:3": "3.5"}}
+
+
 @pytest.mark.parametrize(
     "current_state, latest_record, expected_state",
     (
@@ -1,31 +1,144 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
-from typing import Any, List, Mapping
+import codecs
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, MutableMapping, Optional
 
 import requests
 
 from airbyte_cdk.sources.declarative.extractors.record_extractor import RecordExtractor
+from airbyte_cdk.sources.declarative.requesters.paginators.strategies.pagination_strategy import PaginationStrategy
+from airbyte_cdk.sources.types import Record
+
+
+class ZendeskSupportStreamingPage:
+    """
+    Decodes a JSON object page incrementally, yielding the items of one of its array fields as soon as each of them is decoded
+    instead of materializing the whole page. The other fields of the page are available in `fields` once the items are read.
+    """
+
+    CHUNK_SIZE = 65_536
+    WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+    def __init__(self, response: requests.Response, items_field: str):
+        self._chunks = codecs.iterdecode(response.iter_content(self.CHUNK_SIZE), "utf-8")
+        self._items_field = items_field
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self.fields: Dict[str, Any] = {}
+
+    def __iter__(self) -> Iterator[Any]:
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._decode_value()
+            self._expect(":")
+            if key == self._items_field and self._peek() == "[":
+                self._position += 1
+                if self._peek() == "]":
+                    self._position += 1
+                else:
+                    while True:
+                        yield self._decode_value()
+                        if self._expect(",", "]") == "]":
+                            break
+            else:
+                self.fields[key] = self._decode_value()
+            if self._expect(",", "}") == "}":
+                return
+
+    def _read_chunk(self) -> bool:
+        for chunk in self._chunks:
+            if chunk:
+                self._buffer = self._buffer[self._position :] + chunk
+                self._position = 0
+                return True
+        return False
+
+    def _peek(self) -> str:
+        """Skips whitespaces and returns the next character without consuming it, or an empty string at the end of the page."""
+        while True:
+            self._position = self.WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_chunk():
+                return ""
+
+    def _expect(self, *characters: str) -> str:
+        character = self._peek()
+        if not character or character not in characters:
+            raise json.JSONDecodeError(f"Expecting one of {characters}", self._buffer, self._position)
+        self._position += 1
+        return character
+
+    def _decode_value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+                # Numbers and literals at the end of the buffer might continue in the next chunk
+                if end < len(self._buffer):
+                    self._position = end
+                    return value
+            except json.JSONDecodeError:
+                pass
+            if not self._read_chunk():
+                value, self._position = self._decoder.raw_decode(self._buffer, self._position)
+                return value
 
 
 class ZendeskSupportExtractorEvents(RecordExtractor):
-    def extract_records(self, response: requests.Response) -> List[Mapping[str, Any]]:
+    def extract_records(self, response: requests.Response) -> Iterable[MutableMapping[str, Any]]:
+        # Incremental ticket events pages can be very large, comments are yielded as their ticket event is decoded
         try:
-            records = response.json().get("ticket_events") or []
-        except requests.exceptions.JSONDecodeError:
-            records = []
+            for record in ZendeskSupportStreamingPage(response, "ticket_events"):
+                for event in record.get("child_events", []):
+                    if event.get("event_type") == "Comment":
+                        for prop in ["via_reference_id", "ticket_id", "timestamp"]:
+                            event[prop] = record.get(prop)
+
+                        # https://github.com/airbytehq/oncall/issues/1001
+                        if not isinstance(event.get("via"), dict):
+                            event["via"] = None
+                        yield event
+        except json.JSONDecodeError:
+            return
+
+
+@dataclass
+class ZendeskSupportTicketEventsPaginationStrategy(PaginationStrategy):
+    """
+    Follows `next_page` until `end_of_stream` like the end of stream paginator, but reads them from the page incrementally
+    instead of decoding the whole page of ticket events again.
+    """
+
+    @property
+    def initial_token(self) -> Optional[Any]:
+        return None
+
+    def next_page_token(
+        self,
+        response: requests.Response,
+        last_page_size: int,
+        last_record: Optional[Record],
+        last_page_token_value: Optional[Any],
+    ) -> Optional[Any]:
+        page = ZendeskSupportStreamingPage(response, "ticket_events")
+        try:
+            for _ in page:
+                pass
+        except json.JSONDecodeError:
+            return None
+        if page.fields.get("end_of_stream"):
+            return None
+        return page.fields.get("next_page") or None
 
-        events = []
-        for record in records:
-            for event in record.get("child_events", []):
-                if event.get("event_type") == "Comment":
-                    for prop in ["via_reference_id", "ticket_id", "timestamp"]:
-                        event[prop] = record.get(prop)
-
-                    # https://github.com/airbytehq/oncall/issues/1001
-                    if not isinstance(event.get("via"), dict):
-                        event["via"] = None
-                    events.append(event)
-        return events
+    def get_page_size(self) -> Optional[int]:
+        return None
 
 
 class ZendeskSupportAttributeDefinitionsExtractor(RecordExtractor):
@@ -1,10 +1,34 @@
 # Copyright (c) 2023 Airbyte, Inc., all rights reserved.
 
-from unittest.mock import MagicMock
+import copy
+import tracemalloc
+from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 
+from .test_data.data import TICKET_EVENTS_STREAM_RESPONSE
+
+
+TICKET_EVENTS_URL = "https://subdomain.zendesk.com/api/v2/incremental/ticket_events.json"
+
+
+def get_response(requests_mock, **kwargs) -> requests.Response:
+    requests_mock.get(TICKET_EVENTS_URL, **kwargs)
+    return requests.get(TICKET_EVENTS_URL)
+
+
+def get_ticket_events_page(ticket_events_count: int) -> dict:
+    page = copy.deepcopy(TICKET_EVENTS_STREAM_RESPONSE)
+    page["ticket_events"] = []
+    for i in range(ticket_events_count):
+        ticket_event = copy.deepcopy(TICKET_EVENTS_STREAM_RESPONSE["ticket_events"][0])
+        ticket_event["id"] = ticket_event["child_events"][0]["id"] = i
+        ticket_event["child_events"][0]["body"] = f"comment {i} ✓ " + "x" * 500
+        ticket_event["child_events"].append({"id": -i, "event_type": "Change", "field_name": "status", "value": "open"})
+        page["ticket_events"].append(ticket_event)
+    return page
+
 
 @pytest.mark.parametrize(
     "response_data, expected_events",
@@ -53,16 +77,12 @@ import requests
         ),
     ],
 )
-def test_extraсtor_events(response_data, expected_events, components_module):
+def test_extraсtor_events(requests_mock, response_data, expected_events, components_module):
     # Create an instance of the extractor
     extractor = components_module.ZendeskSupportExtractorEvents()
 
-    # Mock the response from requests
-    response = MagicMock(spec=requests.Response)
-    response.json.return_value = response_data
-
     # Invoke the extract_records method
-    events = extractor.extract_records(response)
+    events = list(extractor.extract_records(get_response(requests_mock, json=response_data)))
 
     # Assert that the returned events match the expected events
     assert events == expected_events, f"Expected events to be {expected_events}, but got {events}"
@@ -102,3 +122,51 @@ def test_attribute_definitions_extractor(response_data, expected_records, compon
 
     # Assert that the returned records match the expected records
     assert records == expected_records, f"Expected records to be {expected_records}, but got {records}"
+
+
+@pytest.mark.parametrize("chunk_size", [65_536, 7])
+def test_extractor_events_streams_recorded_page(requests_mock, components_module, chunk_size):
+    page = get_ticket_events_page(50)
+    expected_events = [
+        {**ticket_event["child_events"][0], "via_reference_id": None, "ticket_id": 3, "timestamp": 1647532987}
+        for ticket_event in page["ticket_events"]
+    ]
+
+    with patch.object(components_module.ZendeskSupportStreamingPage, "CHUNK_SIZE", chunk_size):
+        events = list(components_module.ZendeskSupportExtractorEvents().extract_records(get_response(requests_mock, json=page)))
+
+    assert events == expected_events
+
+
+def test_extractor_events_streaming_lowers_peak_memory(requests_mock, components_module):
+    response = get_response(requests_mock, json=get_ticket_events_page(2000))
+    extractor = components_module.ZendeskSupportExtractorEvents()
+
+    tracemalloc.start()
+    try:
+        response.json()
+        _, whole_page_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for _ in extractor.extract_records(response):
+            pass
+        _, streaming_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert streaming_peak < whole_page_peak / 10
+
+
+@pytest.mark.parametrize(
+    "response_kwargs, expected_token",
+    [
+        ({"json": TICKET_EVENTS_STREAM_RESPONSE}, TICKET_EVENTS_STREAM_RESPONSE["next_page"]),
+        ({"json": {**TICKET_EVENTS_STREAM_RESPONSE, "end_of_stream": True}}, None),
+        ({"json": {"end_of_stream": False, "next_page": "https://next", "ticket_events": []}}, "https://next"),
+        ({"text": "not json"}, None),
+    ],
+)
+def test_ticket_events_pagination_strategy(requests_mock, components_module, response_kwargs, expected_token):
+    strategy = components_module.ZendeskSupportTicketEventsPaginationStrategy()
+    response = get_response(requests_mock, **response_kwargs)
+
+    assert strategy.next_page_token(response, 1, None, None) == expected_token